@@ -0,0 +1,198 @@
+# %%
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from typing import List, Tuple
+
+# benchmarks are executed from the repository root: python benchmarks/benchmark_data_analyzer.py
+current_directory = os.path.dirname(os.path.abspath(__file__))
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+sys.path.insert(0, flight_analyzer_directory)
+
+import src.constants as constants
+import src.helpers.data_analyzer as dataanalyzer
+import src.helpers.file_processor as fileprocessor
+import src.algorithms.angle_analyzer as angleanalyzer
+
+DATASET_DIRECTORY: str = (
+    f"{flight_analyzer_directory}/docs/datasets/empiric-study/2_csv/"
+)
+
+
+def process_data_iterative(
+    data: pd.DataFrame,
+    AngleAnalyzer: angleanalyzer.AngleAnalyzer,
+    angle_past_threshold: int = constants.ANGLE_PAST_THRESHOLD,
+    angle_future_threshold: int = constants.ANGLE_FUTURE_THRESHOLD,
+) -> pd.DataFrame:
+    """
+    Reference implementation of DataAnalyzer.process_data that applies the AngleAnalyzer to one index after another.
+
+    Parameters:
+    - data (pd.DataFrame): The dataset to be analyzed.
+    - AngleAnalyzer (angleanalyzer.AngleAnalyzer): The AngleAnalyzer object.
+    - angle_past_threshold (int): The number of past coordinates to be considered.
+    - angle_future_threshold (int): The number of future coordinates to be considered.
+
+    Returns:
+    - pd.DataFrame: The status, position_int and averaged regression values per index.
+    """
+    rows: List[Tuple[int, bool, int, float, float, float]] = []
+
+    for i in range(angle_past_threshold, len(data) - angle_future_threshold):
+        latest_coordinates = AngleAnalyzer.extract_latest_coordinates(
+            df=data, i=i, angle_past_threshold=angle_past_threshold
+        )
+        future_coordinates = AngleAnalyzer.extract_future_coordinates(
+            df=data, i=i, angle_future_threshold=angle_future_threshold
+        )
+        status_angle_past = AngleAnalyzer.analyze_angles(
+            angles=AngleAnalyzer.cut_zero_angles(
+                df=AngleAnalyzer.calculate_angles(df=latest_coordinates)
+            )
+        )
+        status_angle_future = AngleAnalyzer.analyze_angles(
+            angles=AngleAnalyzer.cut_zero_angles(
+                df=AngleAnalyzer.calculate_angles(df=future_coordinates)
+            )
+        )
+        regression_past = AngleAnalyzer.analyze_linear_regression(df=latest_coordinates)
+        regression_future = AngleAnalyzer.analyze_linear_regression(
+            df=future_coordinates
+        )
+        status = AngleAnalyzer.analyze_data(
+            status_angle_past=status_angle_past,
+            status_regression_past=regression_past[0],
+            status_angle_future=status_angle_future,
+            status_regression_future=regression_future[0],
+        )
+        rows.append(
+            (
+                i,
+                status[0],
+                status[2],
+                (regression_past[3] + regression_future[3]) / 2,
+                (regression_past[4] + regression_future[4]) / 2,
+                (regression_past[5] + regression_future[5]) / 2,
+            )
+        )
+
+    return pd.DataFrame(
+        rows,
+        columns=[
+            "index",
+            "status",
+            "position_int",
+            "average_r_value",
+            "average_p_value",
+            "average_std_err",
+        ],
+    ).set_index("index")
+
+
+def compare_results(expected: pd.DataFrame, result: pd.DataFrame) -> Tuple[int, float]:
+    """
+    Compare the vectorized results to the reference implementation.
+
+    Parameters:
+    - expected (pd.DataFrame): The results of the reference implementation.
+    - result (pd.DataFrame): The results of DataAnalyzer.process_data.
+
+    Returns:
+    - Tuple[int, float]: The number of differing classifications and the largest absolute deviation of the averaged regression values.
+    """
+    mismatches: int = int(
+        (expected["position_int"].to_numpy() != result["position_int"].to_numpy()).sum()
+        + (expected["status"].to_numpy() != result["status"].to_numpy()).sum()
+    )
+    deviation: float = 0.0
+    for column in ["average_r_value", "average_p_value", "average_std_err"]:
+        if len(expected) > 0:
+            deviation = max(
+                deviation,
+                float(
+                    np.max(
+                        np.abs(
+                            expected[column].to_numpy(dtype=np.float64)
+                            - result[column].to_numpy(dtype=np.float64)
+                        )
+                    )
+                ),
+            )
+    return mismatches, deviation
+
+
+def main() -> None:
+    """
+    Run the benchmark on the empiric-study flights and print the runtimes of both implementations.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - None.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--directory", default=DATASET_DIRECTORY)
+    parser.add_argument("--limit", type=int, default=None, help="number of flights")
+    parser.add_argument(
+        "--rolling-regression",
+        action="store_true",
+        help="derive the linear regressions from running sums",
+    )
+    parser.add_argument(
+        "--skip-reference",
+        action="store_true",
+        help="only time the vectorized implementation",
+    )
+    arguments = parser.parse_args()
+
+    file_paths: List[str] = fileprocessor.FileProcessor().get_file_paths(
+        arguments.directory, ".csv"
+    )[: arguments.limit]
+    total_reference: float = 0.0
+    total_vectorized: float = 0.0
+
+    print(f"Benchmarking DataAnalyzer.process_data on {len(file_paths)} flights:")
+
+    for file_path in file_paths:
+        DataAnalyzer = dataanalyzer.DataAnalyzer(csv_file_in=file_path)
+        data: pd.DataFrame = DataAnalyzer.read_csv_data()
+        AngleAnalyzer = DataAnalyzer.construct_angle_analyzer(
+            rolling_regression=arguments.rolling_regression
+        )
+
+        start: float = time.perf_counter()
+        result: pd.DataFrame = DataAnalyzer.process_data(
+            data=data, AngleAnalyzer=AngleAnalyzer
+        )
+        duration_vectorized: float = time.perf_counter() - start
+        total_vectorized += duration_vectorized
+        line: str = (
+            f"--> {os.path.basename(file_path)} ({len(data)} rows): vectorized {duration_vectorized:.3f} s"
+        )
+
+        if not arguments.skip_reference:
+            start = time.perf_counter()
+            expected: pd.DataFrame = process_data_iterative(
+                data=data, AngleAnalyzer=AngleAnalyzer
+            )
+            duration_reference: float = time.perf_counter() - start
+            total_reference += duration_reference
+            mismatches, deviation = compare_results(expected, result)
+            line += f", per-index {duration_reference:.3f} s, mismatches {mismatches}, max deviation {deviation:.2e}"
+
+        print(line)
+
+    print(f"----> Total vectorized: {total_vectorized:.3f} s")
+    if not arguments.skip_reference:
+        print(f"----> Total per-index: {total_reference:.3f} s")
+        print(f"----> Speedup: {total_reference / total_vectorized:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
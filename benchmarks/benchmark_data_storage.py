@@ -0,0 +1,86 @@
+# %%
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+from typing import Dict, List
+
+# benchmarks are executed from the repository root: python benchmarks/benchmark_data_storage.py
+current_directory = os.path.dirname(os.path.abspath(__file__))
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+sys.path.insert(0, flight_analyzer_directory)
+
+import src.helpers.data_storage as datastorage
+import src.helpers.file_processor as fileprocessor
+
+DATASET_DIRECTORY: str = (
+    f"{flight_analyzer_directory}/docs/datasets/empiric-study/2_csv/"
+)
+FORMATS: List[str] = ["csv", "feather", "parquet"]
+
+
+def main() -> None:
+    """
+    Convert the empiric-study csv files to every format and print the load times and file sizes per format.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - None.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--directory", default=DATASET_DIRECTORY)
+    parser.add_argument("--limit", type=int, default=None, help="number of flights")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="number of loads per format"
+    )
+    parser.add_argument(
+        "--copies",
+        type=int,
+        default=1,
+        help="number of concatenated copies of every flight, to emulate larger batches",
+    )
+    arguments = parser.parse_args()
+
+    file_paths: List[str] = fileprocessor.FileProcessor().get_file_paths(
+        arguments.directory, ".csv"
+    )[: arguments.limit]
+    Storage: datastorage.DataStorage = datastorage.DataStorage()
+    durations: Dict[str, float] = {file_format: 0.0 for file_format in FORMATS}
+    sizes: Dict[str, int] = {file_format: 0 for file_format in FORMATS}
+
+    print(f"Benchmarking DataStorage.read on {len(file_paths)} flights:")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for file_path in file_paths:
+            data: pd.DataFrame = pd.read_csv(file_path)
+            data = pd.concat([data] * arguments.copies, ignore_index=True)
+            name: str = os.path.splitext(os.path.basename(file_path))[0]
+
+            for file_format in FORMATS:
+                path: str = Storage.replace_extension(
+                    os.path.join(directory, name), file_format
+                )
+                Storage.write(data, path)
+                sizes[file_format] += os.path.getsize(path)
+
+                duration: float = np.inf
+                for _ in range(arguments.repeat):
+                    start: float = time.perf_counter()
+                    Storage.read(path)
+                    duration = min(duration, time.perf_counter() - start)
+                durations[file_format] += duration
+
+    for file_format in FORMATS:
+        print(
+            f"--> {file_format}: {durations[file_format]:.3f} s, {sizes[file_format] / 1024**2:.1f} MB, speedup {durations['csv'] / durations[file_format]:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
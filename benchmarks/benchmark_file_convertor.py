@@ -0,0 +1,182 @@
+# %%
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+import numpy as np
+import pandas as pd
+from typing import List
+
+# benchmarks are executed from the repository root: python benchmarks/benchmark_file_convertor.py
+current_directory = os.path.dirname(os.path.abspath(__file__))
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+sys.path.insert(0, flight_analyzer_directory)
+
+import src.helpers.file_convertor as fileconvertor
+
+INPUT_FILE: str = (
+    f"{flight_analyzer_directory}/tests/assets/file_converter/test_file_convertor.xlsx"
+)
+CUSTOM_HEADERS: List[str] = [
+    "timestamp [UTC]",
+    "relative altitude [m]",
+    "horizontal velocity [m/s]",
+    "vertical velocity [m/s]",
+    "distance to takeoff [km]",
+    "longitude",
+    "latitude",
+]
+
+
+def process_csv_rowwise(Converter: fileconvertor.FileConverter) -> None:
+    """
+    Reference implementation of FileConverter.process_csv that extracts the coordinates of the WKT column row by row and cleans up the units and coordinates in separate steps.
+
+    Parameters:
+    - Converter (fileconvertor.FileConverter): The FileConverter object.
+
+    Returns:
+    - None.
+    """
+    df: pd.DataFrame = Converter.read_input_file()
+    df = Converter.filter_dataframe(df)
+    df = Converter.split_and_reorder_columns(df)
+    df["WKT"] = df["WKT"].astype(str)
+    coordinates_raw: pd.DataFrame = df.apply(Converter.extract_coordinates_raw, axis=1)
+    df = pd.concat([df, coordinates_raw], axis=1)
+    df = df.drop(["WKT", "coordinates_b"], axis=1)
+    df = Converter.extract_coordinates_a(df)
+    df = Converter.remove_units(df)
+    df = Converter.remove_static_speeds(df)
+    df = Converter.convert_horizontal_speed(df)
+    df = Converter.clean_up_coordinates(df)
+    Converter.export_to_csv(df, CUSTOM_HEADERS)
+
+
+def generate_input(path: str, rows: int) -> None:
+    """
+    Write an artificial KML-derived csv file with varying speeds and coordinates.
+
+    Parameters:
+    - path (str): The path to the csv file.
+    - rows (int): The number of points, every point is written once as clampToGround and once as absolute.
+
+    Returns:
+    - None.
+    """
+    rng: np.random.Generator = np.random.default_rng(0)
+    seconds: np.ndarray = np.arange(rows)
+    timestamps: pd.Series = pd.Series(
+        pd.to_datetime(seconds, unit="s").strftime("%H:%M:%S")
+    )
+    name: pd.Series = (
+        timestamps
+        + " "
+        + pd.Series(rng.integers(0, 3000, rows)).astype(str)
+        + "m "
+        + pd.Series(rng.integers(0, 60, rows)).astype(str)
+        + "kmh "
+        + pd.Series(rng.normal(0, 2, rows).round(1)).astype(str)
+        + "m/s "
+        + pd.Series(rng.uniform(0, 50, rows).round(1)).astype(str)
+        + "km"
+    )
+    longitude: pd.Series = pd.Series((9 + seconds * 1e-5).round(6)).astype(str)
+    latitude: pd.Series = pd.Series((47 + seconds * 1e-5).round(6)).astype(str)
+    wkt: pd.Series = (
+        "LINESTRING Z ("
+        + longitude
+        + " "
+        + latitude
+        + " 2289, "
+        + longitude
+        + " "
+        + latitude
+        + " 2289)"
+    )
+    data: pd.DataFrame = pd.DataFrame(
+        {
+            "name": np.repeat(name, 2),
+            "description": np.nan,
+            "altitudeMode": np.tile(["clampToGround", "absolute"], rows),
+            "visibility": np.nan,
+            "tessellate": True,
+            "WKT": np.repeat(wkt, 2),
+        }
+    )
+    data.to_csv(path, index=False)
+
+
+def measure(Converter: fileconvertor.FileConverter, chunksize: int = None) -> tuple:
+    """
+    Convert a file with FileConverter.process_csv and measure the duration and the peak of the traced memory.
+
+    Parameters:
+    - Converter (fileconvertor.FileConverter): The FileConverter object.
+    - chunksize (int): The number of rows per chunk, None to read the whole file at once.
+
+    Returns:
+    - tuple: The duration in seconds and the peak memory in bytes.
+    """
+    start: float = time.perf_counter()
+    Converter.process_csv(chunksize=chunksize)
+    duration: float = time.perf_counter() - start
+
+    # tracing slows down the conversion, so the memory is measured in a second run
+    tracemalloc.start()
+    Converter.process_csv(chunksize=chunksize)
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return duration, peak
+
+
+def main() -> None:
+    """
+    Convert an artificial KML-derived csv file with the row-wise reference and FileConverter.process_csv with and without chunks and print the durations and memory peaks.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - None.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000, help="number of points")
+    parser.add_argument(
+        "--chunksize", type=int, default=10000, help="number of rows per chunk"
+    )
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        input_file: str = os.path.join(directory, "input.csv")
+        generate_input(input_file, arguments.rows)
+        output_rowwise: str = os.path.join(directory, "output_rowwise.csv")
+        output: str = os.path.join(directory, "output.csv")
+
+        start: float = time.perf_counter()
+        process_csv_rowwise(fileconvertor.FileConverter(input_file, output_rowwise))
+        duration_rowwise: float = time.perf_counter() - start
+
+        duration, peak = measure(fileconvertor.FileConverter(input_file, output))
+        pd.testing.assert_frame_equal(pd.read_csv(output_rowwise), pd.read_csv(output))
+
+        duration_chunked, peak_chunked = measure(
+            fileconvertor.FileConverter(input_file, output), arguments.chunksize
+        )
+        pd.testing.assert_frame_equal(pd.read_csv(output_rowwise), pd.read_csv(output))
+
+    print(f"Benchmarking FileConverter.process_csv on {arguments.rows} points:")
+    print(f"--> row-wise: {duration_rowwise:.3f} s")
+    print(
+        f"--> vectorized: {duration:.3f} s, speedup {duration_rowwise / duration:.1f}x, peak memory {peak / 1024**2:.1f} MB"
+    )
+    print(
+        f"--> chunked ({arguments.chunksize} rows): {duration_chunked:.3f} s, peak memory {peak_chunked / 1024**2:.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+# %%
+
+import os
+import sys
+import copy
+import time
+import argparse
+import datetime
+import numpy as np
+from typing import Any, Dict, List
+
+# benchmarks are executed from the repository root: python benchmarks/benchmark_igc2csv.py
+current_directory = os.path.dirname(os.path.abspath(__file__))
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+sys.path.insert(0, flight_analyzer_directory)
+
+import src.helpers.file_processor as fileprocessor
+import src.packages.IGC2CSV as igc2csv
+
+DATASET_DIRECTORY: str = (
+    f"{flight_analyzer_directory}/docs/datasets/empiric-study/1_raw/"
+)
+FIELDS: List[str] = [
+    "latdegrees",
+    "londegrees",
+    "datetime",
+    "running_time",
+    "time_delta",
+    "distance_delta",
+    "distance_total",
+    "distance_from_start",
+    "groundspeed",
+    "groundspeed_peak",
+    "alt_gps_delta",
+    "alt_pressure_delta",
+    "climb_speed",
+    "climb_total",
+]
+
+
+def crunch_flight_iterative(
+    self: igc2csv.IGC2CSV, flight: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Reference implementation of IGC2CSV.crunch_flight that calculates the fields of one record after another.
+
+    Parameters:
+    - self: The IGC2CSV object providing the scalar conversion and distance methods.
+    - flight: The flight dictionary to be updated with calculated data.
+
+    Returns:
+    - flight: The updated flight dictionary.
+    """
+    for index, record in enumerate(flight["fixrecords"]):
+        # thisdatetime = datetime.datetime.strptime(record['timestamp'], '')
+        record["latdegrees"] = self.lat_to_degrees(record["latitude"])
+        record["londegrees"] = self.lon_to_degrees(record["longitude"])
+
+        record["time"] = datetime.time(
+            int(record["timestamp"][0:2]),
+            int(record["timestamp"][2:4]),
+            int(record["timestamp"][4:6]),
+            0,
+        )
+
+        if index > 0:
+            prevrecord = flight["fixrecords"][index - 1]
+
+            if record["time"] < prevrecord["time"]:
+                record["date"] = prevrecord["date"] + datetime.timedelta(days=1)
+            else:
+                record["date"] = prevrecord["date"]
+
+            record["datetime"] = datetime.datetime.combine(
+                record["date"], record["time"]
+            )
+            record["time_delta"] = (
+                record["datetime"] - prevrecord["datetime"]
+            ).total_seconds()
+            record["running_time"] = (
+                record["datetime"] - flight["datetime_start"]
+            ).total_seconds()
+            record["distance_delta"] = self.haversine(
+                record["londegrees"],
+                record["latdegrees"],
+                prevrecord["londegrees"],
+                prevrecord["latdegrees"],
+            )
+            flight["distance_total"] += record["distance_delta"]
+            record["distance_total"] = flight["distance_total"]
+            record["distance_from_start"] = self.straight_line_distance(
+                record["londegrees"],
+                record["latdegrees"],
+                record["alt-GPS"],
+                flight["fixrecords"][0]["londegrees"],
+                flight["fixrecords"][0]["latdegrees"],
+                flight["fixrecords"][0]["alt-GPS"],
+            )
+            record["groundspeed"] = (
+                record["distance_delta"] / record["time_delta"] * 3600
+            )
+            flight["groundspeed_peak"] = max(
+                record["groundspeed"], flight["groundspeed_peak"]
+            )
+            record["groundspeed_peak"] = flight["groundspeed_peak"]
+            record["alt_gps_delta"] = record["alt-GPS"] - prevrecord["alt-GPS"]
+            record["alt_pressure_delta"] = record["pressure"] - prevrecord["pressure"]
+            record["climb_speed"] = record["alt_gps_delta"] / record["time_delta"]
+            flight["climb_total"] += max(0, record["alt_gps_delta"])
+            record["climb_total"] = flight["climb_total"]
+            flight["alt_peak"] = max(record["alt-GPS"], flight["alt_peak"])
+            flight["alt_floor"] = min(record["alt-GPS"], flight["alt_floor"])
+            if "TAS" in flight["optional_records"]:
+                flight["tas_peak"] = max(record["opt_tas"], flight["tas_peak"])
+                record["tas_peak"] = flight["tas_peak"]
+        else:
+            flight["time_start"] = record["time"]
+            flight["datetime_start"] = datetime.datetime.combine(
+                flight["flightdate"], flight["time_start"]
+            )
+            flight["altitude_start"] = record["alt-GPS"]
+            flight["distance_total"] = 0
+            flight["climb_total"] = 0
+            flight["alt_peak"] = record["alt-GPS"]
+            flight["alt_floor"] = record["alt-GPS"]
+            flight["groundspeed_peak"] = 0
+
+            record["date"] = flight["flightdate"]
+            record["datetime"] = datetime.datetime.combine(
+                record["date"], record["time"]
+            )
+            record["running_time"] = 0
+            record["time_delta"] = 0
+            record["distance_delta"] = 0
+            record["distance_total"] = 0
+            record["groundspeed"] = 0
+            record["groundspeed_peak"] = 0
+            record["alt_gps_delta"] = 0
+            record["alt_pressure_delta"] = 0
+            record["climb_speed"] = 0
+            record["climb_total"] = 0
+            record["distance_from_start"] = 0
+
+            if "TAS" in flight["optional_records"]:
+                flight["tas_peak"] = record["opt_tas"]
+                record["tas_peak"] = 0
+
+    return flight
+
+
+def compare_flights(expected: Dict[str, Any], result: Dict[str, Any]) -> float:
+    """
+    Compare the fields of the vectorized crunch_flight to the reference implementation.
+
+    Parameters:
+    - expected (Dict[str, Any]): The flight crunched by the reference implementation.
+    - result (Dict[str, Any]): The flight crunched by IGC2CSV.crunch_flight.
+
+    Returns:
+    - float: The largest relative deviation of the numeric fields, inf if a datetime differs.
+    """
+    deviation: float = 0.0
+    for field in FIELDS:
+        values_expected = [record[field] for record in expected["fixrecords"]]
+        values_result = [record[field] for record in result["fixrecords"]]
+        if field == "datetime":
+            if values_expected != values_result:
+                return np.inf
+            continue
+        values_expected = np.asarray(values_expected, dtype=np.float64)
+        values_result = np.asarray(values_result, dtype=np.float64)
+        deviation = max(
+            deviation,
+            float(
+                np.max(
+                    np.abs(values_expected - values_result)
+                    / np.maximum(np.abs(values_expected), 1e-12),
+                    initial=0.0,
+                )
+            ),
+        )
+    return deviation
+
+
+def main() -> None:
+    """
+    Run the benchmark on the empiric-study IGC files and print the runtimes of both implementations.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - None.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--directory", default=DATASET_DIRECTORY)
+    parser.add_argument("--limit", type=int, default=None, help="number of flights")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="number of runs per implementation"
+    )
+    arguments = parser.parse_args()
+
+    file_paths: List[str] = fileprocessor.FileProcessor().get_file_paths(
+        arguments.directory, ".igc"
+    )[: arguments.limit]
+    convertor: igc2csv.IGC2CSV = igc2csv.IGC2CSV()
+    total_reference: float = 0.0
+    total_vectorized: float = 0.0
+
+    print(f"Benchmarking IGC2CSV.crunch_flight on {len(file_paths)} flights:")
+
+    for file_path in file_paths:
+        flight: Dict[str, Any] = convertor.parse_igc({"igcfile": file_path})
+
+        duration_reference: float = np.inf
+        duration_vectorized: float = np.inf
+        for _ in range(arguments.repeat):
+            expected: Dict[str, Any] = copy.deepcopy(flight)
+            start: float = time.perf_counter()
+            crunch_flight_iterative(convertor, expected)
+            duration_reference = min(duration_reference, time.perf_counter() - start)
+
+            result: Dict[str, Any] = copy.deepcopy(flight)
+            start = time.perf_counter()
+            convertor.crunch_flight(result)
+            duration_vectorized = min(duration_vectorized, time.perf_counter() - start)
+
+        total_reference += duration_reference
+        total_vectorized += duration_vectorized
+        print(
+            f"--> {os.path.basename(file_path)} ({len(flight['fixrecords'])} records): vectorized {duration_vectorized:.4f} s, per-record {duration_reference:.4f} s, max relative deviation {compare_flights(expected, result):.2e}"
+        )
+
+    print(f"----> Total vectorized: {total_vectorized:.3f} s")
+    print(f"----> Total per-record: {total_reference:.3f} s")
+    print(f"----> Speedup: {total_reference / total_vectorized:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# %%
+
+import os
+import sys
+import argparse
+import subprocess
+from typing import Dict, List, Tuple
+
+# benchmarks are executed from the repository root: python benchmarks/benchmark_import_time.py
+current_directory = os.path.dirname(os.path.abspath(__file__))
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+
+MODULES: List[str] = [
+    "src.algorithms.speed_analyzer",
+    "src.algorithms.c_values_analyzer",
+    "src.algorithms.pressure_analyzer",
+    "src.helpers.data_visualizer",
+    "src.helpers.deviation_metrics",
+    "src.helpers.optimize_thresholds",
+    "src.helpers.file_convertor",
+]
+BASELINE: List[str] = [
+    "numpy",
+    "pandas",
+]  # dependencies of every module, imported before the module is timed
+HEAVY_MODULES: List[str] = [
+    "scipy",
+    "matplotlib",
+    "numba",
+]  # must only be imported on first use
+
+
+def import_time(
+    module: str, preload: List[str] = None
+) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Import a module in a new interpreter with python -X importtime.
+
+    Parameters:
+    - module (str): The module, e.g. src.algorithms.speed_analyzer.
+    - preload (List[str]): The modules that are imported before the module, their import time is not part of the import time of the module.
+
+    Returns:
+    - Tuple[Dict[str, int], Dict[str, int]]: The self and the cumulative import time of every imported module [us].
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "".join(f"import {name}; " for name in preload or []) + f"import {module}",
+        ],
+        cwd=flight_analyzer_directory,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    self_times: Dict[str, int] = {}
+    cumulative_times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, cumulative_time, name = line[len("import time:") :].split("|")
+        self_times[name.strip()] = int(self_time)
+        cumulative_times[name.strip()] = int(cumulative_time)
+    return self_times, cumulative_times
+
+
+def overhead(module: str) -> Tuple[float, List[str]]:
+    """
+    Calculate the import time of a module without the import time of the baseline and find the heavy modules that are imported with it.
+
+    Parameters:
+    - module (str): The module.
+
+    Returns:
+    - Tuple[float, List[str]]: The import time without the baseline [s] and the heavy modules.
+    """
+    _, cumulative_times = import_time(module, preload=BASELINE)
+    heavy: List[str] = sorted(
+        {
+            name.split(".")[0]
+            for name in cumulative_times
+            if name.split(".")[0] in HEAVY_MODULES
+        }
+    )
+    return cumulative_times[module] / 1e6, heavy
+
+
+def main() -> None:
+    """
+    Print the import time of every module (best of several runs) and the heavy modules that are imported with it.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - None.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="number of imports")
+    arguments = parser.parse_args()
+
+    baselines: List[Dict[str, int]] = [
+        import_time(BASELINE[-1], preload=BASELINE[:-1])[1]
+        for _ in range(arguments.repeat)
+    ]
+    baseline: float = min(
+        sum(cumulative_times[name] for name in BASELINE) / 1e6
+        for cumulative_times in baselines
+    )
+    print(
+        f"Benchmarking the import time, {' + '.join(BASELINE)}: {baseline * 1000:.0f} ms"
+    )
+    for module in MODULES:
+        results = [overhead(module) for _ in range(arguments.repeat)]
+        duration: float = min(duration for duration, _ in results)
+        heavy: List[str] = results[0][1]
+        print(
+            f"--> {module}: {duration * 1000:.0f} ms, heavy modules: {', '.join(heavy) or 'none'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
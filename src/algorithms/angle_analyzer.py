@@ -1,17 +1,17 @@
 # %%
 
-import os
-import sys
 import math
+import numpy as np
 import pandas as pd
 from typing import List, Tuple
-from scipy.stats import linregress
+from numpy.lib.stride_tricks import sliding_window_view
 
-# AI content (GitHub Copilot, 01/29/2024), verified and adapted by Nicolas Huber.
-src_directory: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
-sys.path.append(src_directory)
+from .. import constants
+from ..helpers import data_storage as datastorage
+from ..helpers import lazy_module as lazymodule
 
-import constants as constants
+special = lazymodule.LazyModule("scipy.special")
+stats = lazymodule.LazyModule("scipy.stats")
 
 
 class AngleAnalyzer:
@@ -31,16 +31,18 @@ class AngleAnalyzer:
         future_threshold: int,
         angle_threshold: int,
         linear_regression_threshold: float,
+        rolling_regression: bool = False,
     ) -> None:
         """
         Initializes the AngleAnalyzer class.
 
         Parameters:
-        - csv_file: the path to the CSV file to be analyzed
+        - csv_file: the path to the CSV file to be analyzed, None if the coordinates are passed in memory (e.g. to analyze_window_angles)
         - latest_threshold: the number of coordinates to be analyzed in the past
         - future_threshold: the number of coordinates to be analyzed in the future
         - angle_threshold: the threshold for the angle analysis
         - linear_regression_threshold: the threshold for the linear regression analysis
+        - rolling_regression: whether the linear regressions of all windows are derived from running sums (O(1) per window) instead of the coordinates of every window
 
         Returns:
         - None
@@ -50,18 +52,19 @@ class AngleAnalyzer:
         self.future_threshold: int = future_threshold
         self.angle_threshold: int = angle_threshold
         self.linear_regression_threshold: float = linear_regression_threshold
+        self.rolling_regression: bool = rolling_regression
 
-    def read_csv_file(self) -> pd.DataFrame:
+    def read_csv_file(self, file_format: str = None) -> pd.DataFrame:
         """
         Reads the CSV file and returns a Pandas DataFrame.
 
         Parameters:
-        - None
+        - file_format: the format of the file (csv, feather or parquet), None to detect it from the extension
 
         Returns:
         - A Pandas DataFrame
         """
-        return pd.read_csv(self.csv_file)
+        return datastorage.DataStorage().read(self.csv_file, file_format=file_format)
 
     def extract_latest_coordinates(
         self,
@@ -213,7 +216,7 @@ class AngleAnalyzer:
         - tuple containing the status of the analysis, the slope, the intercept, the r-value, the p-value and the standard error
         """
         try:
-            slope, intercept, r_value, p_value, std_err = linregress(
+            slope, intercept, r_value, p_value, std_err = stats.linregress(
                 df["longitude"], df["latitude"]
             )
             if abs(r_value) > self.linear_regression_threshold:
@@ -265,5 +268,352 @@ class AngleAnalyzer:
         else:
             return constants.INDEX_CURVE
 
+    def calculate_window_angles(
+        self, longitude: np.ndarray, latitude: np.ndarray, window: int
+    ) -> np.ndarray:
+        """
+        Calculates the average angle of every window of consecutive coordinates at once. For each window the result equals the average that analyze_angles computes after calculate_angles and cut_zero_angles have been applied to the same coordinates.
+
+        Parameters:
+        - longitude: the longitudes of the flight
+        - latitude: the latitudes of the flight
+        - window: the number of coordinates per window
+
+        Returns:
+        - An array containing the average angle of the window starting at every index
+        """
+        longitude = np.asarray(longitude, dtype=np.float64)
+        latitude = np.asarray(latitude, dtype=np.float64)
+        starts: int = max(len(longitude) - window + 1, 0)
+        averages: np.ndarray = np.zeros(starts)
+
+        if starts == 0 or window < 5:
+            return averages
+
+        windows_x: np.ndarray = sliding_window_view(longitude, window)
+        windows_y: np.ndarray = sliding_window_view(latitude, window)
+
+        for start in range(0, starts, constants.WINDOW_CHUNK_SIZE):
+            stop: int = min(start + constants.WINDOW_CHUNK_SIZE, starts)
+            px_1, py_1 = windows_x[start:stop, 0:1], windows_y[start:stop, 0:1]
+            px_2, py_2 = windows_x[start:stop, 1:2], windows_y[start:stop, 1:2]
+            px_3 = windows_x[start:stop, 2 : window - 2]
+            py_3 = windows_y[start:stop, 2 : window - 2]
+
+            # division by zero is mapped to an angle of 0, just like the ZeroDivisionError handling in calculate_angles
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                m_1 = np.where(px_2 != px_1, (py_2 - py_1) / (px_2 - px_1), 0)
+                m_2 = (py_1 - py_3) / (px_1 - px_3)
+                denominator = 1 + m_1 * m_2
+                angles = np.abs(np.degrees(np.arctan((m_1 - m_2) / denominator)))
+            angles[(px_1 == px_3) | (denominator == 0)] = 0
+
+            counts: np.ndarray = np.count_nonzero(angles, axis=1)
+            sums: np.ndarray = angles.sum(axis=1)
+            averages[start:stop] = np.divide(
+                sums, counts, out=np.zeros_like(sums), where=counts > 0
+            )
+
+        return averages
+
+    def analyze_window_angles(
+        self, longitude: np.ndarray, latitude: np.ndarray, window: int
+    ) -> np.ndarray:
+        """
+        Analyzes every window of consecutive coordinates at once to determine whether it lies on a straight line or not, based on angle.
+
+        Parameters:
+        - longitude: the longitudes of the flight
+        - latitude: the latitudes of the flight
+        - window: the number of coordinates per window
+
+        Returns:
+        - An array containing True for every window on a straight line, False otherwise
+        """
+        averages: np.ndarray = self.calculate_window_angles(
+            longitude=longitude, latitude=latitude, window=window
+        )
+        return np.abs(averages) < self.angle_threshold
+
+    def analyze_window_linear_regressions(
+        self, longitude: np.ndarray, latitude: np.ndarray, window: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Analyzes every window of consecutive coordinates at once to determine whether it lies on a straight line or not, based on linear regression. For each window the result equals the result of analyze_linear_regression.
+
+        Parameters:
+        - longitude: the longitudes of the flight
+        - latitude: the latitudes of the flight
+        - window: the number of coordinates per window
+
+        Returns:
+        - tuple containing arrays of the status of the analysis, the slope, the intercept, the r-value, the p-value and the standard error of the window starting at every index
+        """
+        longitude = np.asarray(longitude, dtype=np.float64)
+        latitude = np.asarray(latitude, dtype=np.float64)
+        starts: int = max(len(longitude) - window + 1, 0)
+        x_mean, y_mean = np.zeros(starts), np.zeros(starts)
+        ssxm, ssym, ssxym = np.zeros(starts), np.zeros(starts), np.zeros(starts)
+        x_identical = np.zeros(starts, dtype=bool)
+        y_identical = np.zeros(starts, dtype=bool)
+
+        if starts > 0:
+            windows_x: np.ndarray = sliding_window_view(longitude, window)
+            windows_y: np.ndarray = sliding_window_view(latitude, window)
+
+            for start in range(0, starts, constants.WINDOW_CHUNK_SIZE):
+                stop: int = min(start + constants.WINDOW_CHUNK_SIZE, starts)
+                x, y = windows_x[start:stop], windows_y[start:stop]
+                x_mean[start:stop] = x.mean(axis=1)
+                y_mean[start:stop] = y.mean(axis=1)
+                dx = x - x_mean[start:stop, np.newaxis]
+                dy = y - y_mean[start:stop, np.newaxis]
+                ssxm[start:stop] = np.einsum("ij,ij->i", dx, dx) / window
+                ssym[start:stop] = np.einsum("ij,ij->i", dy, dy) / window
+                ssxym[start:stop] = np.einsum("ij,ij->i", dx, dy) / window
+                x_identical[start:stop] = x.max(axis=1) == x.min(axis=1)
+                y_identical[start:stop] = y.max(axis=1) == y.min(axis=1)
+
+        return self._linear_regressions_from_moments(
+            window, x_mean, y_mean, ssxm, ssym, ssxym, x_identical, y_identical
+        )
+
+    def calculate_cumulative_moments(
+        self, longitude: np.ndarray, latitude: np.ndarray
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        Calculates the cumulative sums of x, y, x², y² and xy and the cumulative counts of value changes of a flight in one pass. The moments of any window of any length can be derived from them in O(1), see analyze_cumulative_linear_regressions.
+
+        Parameters:
+        - longitude: the longitudes of the flight
+        - latitude: the latitudes of the flight
+
+        Returns:
+        - tuple containing the center of the longitudes and latitudes, the cumulative sums of x, y, x², y² and xy of the centered coordinates and the cumulative counts of longitude and latitude changes
+        """
+        longitude = np.asarray(longitude, dtype=np.float64)
+        latitude = np.asarray(latitude, dtype=np.float64)
+
+        # centering the coordinates keeps the running sums small, which limits cancellation errors
+        x_center, y_center = longitude.mean(), latitude.mean()
+        x, y = longitude - x_center, latitude - y_center
+
+        cumulative_x, cumulative_y, cumulative_xx, cumulative_yy, cumulative_xy = (
+            self._cumulative_sums(values) for values in (x, y, x * x, y * y, x * y)
+        )
+        # all values of a window are identical if none of them differs from its predecessor
+        changes_x = self._cumulative_sums(np.diff(longitude, prepend=np.nan) != 0)
+        changes_y = self._cumulative_sums(np.diff(latitude, prepend=np.nan) != 0)
+
+        return (
+            x_center,
+            y_center,
+            cumulative_x,
+            cumulative_y,
+            cumulative_xx,
+            cumulative_yy,
+            cumulative_xy,
+            changes_x,
+            changes_y,
+        )
+
+    def analyze_cumulative_linear_regressions(
+        self,
+        moments: Tuple[np.ndarray, ...],
+        window: int,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Analyzes every window of consecutive coordinates at once to determine whether it lies on a straight line or not, based on linear regression. The sums of every window are derived from the cumulative moments of the flight, so the moments can be reused for any number of window lengths.
+
+        Parameters:
+        - moments: the cumulative moments of the flight, see calculate_cumulative_moments
+        - window: the number of coordinates per window
+
+        Returns:
+        - tuple containing arrays of the status of the analysis, the slope, the intercept, the r-value, the p-value and the standard error of the window starting at every index
+        """
+        (
+            x_center,
+            y_center,
+            cumulative_x,
+            cumulative_y,
+            cumulative_xx,
+            cumulative_yy,
+            cumulative_xy,
+            changes_x,
+            changes_y,
+        ) = moments
+
+        sum_x, sum_y, sum_xx, sum_yy, sum_xy = (
+            self._window_sums(cumulative, window)
+            for cumulative in (
+                cumulative_x,
+                cumulative_y,
+                cumulative_xx,
+                cumulative_yy,
+                cumulative_xy,
+            )
+        )
+        x_mean, y_mean = sum_x / window, sum_y / window
+        ssxm = np.maximum(sum_xx / window - x_mean**2, 0)
+        ssym = np.maximum(sum_yy / window - y_mean**2, 0)
+        ssxym = sum_xy / window - x_mean * y_mean
+
+        x_identical = self._window_sums(changes_x, window, skip_first=True) == 0
+        y_identical = self._window_sums(changes_y, window, skip_first=True) == 0
+
+        return self._linear_regressions_from_moments(
+            window,
+            x_mean + x_center,
+            y_mean + y_center,
+            ssxm,
+            ssym,
+            ssxym,
+            x_identical,
+            y_identical,
+        )
+
+    def analyze_rolling_linear_regressions(
+        self, longitude: np.ndarray, latitude: np.ndarray, window: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Analyzes every window of consecutive coordinates at once to determine whether it lies on a straight line or not, based on linear regression. The sums of x, y, x², y² and xy are kept as running sums while the window slides along the flight, i.e. every step adds the entering and removes the leaving coordinate, which makes the cost per window independent of its length.
+
+        Parameters:
+        - longitude: the longitudes of the flight
+        - latitude: the latitudes of the flight
+        - window: the number of coordinates per window
+
+        Returns:
+        - tuple containing arrays of the status of the analysis, the slope, the intercept, the r-value, the p-value and the standard error of the window starting at every index
+        """
+        if max(len(longitude) - window + 1, 0) == 0:
+            return self.analyze_window_linear_regressions(
+                longitude=longitude, latitude=latitude, window=window
+            )
+
+        return self.analyze_cumulative_linear_regressions(
+            moments=self.calculate_cumulative_moments(
+                longitude=longitude, latitude=latitude
+            ),
+            window=window,
+        )
+
+    def analyze_window_data(
+        self,
+        status_angle_past: np.ndarray,
+        status_regression_past: np.ndarray,
+        status_angle_future: np.ndarray,
+        status_regression_future: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Analyzes the data of a flight at once to determine whether the points lie on a straight line or not.
+
+        Parameters:
+        - status_angle_past: the statuses of the angle analysis in the past
+        - status_regression_past: the statuses of the linear regression analysis in the past
+        - status_angle_future: the statuses of the angle analysis in the future
+        - status_regression_future: the statuses of the linear regression analysis in the future
+
+        Returns:
+        - An array containing True for every point on a straight line, False otherwise
+        """
+        return (
+            status_angle_past
+            & status_regression_past
+            & status_angle_future
+            & status_regression_future
+        )
+
+    def _cumulative_sums(self, values: np.ndarray) -> np.ndarray:
+        """
+        Calculates the cumulative sums of the values, starting with 0.
+
+        Parameters:
+        - values: the values to be summed up
+
+        Returns:
+        - An array containing the sum of the first n values at index n
+        """
+        return np.concatenate(([0], np.cumsum(values)))
+
+    def _window_sums(
+        self, cumulative: np.ndarray, window: int, skip_first: bool = False
+    ) -> np.ndarray:
+        """
+        Calculates the sum of every window of consecutive values from their cumulative sums.
+
+        Parameters:
+        - cumulative: the cumulative sums of the values, see _cumulative_sums
+        - window: the number of values per window
+        - skip_first: whether the first value of every window is left out
+
+        Returns:
+        - An array containing the sum of the window starting at every index
+        """
+        starts: int = len(cumulative) - window
+        offset: int = 1 if skip_first else 0
+        return (
+            cumulative[window : window + starts] - cumulative[offset : offset + starts]
+        )
+
+    def _linear_regressions_from_moments(
+        self,
+        window: int,
+        x_mean: np.ndarray,
+        y_mean: np.ndarray,
+        ssxm: np.ndarray,
+        ssym: np.ndarray,
+        ssxym: np.ndarray,
+        x_identical: np.ndarray,
+        y_identical: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Derives the linear regression results from the moments of the windows, following the formulas of scipy.stats.linregress.
+
+        Parameters:
+        - window: the number of coordinates per window
+        - x_mean: the mean longitude per window
+        - y_mean: the mean latitude per window
+        - ssxm: the biased variance of the longitude per window
+        - ssym: the biased variance of the latitude per window
+        - ssxym: the biased covariance of longitude and latitude per window
+        - x_identical: whether all longitudes of a window are identical
+        - y_identical: whether all latitudes of a window are identical
+
+        Returns:
+        - tuple containing arrays of the status of the analysis, the slope, the intercept, the r-value, the p-value and the standard error
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r_value = np.where(
+                y_identical | (ssxm == 0) | (ssym == 0),
+                0.0,
+                ssxym / np.sqrt(ssxm * ssym),
+            )
+            r_value = np.clip(r_value, -1.0, 1.0)
+            slope = ssxym / ssxm
+            intercept = y_mean - slope * x_mean
+
+            if window == 2:
+                p_value = np.where(y_identical, 1.0, 0.0)
+                std_err = np.zeros_like(r_value)
+            else:
+                degrees_of_freedom: int = window - 2
+                t = r_value * np.sqrt(
+                    degrees_of_freedom
+                    / ((1.0 - r_value + 1.0e-20) * (1.0 + r_value + 1.0e-20))
+                )
+                p_value = special.stdtr(degrees_of_freedom, -np.abs(t)) * 2
+                std_err = np.sqrt((1 - r_value**2) * ssym / ssxm / degrees_of_freedom)
+
+        status = np.abs(r_value) > self.linear_regression_threshold
+
+        # all x values identical: linregress raises a ValueError, see analyze_linear_regression
+        status[x_identical] = False
+        for values in (slope, intercept, r_value, p_value, std_err):
+            values[x_identical] = 0
+
+        return status, slope, intercept, r_value, p_value, std_err
+
 
 # %%
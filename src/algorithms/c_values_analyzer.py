@@ -1,15 +1,100 @@
 # %%
 
-import os
-import sys
+import functools
+import numpy as np
 import pandas as pd
-from typing import Tuple
+from typing import Callable, Dict, Tuple
+
+from .. import constants
+from ..helpers import atmosphere as atmosphere
+
+# columns of CAnalyzer.calculate_glide_values, in the order of the kernel outputs
+GLIDE_COLUMNS: Tuple[str, ...] = (
+    "airspeed [m/s]",
+    "Cw [0.5]",
+    "Ca [0.5]",
+    "resulting force [N]",
+    "dynamic pressure [N/m^2]",
+    "resultant pressure [N/m^2]",
+)
+
+# axes of the arrays of CAnalyzer.sweep_glide_values
+SWEEP_DIMENSIONS: Tuple[str, ...] = ("mass", "wing area", "air density", "point")
+
+
+def _glide_kernel(
+    horizontal_speed: np.ndarray,
+    vertical_speed: np.ndarray,
+    algorithm: bool,
+    mass: float,
+    gravity: float,
+    air_density: np.ndarray,
+    wing_area: float,
+    static_pressure: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """
+    Calculates the glide values of every data point in a single loop, the results are written to the rows of out in the order of GLIDE_COLUMNS. This function is compiled with numba by CAnalyzer.calculate_glide_values(engine="numba").
+
+    Args:
+    - horizontal_speed: np.ndarray - The horizontal speeds of the paraglider.
+    - vertical_speed: np.ndarray - The vertical speeds of the paraglider.
+    - algorithm: bool - If False, the simplified algorithm is used for the Cw value. If True, the optimized algorithm is used.
+    - mass, gravity, wing_area: float - The simulation constants.
+    - air_density, static_pressure: np.ndarray - The air density and static pressure of every data point.
+    - out: np.ndarray - The results, shape (6, number of data points).
+
+    Returns:
+    - None
+    """
+    for i in range(horizontal_speed.shape[0]):
+        horizontal: float = horizontal_speed[i]
+        vertical: float = abs(vertical_speed[i])
+        density: float = air_density[i]
+        airspeed_squared: float = horizontal * horizontal + vertical * vertical
+        if algorithm:
+            cw: float = (
+                (mass * mass * gravity * gravity * vertical * vertical)
+                / (
+                    density
+                    * density
+                    * wing_area
+                    * wing_area
+                    * airspeed_squared
+                    * airspeed_squared
+                    * airspeed_squared
+                )
+            ) ** 0.5
+        else:
+            cw = (mass * gravity * vertical) / (
+                density * wing_area * airspeed_squared * (horizontal + vertical)
+            )
+        ca: float = (cw * horizontal) / vertical
+        force: float = density * wing_area * airspeed_squared * (ca + cw)
+        dynamic_pressure: float = force / (wing_area * (ca * ca + cw * cw) ** 0.5)
+
+        out[0, i] = airspeed_squared**0.5
+        out[1, i] = cw
+        out[2, i] = ca
+        out[3, i] = force
+        out[4, i] = dynamic_pressure
+        out[5, i] = static_pressure[i] + dynamic_pressure
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_glide_kernel() -> Callable:
+    """
+    Compiles _glide_kernel with numba, numba is an optional dependency and only imported on the first call.
+
+    Args:
+    - None
 
-# AI content (GitHub Copilot, 01/29/2024), verified and adapted by Nicolas Huber.
-src_directory: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
-sys.path.append(src_directory)
+    Returns:
+    - Callable - The compiled kernel.
+    """
+    import numba
 
-import constants as constants
+    return numba.njit(cache=True, error_model="numpy")(_glide_kernel)
 
 
 class CAnalyzer:
@@ -77,7 +162,11 @@ class CAnalyzer:
         return (cw * horizontal_speed) / vertical_speed
 
     def calculate_cw_value_simplified(
-        self, horizontal_speed: float, vertical_speed: float, airspeed: float
+        self,
+        horizontal_speed: float,
+        vertical_speed: float,
+        airspeed: float,
+        air_density: float = None,
     ) -> float:
         """
         This method calculates the Cw value of the paraglider based on the airspeed and the vertical speed.
@@ -86,19 +175,25 @@ class CAnalyzer:
         - horizontal_speed: float - The horizontal speed of the paraglider.
         - vertical_speed: float - The vertical speed of the paraglider.
         - airspeed: float - The airspeed of the paraglider.
+        - air_density: float - The air density, None to use constants.AIR_DENSITY.
 
         Returns:
         - float - The Cw value.
         """
+        air_density = constants.AIR_DENSITY if air_density is None else air_density
         return (constants.MASS * constants.GRAVITY * vertical_speed) / (
-            constants.AIR_DENSITY
+            air_density
             * constants.WING_AREA
             * airspeed**2
             * (horizontal_speed + vertical_speed)
         )
 
     def calculate_cw_value_optimized(
-        self, horizontal_speed: float, vertical_speed: float, airspeed: float
+        self,
+        horizontal_speed: float,
+        vertical_speed: float,
+        airspeed: float,
+        air_density: float = None,
     ) -> float:
         """
         This method calculates the Cw value of the paraglider based on the airspeed, the horizontal speed and the vertical speed.
@@ -107,14 +202,16 @@ class CAnalyzer:
         - horizontal_speed: float - The horizontal speed of the paraglider.
         - vertical_speed: float - The vertical speed of the paraglider.
         - airspeed: float - The airspeed of the paraglider.
+        - air_density: float - The air density, None to use constants.AIR_DENSITY.
 
         Returns:
         - float - The Cw value.
         """
+        air_density = constants.AIR_DENSITY if air_density is None else air_density
         return (
             ((constants.MASS**2) * (constants.GRAVITY**2) * (vertical_speed**2))
             / (
-                (constants.AIR_DENSITY**2)
+                (air_density**2)
                 * (constants.WING_AREA**2)
                 * (airspeed**4)
                 * ((horizontal_speed**2) + (vertical_speed**2))
@@ -122,7 +219,7 @@ class CAnalyzer:
         ) ** 0.5
 
     def process_c_values(
-        self, speed_data: pd.DataFrame, algorithm=False
+        self, speed_data: pd.DataFrame, algorithm=False, altitude_column: str = None
     ) -> pd.DataFrame:
         """
         This methods processes the c values of the paraglider and returns a new DataFrame containing the horizontal speed, vertical speed, airspeed, Cw and Ca values.
@@ -130,21 +227,30 @@ class CAnalyzer:
         Args:
         - speed_data: pd.DataFrame - The speed data of the paraglider, incuding airspeed
         - algorithm: bool - The algorithm to use for the Cw value calculation. If False, the simplified algorithm is used. If True, the optimized algorithm is used.
+        - altitude_column: str - The column with the altitude of every data point [m] to use the air density of the standard atmosphere per data point, None to use constants.AIR_DENSITY.
 
         Returns:
         - pd.DataFrame - a new DataFrame containing horizontal speed, vertical speed, airspeed, Cw and Ca values.
         """
+        air_density: np.ndarray = None
+        if altitude_column is not None:
+            air_density = atmosphere.Atmosphere().lookup(
+                speed_data[altitude_column].to_numpy()
+            )[0]
+
         if algorithm:
             speed_data["Cw [0.5]"] = self.calculate_cw_value_optimized(
                 speed_data["horizontal velocity [m/s]"],
                 speed_data["vertical velocity [m/s]"],
                 speed_data["airspeed [m/s]"],
+                air_density,
             )
         else:
             speed_data["Cw [0.5]"] = self.calculate_cw_value_simplified(
                 speed_data["horizontal velocity [m/s]"],
                 speed_data["vertical velocity [m/s]"],
                 speed_data["airspeed [m/s]"],
+                air_density,
             )
 
         speed_data["Ca [0.5]"] = self.calculate_ca_value(
@@ -154,6 +260,167 @@ class CAnalyzer:
         )
         return speed_data
 
+    def calculate_glide_values(
+        self,
+        horizontal_speed: np.ndarray,
+        vertical_speed: np.ndarray,
+        algorithm: bool = False,
+        engine: str = "numpy",
+        altitude: np.ndarray = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        This method calculates the airspeed, the Cw and Ca values, the resulting force, the dynamic pressure and the resultant pressure in one pass. It is equivalent to calculate_airspeed, positive_vertical_speed, process_c_values and PressureAnalyzer.process_pressure_data, but works on arrays without inserting DataFrame columns.
+
+        Args:
+        - horizontal_speed: np.ndarray - The horizontal speeds of the paraglider.
+        - vertical_speed: np.ndarray - The vertical speeds of the paraglider, the sign is ignored.
+        - algorithm: bool - The algorithm to use for the Cw value calculation. If False, the simplified algorithm is used. If True, the optimized algorithm is used.
+        - engine: str - "numpy" evaluates the formulas with in-place array operations, "numba" runs a compiled loop (requires numba).
+        - altitude: np.ndarray - The altitude of every data point [m] to use the air density and static pressure of the standard atmosphere per data point, None to use constants.AIR_DENSITY and constants.STATIC_PRESSURE.
+
+        Returns:
+        - Dict[str, np.ndarray] - The glide values keyed by the DataFrame column names (see GLIDE_COLUMNS), views of one contiguous array.
+        """
+        horizontal: np.ndarray = np.ascontiguousarray(
+            horizontal_speed, dtype=np.float64
+        )
+        vertical: np.ndarray = np.abs(np.asarray(vertical_speed, dtype=np.float64))
+        out: np.ndarray = np.empty((len(GLIDE_COLUMNS), len(horizontal)))
+        air_density, static_pressure = (
+            constants.AIR_DENSITY,
+            constants.STATIC_PRESSURE,
+        )
+        if altitude is not None:
+            air_density, static_pressure = atmosphere.Atmosphere().lookup(altitude)
+
+        if engine == "numba":
+            _compile_glide_kernel()(
+                horizontal,
+                vertical,
+                algorithm,
+                constants.MASS,
+                constants.GRAVITY,
+                np.broadcast_to(air_density, horizontal.shape),
+                constants.WING_AREA,
+                np.broadcast_to(static_pressure, horizontal.shape),
+                out,
+            )
+            return dict(zip(GLIDE_COLUMNS, out))
+        if engine != "numpy":
+            raise ValueError(f"Unknown engine: {engine}, use numpy or numba.")
+
+        airspeed, cw, ca, force, dynamic_pressure, resultant_pressure = out
+        density_area: np.ndarray = air_density * constants.WING_AREA
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # airspeed^2 is kept in force until the force is calculated
+            np.multiply(horizontal, horizontal, out=force)
+            force += vertical * vertical
+            np.sqrt(force, out=airspeed)
+            if algorithm:
+                # sqrt(m^2 g^2 v^2 / (rho^2 A^2 a^4 (h^2 + v^2))) with a^2 = h^2 + v^2
+                np.multiply(force, airspeed, out=cw)
+                cw *= density_area
+                np.divide(vertical, cw, out=cw)
+            else:
+                np.add(horizontal, vertical, out=cw)
+                cw *= force
+                cw *= density_area
+                np.divide(vertical, cw, out=cw)
+            cw *= constants.MASS * constants.GRAVITY
+            np.multiply(cw, horizontal, out=ca)
+            ca /= vertical
+
+            force *= density_area
+            force *= ca + cw
+            np.multiply(ca, ca, out=dynamic_pressure)
+            dynamic_pressure += cw * cw
+            np.sqrt(dynamic_pressure, out=dynamic_pressure)
+            dynamic_pressure *= constants.WING_AREA
+            np.divide(force, dynamic_pressure, out=dynamic_pressure)
+            np.add(dynamic_pressure, static_pressure, out=resultant_pressure)
+        return dict(zip(GLIDE_COLUMNS, out))
+
+    def sweep_glide_values(
+        self,
+        horizontal_speed: np.ndarray,
+        vertical_speed: np.ndarray,
+        mass: np.ndarray,
+        wing_area: np.ndarray,
+        air_density: np.ndarray,
+        static_pressure: np.ndarray = None,
+        algorithm: bool = False,
+    ) -> Dict[str, np.ndarray]:
+        """
+        This method evaluates calculate_glide_values for every combination of mass, wing area and air density at once, e.g. for a whole speed polar and thousands of pilot and wing configurations. The model factors into a term per data point and a term per configuration (Cw and Ca scale with mass / (air density * wing area), the resulting force with the mass and the dynamic pressure with the air density), so the grid is filled with one broadcasted product per value.
+
+        Args:
+        - horizontal_speed: np.ndarray - The horizontal speeds of the paraglider.
+        - vertical_speed: np.ndarray - The vertical speeds of the paraglider, the sign is ignored.
+        - mass: np.ndarray - The masses of the paraglider in flight [kg].
+        - wing_area: np.ndarray - The wing areas of the paraglider [m^2].
+        - air_density: np.ndarray - The air densities [kg/m^3].
+        - static_pressure: np.ndarray - The static pressure per air density [N/m^2], None to use constants.STATIC_PRESSURE for all air densities.
+        - algorithm: bool - The algorithm to use for the Cw value calculation. If False, the simplified algorithm is used. If True, the optimized algorithm is used.
+
+        Returns:
+        - Dict[str, np.ndarray] - The glide values keyed by the DataFrame column names (see GLIDE_COLUMNS), every array has the axes SWEEP_DIMENSIONS (mass, wing area, air density, point).
+        """
+        horizontal: np.ndarray = np.asarray(horizontal_speed, dtype=np.float64)
+        vertical: np.ndarray = np.abs(np.asarray(vertical_speed, dtype=np.float64))
+        mass = np.atleast_1d(np.asarray(mass, dtype=np.float64))[:, None, None, None]
+        wing_area = np.atleast_1d(np.asarray(wing_area, dtype=np.float64))[
+            None, :, None, None
+        ]
+        air_density = np.atleast_1d(np.asarray(air_density, dtype=np.float64))
+        if static_pressure is None:
+            static_pressure = np.full(air_density.shape, constants.STATIC_PRESSURE)
+        static_pressure = np.atleast_1d(np.asarray(static_pressure, dtype=np.float64))
+        if static_pressure.shape != air_density.shape:
+            raise ValueError(
+                "static_pressure must have one value per air density, "
+                f"got {static_pressure.shape} and {air_density.shape}."
+            )
+        air_density = air_density[None, None, :, None]
+        static_pressure = static_pressure[None, None, :, None]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            airspeed_squared: np.ndarray = horizontal**2 + vertical**2
+            airspeed: np.ndarray = np.sqrt(airspeed_squared)
+            if algorithm:
+                cw_point: np.ndarray = (constants.GRAVITY * vertical) / (
+                    airspeed_squared * airspeed
+                )
+            else:
+                cw_point = (constants.GRAVITY * vertical) / (
+                    airspeed_squared * (horizontal + vertical)
+                )
+            ratio: np.ndarray = horizontal / vertical  # Ca / Cw
+            ca_point: np.ndarray = cw_point * ratio
+            force_point: np.ndarray = airspeed_squared * (ca_point + cw_point)
+            pressure_point: np.ndarray = (
+                airspeed_squared * (ratio + 1) / np.sqrt(ratio**2 + 1)
+            )
+
+            configuration: np.ndarray = mass / (air_density * wing_area)
+            shape: Tuple[int, ...] = np.broadcast_shapes(
+                configuration.shape, horizontal.shape
+            )
+            dynamic_pressure: np.ndarray = np.broadcast_to(
+                air_density * pressure_point, shape
+            )
+            values: Tuple[np.ndarray, ...] = (
+                airspeed,
+                configuration * cw_point,
+                configuration * ca_point,
+                mass * force_point,
+                dynamic_pressure,
+                static_pressure + dynamic_pressure,
+            )
+        return {
+            column: np.broadcast_to(value, shape)
+            for column, value in zip(GLIDE_COLUMNS, values)
+        }
+
     def score_stats(self, stats: Tuple[float, float, float]) -> float:
         """
         Calculate a score based on the deviation stats.
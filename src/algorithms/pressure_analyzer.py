@@ -1,13 +1,8 @@
-import os
-import sys
 import pandas as pd
 from typing import Tuple
 
-# AI content (GitHub Copilot, 01/29/2024), verified and adapted by Nicolas Huber.
-src_directory: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
-sys.path.append(src_directory)
-
-import constants as constants
+from .. import constants
+from ..helpers import atmosphere as atmosphere
 
 
 class PressureAnalyzer:
@@ -21,7 +16,7 @@ class PressureAnalyzer:
         """
         pass
 
-    def calculate_force_resultant(self, airspeed: float, Ca: float, Cw: float) -> float:
+    def calculate_force_resultant(self, airspeed: float, Ca: float, Cw: float, air_density: float = None) -> float:
         """
         Calculate resultant force at a paraglider wing (based on simplified algorithm)
 
@@ -29,19 +24,21 @@ class PressureAnalyzer:
         - airspeed (float): The airspeed at the paraglider wing.
         - Ca (float): The lift coefficient at the paraglider wing.
         - Cw (float): The drag coefficient at the paraglider wing.
+        - air_density (float): The air density, None to use constants.AIR_DENSITY.
 
         Returns:
         - float: The resultant force at the paraglider wing.
         """
+        air_density = constants.AIR_DENSITY if air_density is None else air_density
         return (
-            constants.AIR_DENSITY
+            air_density
             * constants.WING_AREA
             * (airspeed**2)
             * (Ca + Cw)
         )
 
     def calculate_dynamic_pressure(
-        self, airspeed: float, Ca: float, Cw: float
+        self, airspeed: float, Ca: float, Cw: float, air_density: float = None
     ) -> float:
         """
         Calculate dynamic pressure at a paraglider wing.
@@ -50,41 +47,49 @@ class PressureAnalyzer:
         - airspeed (float): The airspeed at the paraglider wing.
         - Ca (float): The lift coefficient at the paraglider wing.
         - Cw (float): The drag coefficient at the paraglider wing.
+        - air_density (float): The air density, None to use constants.AIR_DENSITY.
 
         Returns:
         - float: The dynamic pressure at the paraglider wing.
         """
-        return self.calculate_force_resultant(airspeed, Ca, Cw) / (
+        return self.calculate_force_resultant(airspeed, Ca, Cw, air_density) / (
             constants.WING_AREA * (((Ca**2) + (Cw**2)) ** 0.5)
         )
 
-    def calculate_pressure_resultant(self, dynamic_pressure: float) -> float:
+    def calculate_pressure_resultant(self, dynamic_pressure: float, static_pressure: float = None) -> float:
         """
         Calculate resultant pressure at a paraglider wing.
 
         Args:
         - dynamic_pressure (float): The dynamic pressure at the paraglider wing.
+        - static_pressure (float): The static pressure, None to use constants.STATIC_PRESSURE.
 
         Returns:
         - float: The resultant pressure at the paraglider wing.
         """
-        return constants.STATIC_PRESSURE + dynamic_pressure
+        static_pressure = constants.STATIC_PRESSURE if static_pressure is None else static_pressure
+        return static_pressure + dynamic_pressure
 
-    def process_pressure_data(self, data: pd.DataFrame) -> pd.DataFrame:
+    def process_pressure_data(self, data: pd.DataFrame, altitude_column: str = None) -> pd.DataFrame:
         """
         Process a dataset containing speed data and c coefficients to calculate the dynamic pressure.
 
         Args:
         - data (pd.DataFrame): The dataset containing speed data and c coefficients.
+        - altitude_column (str): The column with the altitude of every data point [m] to use the air density and static pressure of the standard atmosphere per data point, None to use constants.AIR_DENSITY and constants.STATIC_PRESSURE.
 
         Returns:
         - pd.DataFrame: The dataset containing the speed data, c coefficients, the dynamic pressure and the resultant pressure.
         """
+        air_density, static_pressure = None, None
+        if altitude_column is not None:
+            air_density, static_pressure = atmosphere.Atmosphere().lookup(data[altitude_column].to_numpy())
+
         data["dynamic pressure [N/m^2]"] = self.calculate_dynamic_pressure(
-            data["airspeed [m/s]"], data["Ca [0.5]"], data["Cw [0.5]"]
+            data["airspeed [m/s]"], data["Ca [0.5]"], data["Cw [0.5]"], air_density
         )
         data["resultant pressure [N/m^2]"] = self.calculate_pressure_resultant(
-            data["dynamic pressure [N/m^2]"]
+            data["dynamic pressure [N/m^2]"], static_pressure
         )
 
         return data
@@ -1,21 +1,19 @@
 # %%
-import os
-import sys
 import numpy as np
 import pandas as pd
-from typing import List, Tuple
-from scipy.signal import savgol_filter
+from typing import Dict, List, Tuple
+from natsort import natsorted
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-# AI content (ChatGPT, 02/19/2024), verified and adapted by Nicolas Huber.
-current_directory = os.path.dirname(os.path.abspath(__file__))
-os.chdir(current_directory)
-src_directory = os.path.join(current_directory, "..")
-sys.path.append(src_directory)
+from .. import constants
+from ..packages import IGC2CSV as igc2csv
+from ..helpers import data_analyzer as dataanalyzer
+from ..helpers import flight_cache as flightcache
+from ..helpers import flight_manifest as flightmanifest
+from . import angle_analyzer as angleanalyzer
+from ..helpers import lazy_module as lazymodule
 
-import constants as constants
-import packages.IGC2CSV as igc2csv
-import helpers.data_analyzer as dataanalyzer
-import algorithms.angle_analyzer as angleanalyzer
+signal = lazymodule.LazyModule("scipy.signal")
 
 
 class SpeedAnalyzer:
@@ -23,63 +21,193 @@ class SpeedAnalyzer:
     SpeedAnalyzer class is responsible for processing the files and returning a dataframe with the results.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        workers: int = constants.INGESTION_WORKERS,
+        cache_directory: str = constants.CACHE_DIRECTORY,
+    ) -> None:
         """
         SpeedAnalyzer class constructor
 
         Args:
-        - None
+        - workers (int): Number of worker processes used by process_raw_data, 1 processes the files in the current process
+        - cache_directory (str): Directory of the cache of converted and classified flights, None disables the cache
 
         Returns:
         - None
         """
         self.convertor: igc2csv.IGC2CSV = igc2csv.IGC2CSV()
+        self.workers: int = workers
+        self.cache_directory: str = cache_directory
+        self.cache: flightcache.FlightCache = None
+        if cache_directory is not None:
+            self.cache = flightcache.FlightCache(directory=cache_directory)
+        self.failed_files: Dict[str, str] = {}
+
+    def convert_file(self, file_path: str) -> pd.DataFrame:
+        """
+        Convert a single IGC file to the flight-analyzer format, the file is parsed with the columnar parser of IGC2CSV (process_file). A file without trackpoints (B records) or without a date raises a ValueError, so process_files reports it as failed
 
-    def process_raw_data(self, file_paths: List[str]) -> pd.DataFrame:
+        Args:
+        - file_path (str): Path to the IGC file
+
+        Returns:
+        - pd.DataFrame: Dataframe with the trackpoints of the file
         """
-        Process the files and return a dataframe with the results
+        result = self.convertor.process_file(file_path)
+        if result.empty:
+            raise ValueError(f"{file_path} contains no trackpoints.")
+        return self.convertor.export_to_flight_analyzer_format(result).reset_index(
+            drop=True
+        )
+
+    def process_file(self, file_path: str) -> pd.DataFrame:
+        """
+        Convert a single IGC file and classify its trackpoints. If the cache is enabled, the converted and the classified flight are reused as long as the file, the thresholds and the processing code do not change
 
         Args:
-        - None
+        - file_path (str): Path to the IGC file
 
         Returns:
-        - pd.DataFrame: Dataframe with the results
+        - pd.DataFrame: Dataframe with the classified trackpoints of the file
+        """
+        if self.cache is None:
+            return self.classify_data(self.convert_file(file_path))
+
+        file_hash: str = self.cache.hash_file(file_path)
+        processed_key: str = self.cache.key(file_hash=file_hash, stage="processed")
+        data_processed: pd.DataFrame = self.cache.load(processed_key)
+        if data_processed is not None:
+            return data_processed
+
+        converted_key: str = self.cache.key(file_hash=file_hash, stage="converted")
+        data: pd.DataFrame = self.cache.load(converted_key)
+        if data is None:
+            data = self.convert_file(file_path)
+            self.cache.store(converted_key, data)
+
+        data_processed = self.classify_data(data)
+        self.cache.store(processed_key, data_processed)
+        return data_processed
+
+    def classify_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Classify the trackpoints of a converted flight
+
+        Args:
+        - data (pd.DataFrame): Dataframe with the trackpoints in the flight-analyzer format
+
+        Returns:
+        - pd.DataFrame: Dataframe with the classified trackpoints
+        """
+        # the converted data is passed to the DataAnalyzer in memory, no temporary csv file is written
+        DataAnalyzer: dataanalyzer.DataAnalyzer = dataanalyzer.DataAnalyzer(data=data)
+        data: pd.DataFrame = DataAnalyzer.read_csv_data()
+
+        AngleAnalyzer: angleanalyzer.AngleAnalyzer = (
+            DataAnalyzer.construct_angle_analyzer()
+        )
+        return DataAnalyzer.process_data(data=data, AngleAnalyzer=AngleAnalyzer)
+
+    def process_files(self, file_paths: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Process the files, by a pool of worker processes if more than one worker is configured. A file that cannot be processed is reported and skipped, the failed files are kept in self.failed_files
+
+        Args:
+        - file_paths (List[str]): Paths to the IGC files
+
+        Returns:
+        - Dict[str, pd.DataFrame]: Dataframe with the classified trackpoints per processed file
         """
         print("Processed files:")
 
-        flight_data: pd.DataFrame = pd.DataFrame()
         count: int = len(file_paths)
-        i: int = 0
+        flights: Dict[str, pd.DataFrame] = {}
+        self.failed_files = {}
 
-        for file_path in file_paths:
+        def collect(i: int, file_path: str, process) -> None:
             file_name = file_path.split("/")[-1]
+            try:
+                flights[file_path] = process()
+            except Exception as error:
+                self.failed_files[file_path] = repr(error)
+                print(f"--> Failed {i} of {count} files: {file_name} ({error!r})")
+                return
+            print(f"--> Processed {i} of {count} files: {file_name}")
+
+        if self.workers > 1 and count > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = {
+                    executor.submit(
+                        _process_file_worker, file_path, self.cache_directory
+                    ): file_path
+                    for file_path in file_paths
+                }
+                for i, future in enumerate(as_completed(futures), start=1):
+                    collect(i, futures[future], future.result)
+        else:
+            for i, file_path in enumerate(file_paths, start=1):
+                collect(i, file_path, lambda: self.process_file(file_path))
 
-            result = self.convertor.process_files(file_path, False)
-            result_flight_analyzer = self.convertor.export_to_flight_analyzer_format(
-                result
-            )
-            self.convertor.export_to_csv(result_flight_analyzer, f"{file_path}.csv")
+        return flights
 
-            DataAnalyzer: dataanalyzer.DataAnalyzer = dataanalyzer.DataAnalyzer(
-                csv_file_in=f"{file_path}.csv"
-            )
-            data: pd.DataFrame = DataAnalyzer.read_csv_data()
+    def process_raw_data(self, file_paths: List[str]) -> pd.DataFrame:
+        """
+        Process the files and return a dataframe with the results. The files are processed in natural sort order, see process_files
 
-            AngleAnalyzer: angleanalyzer.AngleAnalyzer = (
-                DataAnalyzer.construct_angle_analyzer()
-            )
-            data_processed: pd.DataFrame = DataAnalyzer.process_data(
-                data=data, AngleAnalyzer=AngleAnalyzer
-            )
-            flight_data = pd.concat([flight_data, data_processed], ignore_index=True)
-            print(f"--> Processed {i+1} of {count} files: {file_name}")
+        Args:
+        - file_paths (List[str]): Paths to the IGC files
+
+        Returns:
+        - pd.DataFrame: Dataframe with the results
+        """
+        file_paths = natsorted(file_paths)
+        flights: Dict[str, pd.DataFrame] = self.process_files(file_paths)
+
+        # the flights are concatenated once, in the order of the files
+        frames: List[pd.DataFrame] = [
+            flights[file_path] for file_path in file_paths if file_path in flights
+        ]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def update_raw_data(self, file_paths: List[str], directory: str) -> pd.DataFrame:
+        """
+        Process only the new and changed files and merge them into the results of the previous runs, which are kept in the given directory. The result is identical to process_raw_data for the same files
+
+        Args:
+        - file_paths (List[str]): Paths to the IGC files
+        - directory (str): Directory of the manifest of processed files and the merged results
+
+        Returns:
+        - pd.DataFrame: Dataframe with the results of all files
+        """
+        file_paths = natsorted(file_paths)
+        Manifest: flightmanifest.FlightManifest = flightmanifest.FlightManifest(
+            directory=directory
+        )
+        changed_files: List[str] = Manifest.changed_files(file_paths)
+        print(
+            f"Incremental processing: {len(changed_files)} of {len(file_paths)} files are new or changed."
+        )
 
-            i += 1
+        flights: Dict[str, pd.DataFrame] = self.process_files(changed_files)
+        return Manifest.update(file_paths=file_paths, flights=flights)
 
-        for file_path in file_paths:
-            os.remove(f"{file_path}.csv")
+    def process_speed_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Filter, smooth and group the raw data, i.e. apply filter_raw_data, savgol_filter and group_data
 
-        return flight_data
+        Args:
+        - data (pd.DataFrame): Raw data, see process_raw_data and update_raw_data
+
+        Returns:
+        - pd.DataFrame: Dataframe with the grouped speed data
+        """
+        data_filtered: pd.DataFrame = self.filter_raw_data(data=data)
+        data_smoothed: pd.DataFrame = self.savgol_filter(data=data_filtered)
+        return self.group_data(data=data_smoothed)
 
     def filter_raw_data(
         self, data: pd.DataFrame, reference: bool = False
@@ -125,12 +253,12 @@ class SpeedAnalyzer:
         Returns:
         - pd.DataFrame: Dataframe with the results
         """
-        smoothed_horizontal_velocity: pd.DataFrame = savgol_filter(
+        smoothed_horizontal_velocity: pd.DataFrame = signal.savgol_filter(
             data["horizontal velocity [m/s]"],
             constants.SAVGOL_WINDOW_LENGTH,
             constants.SAVGOl_POLYNOMIAL_ORDER,
         )
-        smoothed_vertical_velocity: pd.DataFrame = savgol_filter(
+        smoothed_vertical_velocity: pd.DataFrame = signal.savgol_filter(
             data["vertical velocity [m/s]"],
             constants.SAVGOL_WINDOW_LENGTH,
             constants.SAVGOl_POLYNOMIAL_ORDER,
@@ -260,3 +388,19 @@ class SpeedAnalyzer:
         print(
             f"----> Optimized dataset (before processing): {len(datasets[2])} & after processing: {len(datasets[3])}"
         )
+
+
+def _process_file_worker(file_path: str, cache_directory: str) -> pd.DataFrame:
+    """
+    Process a single IGC file in a worker process of SpeedAnalyzer.process_raw_data
+
+    Args:
+    - file_path (str): Path to the IGC file
+    - cache_directory (str): Directory of the cache of converted and classified flights, None disables the cache
+
+    Returns:
+    - pd.DataFrame: Dataframe with the classified trackpoints of the file
+    """
+    return SpeedAnalyzer(workers=1, cache_directory=cache_directory).process_file(
+        file_path
+    )
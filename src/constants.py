@@ -27,6 +27,15 @@ ANGLE_FUTURE_THRESHOLD: int = (
 )
 ANGLE_THRESHOLD: int = 20  # angle < 20° is considered as straight line
 LINEAR_REGRESSION_THRESHOLD: float = 0.9  # r-value > 0.9 is considered as straight line
+WINDOW_CHUNK_SIZE: int = 4096  # number of windows that are evaluated per vectorized batch
+INGESTION_WORKERS: int = 1  # number of worker processes of the SpeedAnalyzer, 1 processes the files in the current process
+CACHE_DIRECTORY: str = None  # directory of the cache of processed flights, None disables the cache
+CACHE_MAX_SIZE: int = 512 * 1024**2  # maximum size of the cache of processed flights in bytes
+INCREMENTAL_DIRECTORY: str = None  # directory of the results of previous runs of the SpeedAnalyzer, None processes all files
+RENDER_WORKERS: int = 1  # number of worker processes of DataVisualizer.render_batch, 1 renders the plots in the current process
+PLOT_MAX_POINTS: int = 5000  # maximum number of points of a plotted tracklog, None plots every point
+PLOT_CACHE_SIZE: int = 64  # number of decimated tracklogs that are cached by the DataVisualizer
+FIT_CACHE_SIZE: int = 32  # number of fitted curves (polynomials, power laws, splines) that are cached by the ModelFitCache
 
 SAVGOL_WINDOW_LENGTH: int = 3  # window length of the Savitzky-Golay filter
 SAVGOl_POLYNOMIAL_ORDER: int = 2  # polynomial order of the Savitzky-Golay filter
@@ -39,6 +48,8 @@ GRAVITY: float = 9.81  # gravitational accelaration in Zurich, Switzerland [m/s^
 AIR_DENSITY: float = 1.0065  # air at altitude 2000m [kg/m^3]
 WING_AREA: float = 23.1  # wing area of the paraglider [m^2]
 STATIC_PRESSURE: float = 79495.22  # static air pressure at altitude [N/m^2], ICAO standard atmosphere, 15°C at altitude 2000m
+ISA_TABLE_STEP: float = 1.0  # altitude step of the lookup table of the standard atmosphere [m]
+ISA_TABLE_RANGE: Tuple[float, float] = (-500.0, 20000.0)  # altitude range of the lookup table of the standard atmosphere [m]
 
 # simulation quality
 
@@ -58,3 +69,7 @@ STD_ERROR_WEIGHT: float = 0.1  # weight of the standard error in the optimizatio
 OPTIMIZATION_LIMIT: int = 200  # upper limit of optimization loops
 OPTIMIZATION_STEPS: int = 5  # step size per optimization loop
 OPTIMIZATION_RUNTIME_ESTIMATION: int = 6  # estimated runtime per loop in seconds
+OPTIMIZATION_WORKERS: int = 1  # number of worker processes, 1 runs the optimization in the current process
+OPTIMIZATION_STRATEGY: str = "grid"  # search strategy: grid, coarse_to_fine, successive_halving or surrogate
+OPTIMIZATION_BUDGET: int = 250  # maximum number of tested thresholds of the search strategies other than grid
+OPTIMIZATION_BLOCKS: int = 4  # number of evenly spaced blocks of the tracklog that the search strategies test on a fraction of the data
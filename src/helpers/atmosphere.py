@@ -0,0 +1,139 @@
+# %%
+
+import functools
+import numpy as np
+from typing import Tuple
+
+from .. import constants
+
+
+class Atmosphere:
+    """
+    Class to calculate the air density and the static pressure of the ICAO standard atmosphere (ISA) at given altitudes, e.g. per sample of a flight instead of constants.AIR_DENSITY and constants.STATIC_PRESSURE at 2000 m. The values are interpolated linearly in a table that is calculated once per step and altitude range and shared by all instances, so no exp or pow is evaluated per sample. The troposphere and the lower stratosphere (up to 20 km) are modelled, altitudes outside of the table are clamped to its range.
+
+    To use this class the following code snippet can be used:
+
+    Atmosphere = Atmosphere()
+    air_density, static_pressure = Atmosphere.lookup(altitude=data["relative altitude [m]"])
+    """
+
+    SEA_LEVEL_PRESSURE: float = 101325.0  # [N/m^2]
+    SEA_LEVEL_TEMPERATURE: float = 288.15  # [K]
+    LAPSE_RATE: float = 0.0065  # temperature decrease in the troposphere [K/m]
+    TROPOPAUSE: float = 11000.0  # altitude of the tropopause [m]
+    GAS_CONSTANT: float = 287.05287  # specific gas constant of dry air [J/(kg K)]
+    STANDARD_GRAVITY: float = 9.80665  # [m/s^2]
+
+    def __init__(
+        self,
+        step: float = constants.ISA_TABLE_STEP,
+        altitude_range: Tuple[float, float] = constants.ISA_TABLE_RANGE,
+    ) -> None:
+        """
+        Load the lookup table of the step and altitude range.
+
+        Parameters:
+        - step (float): The altitude step of the table [m].
+        - altitude_range (Tuple[float, float]): The lowest and the highest altitude of the table [m].
+
+        Returns:
+        - None.
+        """
+        self.step: float = float(step)
+        self.minimum: float = float(altitude_range[0])
+        self.densities, self.pressures, *self.slopes = _isa_table(
+            self.minimum, float(altitude_range[1]), self.step
+        )
+
+    @classmethod
+    def calculate_isa(cls, altitude: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate the air density and the static pressure of the standard atmosphere with the closed-form equations.
+
+        Parameters:
+        - altitude (np.ndarray): The altitudes [m].
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: The air densities [kg/m^3] and the static pressures [N/m^2].
+        """
+        altitude = np.minimum(np.asarray(altitude, dtype=np.float64), 20000.0)
+        exponent: float = cls.STANDARD_GRAVITY / (cls.GAS_CONSTANT * cls.LAPSE_RATE)
+        tropopause_temperature: float = (
+            cls.SEA_LEVEL_TEMPERATURE - cls.LAPSE_RATE * cls.TROPOPAUSE
+        )
+        tropopause_pressure: float = (
+            cls.SEA_LEVEL_PRESSURE
+            * (tropopause_temperature / cls.SEA_LEVEL_TEMPERATURE) ** exponent
+        )
+
+        troposphere: np.ndarray = altitude <= cls.TROPOPAUSE
+        temperature: np.ndarray = np.where(
+            troposphere,
+            cls.SEA_LEVEL_TEMPERATURE
+            - cls.LAPSE_RATE * np.minimum(altitude, cls.TROPOPAUSE),
+            tropopause_temperature,
+        )
+        pressure: np.ndarray = np.where(
+            troposphere,
+            cls.SEA_LEVEL_PRESSURE
+            * (temperature / cls.SEA_LEVEL_TEMPERATURE) ** exponent,
+            tropopause_pressure
+            * np.exp(
+                -cls.STANDARD_GRAVITY
+                * (np.maximum(altitude, cls.TROPOPAUSE) - cls.TROPOPAUSE)
+                / (cls.GAS_CONSTANT * tropopause_temperature)
+            ),
+        )
+        return pressure / (cls.GAS_CONSTANT * temperature), pressure
+
+    def lookup(self, altitude: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Interpolate the air density and the static pressure at the altitudes in the lookup table.
+
+        Parameters:
+        - altitude (np.ndarray): The altitudes [m].
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: The air densities [kg/m^3] and the static pressures [N/m^2].
+        """
+        position: np.ndarray = np.array(altitude, dtype=np.float64)
+        position -= self.minimum
+        position /= self.step
+        np.clip(position, 0, len(self.densities) - 1, out=position)
+        index: np.ndarray = position.astype(np.intp)
+        position -= index  # fraction between two table entries
+
+        values: Tuple[np.ndarray, ...] = ()
+        for table, slopes in zip((self.densities, self.pressures), self.slopes):
+            value: np.ndarray = slopes[index] * position
+            value += table[index]
+            values += (value,)
+        return values
+
+
+@functools.lru_cache(maxsize=8)
+def _isa_table(
+    minimum: float, maximum: float, step: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate the air densities and static pressures of the standard atmosphere from minimum to maximum altitude and their differences between neighbouring entries (0 after the last entry), the tables are cached and read-only.
+
+    Parameters:
+    - minimum (float): The lowest altitude [m].
+    - maximum (float): The highest altitude [m].
+    - step (float): The altitude step [m].
+
+    Returns:
+    - Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The air densities [kg/m^3], the static pressures [N/m^2] and the differences of both per step.
+    """
+    altitudes: np.ndarray = minimum + step * np.arange(
+        int(np.ceil((maximum - minimum) / step)) + 1
+    )
+    tables: Tuple[np.ndarray, ...] = Atmosphere.calculate_isa(altitudes)
+    tables += tuple(np.diff(table, append=table[-1]) for table in tables)
+    for table in tables:
+        table.flags.writeable = False
+    return tables
+
+
+# %%
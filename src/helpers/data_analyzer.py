@@ -1,16 +1,14 @@
 # %%
 
 import os
-import sys
+import numpy as np
 import pandas as pd
 from typing import Tuple
 
-# AI content (GitHub Copilot, 01/29/2024), verified and adapted by Nicolas Huber.
-src_directory: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
-sys.path.append(src_directory)
-
-import constants as constants
-import algorithms.angle_analyzer as angleanalyzer
+from .. import constants
+from ..algorithms import angle_analyzer as angleanalyzer
+from . import window_statistics as windowstatistics
+from . import data_storage as datastorage
 
 
 class DataAnalyzer:
@@ -21,29 +19,41 @@ class DataAnalyzer:
     - 1 = point lies on curve
     """
 
-    def __init__(self, csv_file_in: str, csv_file_out: str = None) -> None:
+    def __init__(
+        self,
+        csv_file_in: str = None,
+        csv_file_out: str = None,
+        data: pd.DataFrame = None,
+    ) -> None:
         """
         Initialize the DataAnalyzer object.
 
         Parameters:
-        - csv_file_in (str): The csv file containing the data to be analyzed.
+        - csv_file_in (str): The csv file containing the data to be analyzed, None if the data is passed in memory.
         - csv_file_out (str): The csv file to which the analyzed data will be exported.
+        - data (pd.DataFrame): The data to be analyzed, used instead of reading csv_file_in (e.g. the output of IGC2CSV.export_to_flight_analyzer_format).
 
         Returns:
         - None.
         """
+        if csv_file_in is None and data is None:
+            raise ValueError("Either csv_file_in or data must be given.")
+
         self.csv_file_in = csv_file_in
-        if csv_file_out is None:
+        self.data = data
+        if csv_file_out is None and csv_file_in is not None:
             self.csv_file_out = f"{os.path.splitext(csv_file_in)[0]}_analyzed.csv"
         else:
             self.csv_file_out = csv_file_out
 
-    def construct_angle_analyzer(self) -> angleanalyzer.AngleAnalyzer:
+    def construct_angle_analyzer(
+        self, rolling_regression: bool = False
+    ) -> angleanalyzer.AngleAnalyzer:
         """
         Construct the angle analyzer object.
 
         Parameters:
-        - None.
+        - rolling_regression (bool): Whether the linear regressions are derived from running sums.
 
         Returns:
         - AngleAnalyzer: The angle analyzer object.
@@ -54,20 +64,25 @@ class DataAnalyzer:
             constants.ANGLE_FUTURE_THRESHOLD,
             constants.ANGLE_THRESHOLD,
             constants.LINEAR_REGRESSION_THRESHOLD,
+            rolling_regression,
         )
         return AngleAnalyzer
 
-    def read_csv_data(self) -> pd.DataFrame:
+    def read_csv_data(self, file_format: str = None) -> pd.DataFrame:
         """
-        Read the csv file containing the data to be analyzed.
+        Read the file containing the data to be analyzed. If the data was passed in memory, it is returned without reading any file.
 
         Parameters:
-        - None.
+        - file_format (str): The format of the file (csv, feather or parquet), None to detect it from the extension of csv_file_in.
 
         Returns:
         - pd.DataFrame: The dataset to be analyzed.
         """
-        self.data = pd.read_csv(self.csv_file_in)
+        if self.csv_file_in is None:
+            return self.data
+        self.data = datastorage.DataStorage().read(
+            self.csv_file_in, file_format=file_format
+        )
         return self.data
 
     def process_data(
@@ -76,22 +91,66 @@ class DataAnalyzer:
         AngleAnalyzer: angleanalyzer.AngleAnalyzer,
         angle_past_threshold: int = constants.ANGLE_PAST_THRESHOLD,
         angle_future_threshold: int = constants.ANGLE_FUTURE_THRESHOLD,
+        WindowStatistics: windowstatistics.WindowStatistics = None,
     ) -> pd.DataFrame:
         """
-        Apply the AngleAnalyzer to every line of the dataset and append three new columns to the dataset: status, position_str, and position_int
+        Apply the AngleAnalyzer to every line of the dataset and append three new columns to the dataset: status, position_str, and position_int. The windows of all lines are evaluated at once using vectorized operations.
 
         Parameters:
         - data (pd.DataFrame): The dataset to be analyzed.
         - AngleAnalyzer (angleanalyzer.AngleAnalyzer): The AngleAnalyzer object.
         - angle_past_threshold (int): The number of past coordinates to be considered.
         - angle_future_threshold (int): The number of future coordinates to be considered.
+        - WindowStatistics (windowstatistics.WindowStatistics): The window analyses of the dataset to be reused, if None they are calculated for this call only.
 
         Returns:
         - pd.DataFrame: The dataset with the new columns.
         """
+        indices: np.ndarray = np.arange(
+            angle_past_threshold, max(len(data) - angle_future_threshold, 0)
+        )
+        past_windows: np.ndarray = indices - angle_past_threshold + 1
+        future_windows: np.ndarray = indices
 
-        data_processed = pd.DataFrame(
-            columns=[
+        if WindowStatistics is None:
+            WindowStatistics = windowstatistics.WindowStatistics(
+                data=data, AngleAnalyzer=AngleAnalyzer
+            )
+
+        status_angle_past, regression_past = WindowStatistics.analyze_window(
+            window=angle_past_threshold
+        )
+        status_angle_future, regression_future = WindowStatistics.analyze_window(
+            window=angle_future_threshold
+        )
+        status_angle_past = status_angle_past[past_windows]
+        status_angle_future = status_angle_future[future_windows]
+        (
+            status_regression_past,
+            _,
+            _,
+            r_value_past,
+            p_value_past,
+            std_err_past,
+        ) = (values[past_windows] for values in regression_past)
+        (
+            status_regression_future,
+            _,
+            _,
+            r_value_future,
+            p_value_future,
+            std_err_future,
+        ) = (values[future_windows] for values in regression_future)
+
+        status: np.ndarray = AngleAnalyzer.analyze_window_data(
+            status_angle_past=status_angle_past,
+            status_regression_past=status_regression_past,
+            status_angle_future=status_angle_future,
+            status_regression_future=status_regression_future,
+        )
+
+        data_processed: pd.DataFrame = data[
+            [
                 "timestamp [UTC]",
                 "relative altitude [m]",
                 "horizontal velocity [m/s]",
@@ -99,97 +158,46 @@ class DataAnalyzer:
                 "distance to takeoff [km]",
                 "longitude",
                 "latitude",
-                "status",
-                "position_str",
-                "position_int",
-                "average_r_value",
-                "average_p_value",
-                "average_std_err",
             ]
+        ].iloc[indices]
+        data_processed.index = indices
+
+        # object columns keep the python types (bool, str, int) of the constants.INDEX_* tuples
+        data_processed = data_processed.assign(
+            **{
+                "status": np.where(
+                    status, constants.INDEX_STRAIGHT_LINE[0], constants.INDEX_CURVE[0]
+                ).astype(object),
+                "position_str": np.where(
+                    status, constants.INDEX_STRAIGHT_LINE[1], constants.INDEX_CURVE[1]
+                ).astype(object),
+                "position_int": np.where(
+                    status, constants.INDEX_STRAIGHT_LINE[2], constants.INDEX_CURVE[2]
+                ).astype(object),
+                "average_r_value": (r_value_past + r_value_future) / 2,
+                "average_p_value": (p_value_past + p_value_future) / 2,
+                "average_std_err": (std_err_past + std_err_future) / 2,
+            }
         )
 
-        for i in range(angle_past_threshold, len(data) - angle_future_threshold):
-            latest_coordinates = AngleAnalyzer.extract_latest_coordinates(
-                df=data, i=i, angle_past_threshold=angle_past_threshold
-            )
-            future_coordinates = AngleAnalyzer.extract_future_coordinates(
-                df=data, i=i, angle_future_threshold=angle_future_threshold
-            )
-
-            angles_past: pd.DataFrame = AngleAnalyzer.cut_zero_angles(
-                df=AngleAnalyzer.calculate_angles(df=latest_coordinates)
-            )
-            angles_future: pd.DataFrame = AngleAnalyzer.cut_zero_angles(
-                df=AngleAnalyzer.calculate_angles(df=future_coordinates)
-            )
-
-            status_angle_past: bool = AngleAnalyzer.analyze_angles(angles=angles_past)
-            status_angle_future: bool = AngleAnalyzer.analyze_angles(
-                angles=angles_future
-            )
-            (
-                status_regression_past,
-                slope_past,
-                intercept_past,
-                r_value_past,
-                p_value_past,
-                std_err_past,
-            ) = AngleAnalyzer.analyze_linear_regression(df=latest_coordinates)
-            (
-                status_regression_future,
-                slope_future,
-                intercept_future,
-                r_value_future,
-                p_value_future,
-                std_err_future,
-            ) = AngleAnalyzer.analyze_linear_regression(df=future_coordinates)
-
-            status: Tuple[bool, str, int] = AngleAnalyzer.analyze_data(
-                status_angle_past=status_angle_past,
-                status_regression_past=status_regression_past,
-                status_angle_future=status_angle_future,
-                status_regression_future=status_regression_future,
-            )
-
-            data_processed.loc[i, "timestamp [UTC]"] = data.iloc[i]["timestamp [UTC]"]
-            data_processed.loc[i, "relative altitude [m]"] = data.iloc[i][
-                "relative altitude [m]"
-            ]
-            data_processed.loc[i, "horizontal velocity [m/s]"] = data.iloc[i][
-                "horizontal velocity [m/s]"
-            ]
-            data_processed.loc[i, "vertical velocity [m/s]"] = data.iloc[i][
-                "vertical velocity [m/s]"
-            ]
-            data_processed.loc[i, "distance to takeoff [km]"] = data.iloc[i][
-                "distance to takeoff [km]"
-            ]
-            data_processed.loc[i, "longitude"] = data.iloc[i]["longitude"]
-            data_processed.loc[i, "latitude"] = data.iloc[i]["latitude"]
-            data_processed.loc[i, "status"] = status[0]
-            data_processed.loc[i, "position_str"] = status[1]
-            data_processed.loc[i, "position_int"] = status[2]
-            data_processed.loc[i, "average_r_value"] = (
-                r_value_past + r_value_future
-            ) / 2
-            data_processed.loc[i, "average_p_value"] = (
-                p_value_past + p_value_future
-            ) / 2
-            data_processed.loc[i, "average_std_err"] = (
-                std_err_past + std_err_future
-            ) / 2
-
         return data_processed
 
-    def export_to_csv(self, data_processed: pd.DataFrame) -> None:
+    def export_to_csv(
+        self, data_processed: pd.DataFrame, file_format: str = None
+    ) -> None:
         """
-        Export the processed data to a new csv file.
+        Export the processed data to a new file.
 
         Parameters:
         - data_processed (pd.DataFrame): The processed data.
+        - file_format (str): The format of the file (csv, feather or parquet), the extension of csv_file_out is replaced accordingly. None to detect it from the extension of csv_file_out.
 
         Returns:
         - None.
         """
-        data_processed.to_csv(self.csv_file_out, index=False)
-        print(f"Data exported to {self.csv_file_out}")
+        Storage: datastorage.DataStorage = datastorage.DataStorage()
+        file_out: str = self.csv_file_out
+        if file_format is not None:
+            file_out = Storage.replace_extension(file_out, file_format)
+        Storage.write(data_processed, file_out, file_format=file_format)
+        print(f"Data exported to {file_out}")
@@ -0,0 +1,113 @@
+# %%
+
+import os
+import pandas as pd
+from typing import Dict
+
+
+class DataStorage:
+    """
+    Class to read and write the datasets of the flight-analyzer as csv, Feather (Arrow IPC) or Parquet files. Feather and Parquet files keep the types of the columns, so floats and timestamps do not have to be parsed from text again, and Feather files are read memory-mapped. Feather and Parquet require the optional dependency pyarrow.
+
+    To use this class the following code snippet can be used:
+
+    Storage: DataStorage = DataStorage()
+    Storage.write(data, "flight.feather")
+    data = Storage.read("flight.feather")
+    """
+
+    # file extension of every format, the first extension is used for new files
+    FORMATS: Dict[str, tuple] = {
+        "csv": (".csv",),
+        "feather": (".feather", ".arrow", ".ipc"),
+        "parquet": (".parquet", ".pq"),
+    }
+
+    def __init__(self) -> None:
+        pass
+
+    def detect_format(self, path: str, file_format: str = None) -> str:
+        """
+        Get the format of a file, either the given format or the format of its extension.
+
+        Parameters:
+        - path (str): The path to the file.
+        - file_format (str): The format of the file (csv, feather or parquet), None to detect it from the extension (csv if unknown).
+
+        Returns:
+        - str: The format of the file.
+        """
+        if file_format is not None:
+            if file_format not in self.FORMATS:
+                raise ValueError(
+                    f"Unknown file format: {file_format}, use one of {', '.join(self.FORMATS)}."
+                )
+            return file_format
+
+        extension: str = os.path.splitext(path)[1].lower()
+        for name, extensions in self.FORMATS.items():
+            if extension in extensions:
+                return name
+        return "csv"
+
+    def replace_extension(self, path: str, file_format: str) -> str:
+        """
+        Replace the extension of a path by the extension of a format.
+
+        Parameters:
+        - path (str): The path to the file.
+        - file_format (str): The format of the file (csv, feather or parquet).
+
+        Returns:
+        - str: The path with the extension of the format.
+        """
+        return f"{os.path.splitext(path)[0]}{self.FORMATS[self.detect_format(path, file_format)][0]}"
+
+    def read(
+        self, path: str, file_format: str = None, memory_map: bool = True
+    ) -> pd.DataFrame:
+        """
+        Read a dataset.
+
+        Parameters:
+        - path (str): The path to the file.
+        - file_format (str): The format of the file (csv, feather or parquet), None to detect it from the extension.
+        - memory_map (bool): Whether Feather and Parquet files are memory-mapped instead of read into a buffer.
+
+        Returns:
+        - pd.DataFrame: The dataset.
+        """
+        file_format = self.detect_format(path, file_format)
+        if file_format == "feather":
+            import pyarrow.feather as feather
+
+            return feather.read_table(path, memory_map=memory_map).to_pandas()
+        if file_format == "parquet":
+            import pyarrow.parquet as parquet
+
+            return parquet.read_table(path, memory_map=memory_map).to_pandas()
+        return pd.read_csv(path)
+
+    def write(self, data: pd.DataFrame, path: str, file_format: str = None) -> None:
+        """
+        Write a dataset, the index is not written.
+
+        Parameters:
+        - data (pd.DataFrame): The dataset.
+        - path (str): The path to the file.
+        - file_format (str): The format of the file (csv, feather or parquet), None to detect it from the extension.
+
+        Returns:
+        - None.
+        """
+        file_format = self.detect_format(path, file_format)
+        if file_format == "feather":
+            # uncompressed files can be memory-mapped without decompressing them
+            data.reset_index(drop=True).to_feather(path, compression="uncompressed")
+        elif file_format == "parquet":
+            data.to_parquet(path, index=False)
+        else:
+            data.to_csv(path, index=False)
+
+
+# %%
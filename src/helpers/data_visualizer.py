@@ -1,30 +1,140 @@
+import os
+import functools
 import numpy as np
 import pandas as pd
-from typing import Tuple
-import matplotlib.pyplot as plt
-from scipy.integrate import simps
-from scipy.stats import linregress
-from scipy.interpolate import interp1d
-from scipy.interpolate import CubicSpline
-from matplotlib.colors import ListedColormap
+from typing import Any, Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .. import constants
+from . import track_decimator as trackdecimator
+from . import model_fit_cache as modelfitcache
+from . import deviation_metrics as deviationmetrics
+from . import lazy_module as lazymodule
+
+plt = lazymodule.LazyModule("matplotlib.pyplot")
+mcolors = lazymodule.LazyModule("matplotlib.colors")
+stats = lazymodule.LazyModule("scipy.stats")
+interpolate = lazymodule.LazyModule("scipy.interpolate")
 
 
 class DataVisualizer:
     """
     Class to visualize data generated using the AngleAnalyzer class, which can be found in the src/algorithms/angle_analyzer.py file.
+
+    If an output_path is given, the plots are rendered headless: every plot is drawn on the same reused figure and written to a file in the output directory instead of being shown, e.g. for batch jobs on machines without a display:
+
+    Visualizer = DataVisualizer(output_path="path/to/plots", file_format="svg")
+    Visualizer.visualize_altitude(df=data)  # writes path/to/plots/altitude.svg
+    Visualizer.render_batch(jobs=[("flight_1_altitude", "visualize_altitude", {"df": data})])
     """
 
-    def __init__(self, output_path: str = None) -> None:
+    FIGURE_NUMBER: str = "flight-analyzer"  # pyplot number of the reused figure of the headless mode
+
+    def __init__(self, output_path: str = None, file_format: str = "png", max_points: int = constants.PLOT_MAX_POINTS) -> None:
         """
         Initialize the DataVisualizer object.
 
         Parameters:
-        - output_path (str): The path to the output directory.
+        - output_path (str): The path to the output directory, None to show the plots instead of writing them to files.
+        - file_format (str): The format of the written plots (e.g. png or svg).
+        - max_points (int): The maximum number of plotted points of a tracklog, longer tracklogs are decimated (see TrackDecimator), None plots every point.
 
         Returns:
         - None.
         """
         self.output_path = output_path
+        self.file_format: str = file_format
+        self.file_name: str = None  # file name of the next plot, None to use the name of the plot
+        self.files: List[str] = []
+        self.decimator: trackdecimator.TrackDecimator = trackdecimator.TrackDecimator(max_points=max_points)
+        self.fits: modelfitcache.ModelFitCache = modelfitcache.ModelFitCache()  # fitted curves shared by the plots and the deviation metrics
+        self.metrics: deviationmetrics.DeviationMetrics = deviationmetrics.DeviationMetrics(fits=self.fits)
+        if output_path is not None:
+            os.makedirs(output_path, exist_ok=True)
+
+    def create_figure(self) -> "plt.Figure":
+        """
+        Creates the figure of a plot, the headless mode clears and reuses one figure instead of creating a new one per plot.
+
+        Parameters:
+        - None
+
+        Returns:
+        - The figure
+        """
+        if self.output_path is None:
+            return plt.figure(figsize=(12, 6))
+        return plt.figure(num=self.FIGURE_NUMBER, figsize=(12, 6), clear=True)
+
+    def show(self, fig: "plt.Figure", name: str) -> None:
+        """
+        Shows a plot, or writes it to the output directory in the headless mode.
+
+        Parameters:
+        - fig: the figure of the plot
+        - name: the name of the plot, used as file name unless file_name is set
+
+        Returns:
+        - None
+        """
+        if self.output_path is None:
+            plt.show()
+            return
+
+        path: str = os.path.join(self.output_path, f"{self.file_name or name}.{self.file_format}")
+        fig.savefig(path, format=self.file_format, facecolor=fig.get_facecolor())
+        self.files.append(path)
+        self.file_name = None
+
+    def render(self, file_name: str, method: str, kwargs: Dict[str, Any]) -> str:
+        """
+        Renders a single plot to a file in the output directory.
+
+        Parameters:
+        - file_name: the file name of the plot without extension
+        - method: the name of the visualize method, e.g. visualize_altitude
+        - kwargs: the keyword arguments of the visualize method
+
+        Returns:
+        - The path to the written file
+        """
+        if self.output_path is None:
+            raise ValueError("Rendering plots to files requires an output_path.")
+
+        files: int = len(self.files)
+        self.file_name = file_name
+        try:
+            getattr(self, method)(**kwargs)
+        finally:
+            self.file_name = None  # a failed plot must not pass its file name on to the next plot
+        if len(self.files) == files:
+            raise ValueError(f"{method} did not write a plot.")
+        return self.files[-1]
+
+    def render_batch(self, jobs: List[Tuple[str, str, Dict[str, Any]]], workers: int = constants.RENDER_WORKERS) -> List[str]:
+        """
+        Renders many plots to files in the output directory, e.g. the report plots of hundreds of flights. The plots are distributed to worker processes that render them with the Agg backend.
+
+        Parameters:
+        - jobs: the plots as tuples of file name, name of the visualize method and keyword arguments (see render)
+        - workers: the number of worker processes, 1 renders the plots in the current process
+
+        Returns:
+        - The paths to the written files, in the order of the jobs
+        """
+        if self.output_path is None:
+            raise ValueError("Rendering plots to files requires an output_path.")
+        if workers <= 1 or len(jobs) <= 1:
+            return [self.render(*job) for job in jobs]
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker) as executor:
+            return list(
+                executor.map(
+                    _render_worker,
+                    [(self.output_path, self.file_format, self.decimator.max_points, job) for job in jobs],
+                    chunksize=max(1, len(jobs) // (4 * workers)),
+                )
+            )
 
     def visualize_points_2d(
         self, df: pd.DataFrame, relative: int = 0, linear: bool = False, title: str = ""
@@ -41,9 +151,10 @@ class DataVisualizer:
         Returns:
         - None
         """
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
-        plt.scatter(df["longitude"], df["latitude"], s=1)
+        points: pd.DataFrame = self.decimator.decimate(df, x="longitude", y="latitude")
+        plt.scatter(points["longitude"], points["latitude"], s=1)
 
         if relative != 0:
             plt.plot(
@@ -61,7 +172,7 @@ class DataVisualizer:
 
         # AI content (GitHub Copilot, 01/29/2024), verified and adapted by Nicolas Huber.
         if linear:
-            slope, intercept, r_value, p_value, std_err = linregress(
+            slope, intercept, r_value, p_value, std_err = stats.linregress(
                 df["longitude"], df["latitude"]
             )
             abline_values = [slope * i + intercept for i in df["longitude"]]
@@ -82,7 +193,7 @@ class DataVisualizer:
         else:
             plt.title(f"Punktvariation mit linearer Regression ({title})")
 
-        plt.show()
+        self.show(fig, "points_2d")
 
     # AI content (GitHub Copilot, 01/29/2024), verified and adapted by Nicolas Huber.
     def visualize_points_colored(self, df: pd.DataFrame, relative=0) -> None:
@@ -96,13 +207,14 @@ class DataVisualizer:
         Returns:
         - None
         """
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
 
+        points: pd.DataFrame = self.decimator.decimate(df, x="longitude", y="latitude")
         scatter = plt.scatter(
-            df["longitude"],
-            df["latitude"],
-            c=df["relative altitude [m]"],
+            points["longitude"],
+            points["latitude"],
+            c=points["relative altitude [m]"],
             s=1,
             cmap="jet",
         )
@@ -128,7 +240,7 @@ class DataVisualizer:
         plt.ylabel("Breitengrad")
         plt.title("Punktvariation mit relativer Höhe")
 
-        plt.show()
+        self.show(fig, "points_colored")
 
     def visualize_altitude(self, df: pd.DataFrame) -> None:
         """
@@ -140,16 +252,17 @@ class DataVisualizer:
         Returns:
         - None
         """
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
 
-        plt.plot(df.index, df["relative altitude [m]"], label="Höhe")
+        points: pd.DataFrame = self.decimator.decimate(df, x=None, y="relative altitude [m]")
+        plt.plot(points.index, points["relative altitude [m]"], label="Höhe")
 
         plt.xlabel("Index [n]")
         plt.ylabel("Höhe [m]")
         plt.title("Höhenvariation")
         plt.legend(loc="upper right")
-        plt.show()
+        self.show(fig, "altitude")
 
     def visualize_angles(
         self, past_angles: pd.DataFrame, future_angles: pd.DataFrame
@@ -167,7 +280,7 @@ class DataVisualizer:
         len_past_angles = len(past_angles)
         past_angles.drop(past_angles.index[-1], inplace=True)
 
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
 
         plt.plot(
@@ -197,7 +310,7 @@ class DataVisualizer:
         plt.title("Winkelvariation")
         plt.legend(loc="upper right")
 
-        plt.show()
+        self.show(fig, "angles")
 
     # AI content (ChatGPT, 02/08/2024), verified and adapted by Nicolas Huber.
     def visualize_points_position(self, data: pd.DataFrame) -> None:
@@ -212,14 +325,15 @@ class DataVisualizer:
         """
 
         colors = ["green", "purple"]
-        custom_cmap = ListedColormap(colors)
+        custom_cmap = mcolors.ListedColormap(colors)
 
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
+        points: pd.DataFrame = self.decimator.decimate(data, x="longitude", y="latitude", category="position_int")
         plt.scatter(
-            data["longitude"],
-            data["latitude"],
-            c=data["position_int"],
+            points["longitude"],
+            points["latitude"],
+            c=points["position_int"],
             cmap=custom_cmap,
             s=1,
         )
@@ -251,7 +365,7 @@ class DataVisualizer:
             ]
         )
 
-        plt.show()
+        self.show(fig, "points_position")
 
     # AI content (ChatGPT, 02/08/2024), verified and adapted by Nicolas Huber.
     def visualize_optimization_linear_regression(self, data: pd.DataFrame) -> None:
@@ -264,7 +378,7 @@ class DataVisualizer:
         Returns:
         - None
         """
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
         plt.plot(data["score"], data["average_r_value"], label="r_value")
         plt.plot(data["score"], data["average_p_value"], label="p_value")
@@ -273,7 +387,7 @@ class DataVisualizer:
         plt.ylabel("Wert")
         plt.title("Optimierung der Thresholds")
         plt.legend(loc="lower right")
-        plt.show()
+        self.show(fig, "optimization_linear_regression")
 
     # AI content (ChatGPT, 02/08/2024), verified and adapted by Nicolas Huber.
     def visualize_optimization_score(self, data: pd.DataFrame) -> None:
@@ -286,7 +400,7 @@ class DataVisualizer:
         Returns:
         - None
         """
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
 
         plt.scatter(
@@ -305,7 +419,7 @@ class DataVisualizer:
         plt.title("Score in Abhängigkeit der Thresholds")
         plt.legend(loc="lower right")
 
-        plt.show()
+        self.show(fig, "optimization_score")
 
     # AI content (ChatGPT, 02/08/2024), verified and adapted by Nicolas Huber.
     def visualize_optimization_rvalues(self, data: pd.DataFrame) -> None:
@@ -318,7 +432,7 @@ class DataVisualizer:
         Returns:
         - None
         """
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
 
         plt.scatter(
@@ -337,7 +451,7 @@ class DataVisualizer:
         plt.title("r_value in Abhängigkeit der Thresholds")
         plt.legend(loc="lower right")
 
-        plt.show()
+        self.show(fig, "optimization_rvalues")
 
     # AI content (ChatGPT, 02/08/2024), verified and adapted by Nicolas Huber.
     def visualize_optimization_pvalues(self, data: pd.DataFrame) -> None:
@@ -350,7 +464,7 @@ class DataVisualizer:
         Returns:
         - None
         """
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
 
         plt.scatter(
@@ -369,7 +483,7 @@ class DataVisualizer:
         plt.title("p_value in Abhängigkeit der Thresholds")
         plt.legend(loc="lower right")
 
-        plt.show()
+        self.show(fig, "optimization_pvalues")
 
     # AI content (ChatGPT, 02/08/2024), verified and adapted by Nicolas Huber.
     def visualize_optimization_stderrs(self, data: pd.DataFrame) -> None:
@@ -382,7 +496,7 @@ class DataVisualizer:
         Returns:
         - None
         """
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
 
         plt.scatter(
@@ -401,7 +515,7 @@ class DataVisualizer:
         plt.title("std_error in Abhängigkeit der Thresholds")
         plt.legend(loc="lower right")
 
-        plt.show()
+        self.show(fig, "optimization_stderrs")
 
     # AI content (ChatGPT, 02/10/2024), verified and adapted by Nicolas Huber.
     def visualize_score_by_data_loss(self, data: pd.DataFrame, index: int) -> None:
@@ -416,7 +530,8 @@ class DataVisualizer:
         Returns:
         - None
         """
-        fig, ax1 = plt.subplots(figsize=(12, 6))
+        fig = self.create_figure()
+        ax1 = fig.add_subplot()
         fig.set_facecolor("#F2F2F2")
 
         ax1.plot(data.index, data["score"], label="Score", color="green")
@@ -448,7 +563,7 @@ class DataVisualizer:
 
         plt.title("Score und Datenverlust")
         plt.legend(handles, labels)
-        plt.show()
+        self.show(fig, "score_by_data_loss")
 
     def visualize_data_distribution(self, speed_data: pd.DataFrame) -> None:
         """
@@ -460,7 +575,7 @@ class DataVisualizer:
         Returns:
         - None
         """
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
 
         unique_speeds, counts = np.unique(speed_data['horizontal velocity [m/s]'], return_counts=True)
@@ -472,7 +587,7 @@ class DataVisualizer:
 
         plt.grid(True)
         plt.legend()
-        plt.show()
+        self.show(fig, "data_distribution")
 
     def visualize_raw_speed_data(
         self,
@@ -493,26 +608,21 @@ class DataVisualizer:
         Returns:
         - None
         """
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
 
         ax1 = fig.add_subplot(111)
 
         # experimental data
-        sorted_horizontal_experimental: pd.Series = experimental_data[
-            "horizontal velocity [m/s]"
-        ].sort_values()
-        sorted_vertical_experimental: pd.Series = experimental_data[
-            "vertical velocity [m/s]"
-        ].loc[sorted_horizontal_experimental.index]
-
-        cs_experimental: CubicSpline = CubicSpline(
-            sorted_horizontal_experimental, sorted_vertical_experimental
+        horizontal_experimental: pd.Series = experimental_data["horizontal velocity [m/s]"]
+
+        cs_experimental: interpolate.CubicSpline = self.fits.spline(
+            experimental_data, "horizontal velocity [m/s]", "vertical velocity [m/s]"
         )
 
         x_values_experimental: np.ndarray = np.linspace(
-            sorted_horizontal_experimental.min(),
-            sorted_horizontal_experimental.max(),
+            horizontal_experimental.min(),
+            horizontal_experimental.max(),
             100,
         )
 
@@ -536,14 +646,8 @@ class DataVisualizer:
         )
 
         # polynomial fit for experimental data (2nd degree)
-        coefficients = np.polyfit(
-            sorted_horizontal_experimental, sorted_vertical_experimental, 2
-        )
-        polynomial = np.poly1d(coefficients)
-        x_values_experimental = np.linspace(
-            sorted_horizontal_experimental.min(),
-            sorted_horizontal_experimental.max(),
-            100,
+        polynomial = self.fits.polynomial(
+            experimental_data, "horizontal velocity [m/s]", "vertical velocity [m/s]", 2
         )
         ax1.plot(
             x_values_experimental,
@@ -553,16 +657,12 @@ class DataVisualizer:
         )
 
         # cubic spline interpolation for theoretical data
-        sorted_theoretical = theoretical_data.sort_values(
-            by="horizontal velocity [m/s]"
-        )
-        cs_theoretical = CubicSpline(
-            sorted_theoretical["horizontal velocity [m/s]"],
-            sorted_theoretical["vertical velocity [m/s]"],
+        cs_theoretical = self.fits.spline(
+            theoretical_data, "horizontal velocity [m/s]", "vertical velocity [m/s]"
         )
         x_values_theoretical = np.linspace(
-            sorted_theoretical["horizontal velocity [m/s]"].min(),
-            sorted_theoretical["horizontal velocity [m/s]"].max(),
+            theoretical_data["horizontal velocity [m/s]"].min(),
+            theoretical_data["horizontal velocity [m/s]"].max(),
             100,
         )
         ax1.plot(
@@ -592,7 +692,7 @@ class DataVisualizer:
         ax2.set_xticklabels([f"{kmph:.1f} km/h" for kmph in kmph_ticks])
         ax2.set_xlim(ax1.get_xlim())  
         
-        plt.show()
+        self.show(fig, "raw_speed_data")
 
     def visualize_speed_deviation(
         self,
@@ -608,29 +708,21 @@ class DataVisualizer:
         - experimental_data: the DataFrame containing the experimental speed data
         - theoretical_data: the DataFrame containing the theoretical speed data
         - title: the title of the plot
-        - speed_analyzer: the SpeedAnalyzer object
+        - speed_analyzer: the SpeedAnalyzer object (not used anymore, the deviation is calculated by DeviationMetrics.speed_deviation)
 
         Returns:
         - Tuple[float, float, float, float]: mean_deviation, max_deviation, rms_deviation, area
         """
-        fig: plt.Figure = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
 
         # experimental data
-        sorted_horizontal_experimental = experimental_data[
-            "horizontal velocity [m/s]"
-        ].sort_values()
-        sorted_vertical_experimental = experimental_data["vertical velocity [m/s]"].loc[
-            sorted_horizontal_experimental.index
-        ]
-
-        coefficients = np.polyfit(
-            sorted_horizontal_experimental, sorted_vertical_experimental, 2
+        polynomial = self.fits.polynomial(
+            experimental_data, "horizontal velocity [m/s]", "vertical velocity [m/s]", 2
         )
-        polynomial = np.poly1d(coefficients)
         x_values_experimental = np.linspace(
-            sorted_horizontal_experimental.min(),
-            sorted_horizontal_experimental.max(),
+            experimental_data["horizontal velocity [m/s]"].min(),
+            experimental_data["horizontal velocity [m/s]"].max(),
             100,
         )
 
@@ -642,16 +734,12 @@ class DataVisualizer:
         )
 
         # theoretical data
-        sorted_theoretical = theoretical_data.sort_values(
-            by="horizontal velocity [m/s]"
-        )
-        cs_theoretical = CubicSpline(
-            sorted_theoretical["horizontal velocity [m/s]"],
-            sorted_theoretical["vertical velocity [m/s]"],
+        cs_theoretical = self.fits.spline(
+            theoretical_data, "horizontal velocity [m/s]", "vertical velocity [m/s]"
         )
         x_values_theoretical = np.linspace(
-            sorted_theoretical["horizontal velocity [m/s]"].min(),
-            sorted_theoretical["horizontal velocity [m/s]"].max(),
+            theoretical_data["horizontal velocity [m/s]"].min(),
+            theoretical_data["horizontal velocity [m/s]"].max(),
             100,
         )
 
@@ -662,39 +750,20 @@ class DataVisualizer:
             label="Theoretische Geschwindigkeitspolare",
         )
 
-        # deviation area
-        intersection_x = x_values_experimental
-        intersection_y = polynomial(x_values_experimental)
-        experimental_mask = (x_values_experimental >= 8) & (x_values_experimental <= 16)
-        theoretical_mask = (x_values_theoretical >= 8) & (x_values_theoretical <= 16)
-
-        area = simps(
-            speed_analyzer.absolute_difference(
-                x_values_experimental[experimental_mask],
-                polynomial(x_values_experimental[experimental_mask]),
-                x_values_theoretical[theoretical_mask],
-                cs_theoretical(x_values_theoretical[theoretical_mask]),
-            ),
-            x_values_experimental[experimental_mask],
+        # deviation area and metrics
+        mean_deviation, max_deviation, rms_deviation, area = self.metrics.speed_deviation(
+            experimental_data, theoretical_data
         )
 
         plt.fill_between(
-            intersection_x,
-            intersection_y,
-            cs_theoretical(intersection_x),
+            x_values_experimental,
+            polynomial(x_values_experimental),
+            cs_theoretical(x_values_experimental),
             color="orange",
             alpha=0.5,
             label=f"Abweichungsbereich: {area:.2f}",
         )
 
-        # deviation metrics
-        deviations = np.abs(
-            polynomial(x_values_experimental) - cs_theoretical(x_values_experimental)
-        )
-        mean_deviation = np.mean(deviations)
-        max_deviation = np.max(deviations)
-        rms_deviation = np.sqrt(np.mean(deviations**2))
-
         plt.xlim(8.0, 15.7)
         plt.ylim(-2.75, -0.4)
 
@@ -703,7 +772,7 @@ class DataVisualizer:
         plt.ylabel("Vertikalgeschwindigkeit [m/s]")
         plt.grid(True)
         plt.legend()
-        plt.show()
+        self.show(fig, "speed_deviation")
 
         return mean_deviation, max_deviation, rms_deviation, area
 
@@ -725,13 +794,11 @@ class DataVisualizer:
         Returns:
         - None
         """
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
 
-        airspeed: pd.Series = theoretical_data["airspeed [m/s]"].sort_values()
-        c_value: pd.Series = theoretical_data[key].loc[airspeed.index]
-
-        cs: CubicSpline = CubicSpline(airspeed, c_value)
+        airspeed: pd.Series = theoretical_data["airspeed [m/s]"]
+        cs: interpolate.CubicSpline = self.fits.spline(theoretical_data, "airspeed [m/s]", key)
 
         x_values: np.ndarray = np.linspace(
             airspeed.min(),
@@ -757,7 +824,7 @@ class DataVisualizer:
         plt.ylabel("C-Wert [0.5]")
         plt.grid(True)
         plt.legend()
-        plt.show()
+        self.show(fig, "c_values_theoretical")
 
     # AI content (ChatGPT, 02/21/2024), verified and adapted by Nicolas Huber.
     def visualize_c_values(
@@ -779,7 +846,7 @@ class DataVisualizer:
         Returns:
         - None
         """
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
 
         # experimental data
@@ -794,18 +861,14 @@ class DataVisualizer:
         )
 
         # power-law trendline for experimental data
-        log_x = np.log10(x_exp)
-        log_y = np.log10(y_exp)
-        coeffs = np.polyfit(log_x, log_y, 1)
-        poly = np.poly1d(coeffs)
-        y_fit = lambda x: np.power(10, poly(np.log10(x)))
+        poly = self.fits.power_law(experimental_data, "horizontal velocity [m/s]", key)
+        coeffs = poly.coeffs
+        y_fit = lambda x: self.fits.power_law_values(poly, x)
         plt.plot(x_exp, y_fit(x_exp), "b-", label="Annäherung der c-Werte")
 
         # theoretical data
-        airspeed: pd.Series = theoretical_data["airspeed [m/s]"].sort_values()
-        c_value: pd.Series = theoretical_data[key].loc[airspeed.index]
-
-        cs: CubicSpline = CubicSpline(airspeed, c_value)
+        airspeed: pd.Series = theoretical_data["airspeed [m/s]"]
+        cs: interpolate.CubicSpline = self.fits.spline(theoretical_data, "airspeed [m/s]", key)
 
         x_values: np.ndarray = np.linspace(
             airspeed.min(),
@@ -831,7 +894,7 @@ class DataVisualizer:
         plt.ylabel("C-Wert [0.5]")
         plt.grid(True)
         plt.legend()
-        plt.show()
+        self.show(fig, "c_values")
 
     # AI content (ChatGPT, 02/21/2024), verified and adapted by Nicolas Huber.
     def visualize_c_values_deviation(
@@ -853,7 +916,7 @@ class DataVisualizer:
         Returns:
         - Tuple[float, float, float, float]: mean_deviation, max_deviation, rms_deviation, area
         """
-        fig: plt.Figure = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
 
         # experimental data
@@ -868,11 +931,9 @@ class DataVisualizer:
         )
 
         # power-law trendline for experimental data
-        log_x = np.log10(x_exp)
-        log_y = np.log10(y_exp)
-        coeffs = np.polyfit(log_x, log_y, 1)
-        poly = np.poly1d(coeffs)
-        y_fit = lambda x: np.power(10, poly(np.log10(x)))
+        poly = self.fits.power_law(experimental_data, "horizontal velocity [m/s]", key)
+        coeffs = poly.coeffs
+        y_fit = lambda x: self.fits.power_law_values(poly, x)
         plt.plot(x_exp, y_fit(x_exp), "b-", label="Annäherung der c-Werte")
 
         power_law_equation = f"c(x) = {10**coeffs[1]:.4f} * x^{coeffs[0]:.4f}"
@@ -886,10 +947,8 @@ class DataVisualizer:
         )
 
         # theoretical data
-        airspeed: pd.Series = theoretical_data["airspeed [m/s]"].sort_values()
-        c_value: pd.Series = theoretical_data[key].loc[airspeed.index]
-
-        cs: CubicSpline = CubicSpline(airspeed, c_value)
+        airspeed: pd.Series = theoretical_data["airspeed [m/s]"]
+        cs: interpolate.CubicSpline = self.fits.spline(theoretical_data, "airspeed [m/s]", key)
 
         x_values: np.ndarray = np.linspace(
             airspeed.min(),
@@ -904,33 +963,15 @@ class DataVisualizer:
             label=f"Theoretische C-Werte ({key})",
         )
 
-        # deviation area
-        intersection_x = x_exp
-        intersection_y = y_fit(x_exp)
-        experimental_mask = (x_exp >= 8) & (x_exp <= 16)
-        theoretical_mask = (x_values >= 8) & (x_values <= 16)
-
-        y_fit_func = interp1d(x_exp, y_fit(x_exp), fill_value="extrapolate")
-        y_fit_theoretical_mask = y_fit_func(x_values[theoretical_mask])
-
-        area = simps(
-            np.abs(y_fit_theoretical_mask - cs(x_values[theoretical_mask])),
-            x_values[theoretical_mask],
+        # deviation area and metrics
+        mean_deviation, max_deviation, rms_deviation, area = self.metrics.c_values_deviation(
+            experimental_data, theoretical_data, key
         )
 
-        # deviation metrics
-        y_fit_func = interp1d(x_exp, y_fit(x_exp), fill_value="extrapolate")
-        y_fit_all = y_fit_func(x_values)
-
-        deviations = np.abs(y_fit_all - cs(x_values))
-        mean_deviation = np.mean(deviations)
-        max_deviation = np.max(deviations)
-        rms_deviation = np.sqrt(np.mean(deviations**2))
-
         plt.fill_between(
-            intersection_x,
-            intersection_y,
-            cs(intersection_x),
+            x_exp,
+            y_fit(x_exp),
+            cs(x_exp),
             color="orange",
             alpha=0.5,
             label=f"Abweichungsbereich: {area:.2f}",
@@ -947,7 +988,7 @@ class DataVisualizer:
         plt.ylabel("c(x) [0.5]")
         plt.grid(True)
         plt.legend()
-        plt.show()
+        self.show(fig, "c_values_deviation")
 
         return mean_deviation, max_deviation, rms_deviation, area
 
@@ -969,7 +1010,7 @@ class DataVisualizer:
         Returns:
         - None
         """
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
 
         # experimental data
@@ -978,18 +1019,13 @@ class DataVisualizer:
         plt.scatter(x_exp, y_exp, color="grey", label="Experimenteller Staudruck", s=3)
 
         # match curve to experimental data
-        coefficients = np.polyfit(x_exp, y_exp, 2)
-        polynomial = np.poly1d(coefficients)
+        polynomial = self.fits.polynomial(experimental_data, "airspeed [m/s]", "dynamic pressure [N/m^2]", 2)
         x_values = np.linspace(x_exp.min(), x_exp.max(), 100)
         plt.plot(x_values, polynomial(x_values), color="blue", label="Annäherung des Staudrucks")
 
         # theoretical data
-        airspeed: pd.Series = theoretical_data["airspeed [m/s]"].sort_values()
-        pressure: pd.Series = theoretical_data["dynamic pressure [N/m^2]"].loc[
-            airspeed.index
-        ]
-
-        cs: CubicSpline = CubicSpline(airspeed, pressure)
+        airspeed: pd.Series = theoretical_data["airspeed [m/s]"]
+        cs: interpolate.CubicSpline = self.fits.spline(theoretical_data, "airspeed [m/s]", "dynamic pressure [N/m^2]")
 
         x_values: np.ndarray = np.linspace(
             airspeed.min(),
@@ -1004,7 +1040,7 @@ class DataVisualizer:
         plt.ylabel("Staudruck [N/m^2]")
         plt.grid(True)
         plt.legend()
-        plt.show()
+        self.show(fig, "pressure")
 
     # AI content (ChatGPT, 02/22/2024), verified and adapted by Nicolas Huber.
     def visualize_pressure_deviation(self, experimental_data, theoretical_data, title) -> Tuple[float, float, float, float]:
@@ -1019,26 +1055,20 @@ class DataVisualizer:
         Returns:
         - Tuple[float, float, float, float]: mean_deviation, max_deviation, rms_deviation, area
         """
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
 
         # experimental data
         x_exp = experimental_data["airspeed [m/s]"].sort_values()
-        y_exp = experimental_data["dynamic pressure [N/m^2]"]
 
         # match curve to experimental data
-        coefficients = np.polyfit(x_exp, y_exp, 2)
-        polynomial = np.poly1d(coefficients)
+        polynomial = self.fits.polynomial(experimental_data, "airspeed [m/s]", "dynamic pressure [N/m^2]", 2)
         x_values = np.linspace(x_exp.min(), x_exp.max(), 100)
         plt.plot(x_values, polynomial(x_values), color="blue", label="Annäherung des Staudrucks")
 
         # theoretical data
-        airspeed_theoretical = theoretical_data["airspeed [m/s]"].sort_values()
-        pressure_theoretical = theoretical_data["dynamic pressure [N/m^2]"].loc[
-            airspeed_theoretical.index
-        ]
-
-        cs: CubicSpline = CubicSpline(airspeed_theoretical, pressure_theoretical)
+        airspeed_theoretical = theoretical_data["airspeed [m/s]"]
+        cs: interpolate.CubicSpline = self.fits.spline(theoretical_data, "airspeed [m/s]", "dynamic pressure [N/m^2]")
 
         x_values_theoretical = np.linspace(
             airspeed_theoretical.min(),
@@ -1048,24 +1078,13 @@ class DataVisualizer:
 
         plt.plot(x_values_theoretical, cs(x_values_theoretical), color="green", label="Theoretischer Staudruck")
 
-        # deviation area
-        intersection_x = x_exp
-        intersection_y = polynomial(x_exp)
-        experimental_mask = (x_exp >= 8) & (x_exp <= 16)
-        theoretical_mask = (x_values_theoretical >= 8) & (x_values_theoretical <= 16)
-
-        y_fit = interp1d(x_exp, polynomial(x_exp), fill_value="extrapolate")
-        y_fit_theoretical_mask = y_fit(x_values_theoretical[theoretical_mask])
-
-        area = simps(
-            np.abs(y_fit_theoretical_mask - cs(x_values_theoretical[theoretical_mask])),
-            x=x_values_theoretical[theoretical_mask],
-        )
+        # deviation area and metrics
+        mean_deviation, max_deviation, rms_deviation, area = self.metrics.pressure_deviation(experimental_data, theoretical_data)
 
         plt.fill_between(
-            intersection_x,
-            intersection_y,
-            cs(intersection_x),
+            x_exp,
+            polynomial(x_exp),
+            cs(x_exp),
             color="orange",
             alpha=0.5,
             label=f"Abweichungsbereich: {area:.2f}",
@@ -1076,7 +1095,9 @@ class DataVisualizer:
         plt.ylabel("Staudruck [N/m^2]")
         plt.grid(True)
         plt.legend()
-        plt.show()
+        self.show(fig, "pressure_deviation")
+
+        return mean_deviation, max_deviation, rms_deviation, area
 
     # AI content (ChatGPT, 02/22/2024), verified and adapted by Nicolas Huber.
     def visualize_quality_deviation(self, deviation_data: pd.DataFrame, title: str) -> None:
@@ -1090,7 +1111,7 @@ class DataVisualizer:
         Returns:
         - None
         """
-        fig = plt.figure(figsize=(12, 6))
+        fig = self.create_figure()
         fig.set_facecolor("#F2F2F2")
 
         plt.plot(
@@ -1108,4 +1129,47 @@ class DataVisualizer:
         plt.xlabel("Anströmgeschwindigkeit [m/s]")
         plt.grid(True)
         plt.legend()
-        plt.show()
+        self.show(fig, "quality_deviation")
+
+
+def _init_render_worker() -> None:
+    """
+    Selects the non-interactive Agg backend in a worker process of DataVisualizer.render_batch.
+
+    Parameters:
+    - None
+
+    Returns:
+    - None
+    """
+    plt.switch_backend("Agg")
+
+
+@functools.lru_cache(maxsize=None)
+def _worker_visualizer(output_path: str, file_format: str, max_points: int) -> DataVisualizer:
+    """
+    Returns the DataVisualizer of a worker process, it is reused for all jobs so that the figure and the decimated tracklogs are reused as well.
+
+    Parameters:
+    - output_path: the path to the output directory
+    - file_format: the format of the written plots
+    - max_points: the maximum number of plotted points of a tracklog
+
+    Returns:
+    - The DataVisualizer object
+    """
+    return DataVisualizer(output_path=output_path, file_format=file_format, max_points=max_points)
+
+
+def _render_worker(task: Tuple[str, str, int, Tuple[str, str, Dict[str, Any]]]) -> str:
+    """
+    Renders a single plot of DataVisualizer.render_batch in a worker process.
+
+    Parameters:
+    - task: the output directory, the file format, the maximum number of plotted points and the job (see DataVisualizer.render)
+
+    Returns:
+    - The path to the written file
+    """
+    output_path, file_format, max_points, job = task
+    return _worker_visualizer(output_path, file_format, max_points).render(*job)
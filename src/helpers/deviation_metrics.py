@@ -0,0 +1,278 @@
+# %%
+
+import numpy as np
+import pandas as pd
+from typing import List, Tuple
+
+from . import model_fit_cache as modelfitcache
+from . import lazy_module as lazymodule
+
+integrate = lazymodule.LazyModule("scipy.integrate")
+interpolate = lazymodule.LazyModule("scipy.interpolate")
+
+
+def _simpson(y: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Integrate along the last axis with the Simpson rule, with scipy.integrate.simpson or, for SciPy versions without it, scipy.integrate.simps.
+
+    Parameters:
+    - y (np.ndarray): The values to integrate.
+    - x (np.ndarray): The x values.
+
+    Returns:
+    - np.ndarray: The integrals.
+    """
+    simpson = getattr(integrate, "simpson", None) or integrate.simps
+    return simpson(y, x=x, axis=-1)
+
+
+class DeviationMetrics:
+    """
+    Class to calculate the deviation between experimental and theoretical speed polars, c values and dynamic pressures without plotting them, e.g. for automated runs. The metrics are the same as the ones of the DataVisualizer.visualize_*_deviation methods (mean_deviation, max_deviation, rms_deviation, area), the first three are the stats of SpeedAnalyzer.score_stats and CAnalyzer.score_stats. Many experimental datasets can be compared to the same theoretical reference at once: the curves are fitted per dataset (and cached, see ModelFitCache), the evaluation on the 100 point grids, the metrics and the integration of the area are calculated for all datasets together. This module does not import matplotlib.
+
+    To use this class the following code snippet can be used:
+
+    Metrics = DeviationMetrics()
+    deviations = Metrics.speed_deviations(experimental_datasets=[flight_1, flight_2], theoretical_data=reference)  # one row per dataset
+    scores = [SpeedAnalyzer.score_stats(stats) for stats in deviations]
+    """
+
+    def __init__(self, fits: modelfitcache.ModelFitCache = None) -> None:
+        """
+        Initialize the DeviationMetrics object.
+
+        Parameters:
+        - fits (ModelFitCache): The cache of the fitted curves, e.g. the one of a DataVisualizer, None to create a new one.
+
+        Returns:
+        - None.
+        """
+        self.fits: modelfitcache.ModelFitCache = (
+            modelfitcache.ModelFitCache() if fits is None else fits
+        )
+
+    def speed_deviations(
+        self, experimental_datasets: List[pd.DataFrame], theoretical_data: pd.DataFrame
+    ) -> np.ndarray:
+        """
+        Calculate the deviation between the experimental speed polars (polynomials of 2nd degree) and the theoretical speed polar (cubic spline) on 100 points between the lowest and the highest experimental horizontal velocity of every dataset.
+
+        Parameters:
+        - experimental_datasets (List[pd.DataFrame]): The experimental speed data.
+        - theoretical_data (pd.DataFrame): The theoretical speed data.
+
+        Returns:
+        - np.ndarray: mean_deviation, max_deviation, rms_deviation and area per dataset, shape (datasets, 4).
+        """
+        x, y = "horizontal velocity [m/s]", "vertical velocity [m/s]"
+        coefficients: np.ndarray = np.array(
+            [
+                np.pad(self.fits.polynomial(data, x, y, 2).coeffs, (3, 0))[-3:]
+                for data in experimental_datasets
+            ]
+        ).reshape(-1, 3)
+        x_experimental: np.ndarray = np.linspace(
+            [data[x].min() for data in experimental_datasets],
+            [data[x].max() for data in experimental_datasets],
+            100,
+            axis=-1,
+        )
+        x_theoretical: np.ndarray = np.linspace(
+            theoretical_data[x].min(), theoretical_data[x].max(), 100
+        )
+        theoretical_mask: np.ndarray = (x_theoretical >= 8) & (x_theoretical <= 16)
+        spline = self.fits.spline(theoretical_data, x, y)
+
+        # polynomials of all datasets, evaluated with the Horner scheme like np.poly1d
+        fitted: np.ndarray = np.zeros_like(x_experimental)
+        for coefficient in coefficients.T:
+            fitted = fitted * x_experimental + coefficient[:, np.newaxis]
+
+        return self.metrics(
+            deviations=np.abs(fitted - spline(x_experimental)),
+            differences=np.abs(
+                fitted
+                - np.interp(
+                    x_experimental,
+                    x_theoretical[theoretical_mask],
+                    spline(x_theoretical[theoretical_mask]),
+                )
+            ),
+            x=x_experimental,
+            mask=(x_experimental >= 8) & (x_experimental <= 16),
+        )
+
+    def c_values_deviations(
+        self,
+        experimental_datasets: List[pd.DataFrame],
+        theoretical_data: pd.DataFrame,
+        key: str,
+    ) -> np.ndarray:
+        """
+        Calculate the deviation between the power laws of the experimental c values and the theoretical c values (cubic spline).
+
+        Parameters:
+        - experimental_datasets (List[pd.DataFrame]): The experimental c values.
+        - theoretical_data (pd.DataFrame): The theoretical c values.
+        - key (str): The column of the c values (either Ca [0.5] or Cw [0.5]).
+
+        Returns:
+        - np.ndarray: mean_deviation, max_deviation, rms_deviation and area per dataset, shape (datasets, 4).
+        """
+        x: str = "horizontal velocity [m/s]"
+        values: List[Tuple[np.ndarray, np.ndarray]] = []
+        for data in experimental_datasets:
+            x_values: np.ndarray = data[x].to_numpy()
+            fit: np.poly1d = self.fits.power_law(data, x, key)
+            values.append((x_values, self.fits.power_law_values(fit, x_values)))
+        return self.interpolated_deviations(
+            values,
+            self.fits.spline(theoretical_data, "airspeed [m/s]", key),
+            theoretical_data["airspeed [m/s]"],
+        )
+
+    def pressure_deviations(
+        self, experimental_datasets: List[pd.DataFrame], theoretical_data: pd.DataFrame
+    ) -> np.ndarray:
+        """
+        Calculate the deviation between the experimental dynamic pressures (polynomials of 2nd degree) and the theoretical dynamic pressure (cubic spline).
+
+        Parameters:
+        - experimental_datasets (List[pd.DataFrame]): The experimental pressure data.
+        - theoretical_data (pd.DataFrame): The theoretical pressure data.
+
+        Returns:
+        - np.ndarray: mean_deviation, max_deviation, rms_deviation and area per dataset, shape (datasets, 4).
+        """
+        x, y = "airspeed [m/s]", "dynamic pressure [N/m^2]"
+        values: List[Tuple[np.ndarray, np.ndarray]] = []
+        for data in experimental_datasets:
+            x_values: np.ndarray = np.sort(data[x].to_numpy())
+            values.append((x_values, self.fits.polynomial(data, x, y, 2)(x_values)))
+        return self.interpolated_deviations(
+            values, self.fits.spline(theoretical_data, x, y), theoretical_data[x]
+        )
+
+    def speed_deviation(
+        self, experimental_data: pd.DataFrame, theoretical_data: pd.DataFrame
+    ) -> Tuple[float, float, float, float]:
+        """
+        Calculate the deviation of a single experimental speed polar, see speed_deviations.
+
+        Parameters:
+        - experimental_data (pd.DataFrame): The experimental speed data.
+        - theoretical_data (pd.DataFrame): The theoretical speed data.
+
+        Returns:
+        - Tuple[float, float, float, float]: mean_deviation, max_deviation, rms_deviation, area
+        """
+        return tuple(self.speed_deviations([experimental_data], theoretical_data)[0])
+
+    def c_values_deviation(
+        self, experimental_data: pd.DataFrame, theoretical_data: pd.DataFrame, key: str
+    ) -> Tuple[float, float, float, float]:
+        """
+        Calculate the deviation of a single dataset of experimental c values, see c_values_deviations.
+
+        Parameters:
+        - experimental_data (pd.DataFrame): The experimental c values.
+        - theoretical_data (pd.DataFrame): The theoretical c values.
+        - key (str): The column of the c values (either Ca [0.5] or Cw [0.5]).
+
+        Returns:
+        - Tuple[float, float, float, float]: mean_deviation, max_deviation, rms_deviation, area
+        """
+        return tuple(
+            self.c_values_deviations([experimental_data], theoretical_data, key)[0]
+        )
+
+    def pressure_deviation(
+        self, experimental_data: pd.DataFrame, theoretical_data: pd.DataFrame
+    ) -> Tuple[float, float, float, float]:
+        """
+        Calculate the deviation of a single dataset of experimental dynamic pressures, see pressure_deviations.
+
+        Parameters:
+        - experimental_data (pd.DataFrame): The experimental pressure data.
+        - theoretical_data (pd.DataFrame): The theoretical pressure data.
+
+        Returns:
+        - Tuple[float, float, float, float]: mean_deviation, max_deviation, rms_deviation, area
+        """
+        return tuple(self.pressure_deviations([experimental_data], theoretical_data)[0])
+
+    def interpolated_deviations(
+        self,
+        values: List[Tuple[np.ndarray, np.ndarray]],
+        spline: object,
+        x_theoretical: pd.Series,
+    ) -> np.ndarray:
+        """
+        Calculate the deviation between fits evaluated at the experimental x values, interpolated linearly (and extrapolated), and a theoretical spline on 100 points between the lowest and the highest theoretical x value.
+
+        Parameters:
+        - values (List[Tuple[np.ndarray, np.ndarray]]): The experimental x values and the fit at these values per dataset.
+        - spline (CubicSpline): The theoretical spline.
+        - x_theoretical (pd.Series): The theoretical x values.
+
+        Returns:
+        - np.ndarray: mean_deviation, max_deviation, rms_deviation and area per dataset, shape (datasets, 4).
+        """
+        x_values: np.ndarray = np.linspace(
+            x_theoretical.min(), x_theoretical.max(), 100
+        )
+        fitted: np.ndarray = np.array(
+            [
+                interpolate.interp1d(x, y, fill_value="extrapolate")(x_values)
+                for x, y in values
+            ]
+        ).reshape(-1, 100)
+        deviations: np.ndarray = np.abs(fitted - spline(x_values))
+        return self.metrics(
+            deviations=deviations,
+            differences=deviations,
+            x=x_values,
+            mask=(x_values >= 8) & (x_values <= 16),
+        )
+
+    def metrics(
+        self,
+        deviations: np.ndarray,
+        differences: np.ndarray,
+        x: np.ndarray,
+        mask: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Calculate the mean, the maximum and the root mean square of the absolute deviations and integrate the area of the absolute differences in the masked range (8 to 16 m/s) with the Simpson rule, per dataset. If the datasets do not share the x values, the datasets with the same masked range are integrated together.
+
+        Parameters:
+        - deviations (np.ndarray): The absolute deviations per dataset, shape (datasets, points).
+        - differences (np.ndarray): The absolute differences that are integrated, shape (datasets, points).
+        - x (np.ndarray): The x values, shape (points,) if they are shared by all datasets or (datasets, points).
+        - mask (np.ndarray): The points that are integrated, same shape as x.
+
+        Returns:
+        - np.ndarray: mean_deviation, max_deviation, rms_deviation and area per dataset, shape (datasets, 4).
+        """
+        results: np.ndarray = np.empty((len(deviations), 4))
+        results[:, 0] = np.mean(deviations, axis=1)
+        results[:, 1] = np.max(deviations, axis=1)
+        results[:, 2] = np.sqrt(np.mean(deviations**2, axis=1))
+
+        if x.ndim == 1:
+            # contiguous rows are summed in the same order as a single dataset
+            results[:, 3] = _simpson(
+                np.ascontiguousarray(differences[:, mask]), x=x[mask]
+            )
+        elif len(x) > 0:
+            masks, groups = np.unique(mask, axis=0, return_inverse=True)
+            for group, group_mask in enumerate(masks):
+                rows: np.ndarray = groups.reshape(-1) == group
+                results[rows, 3] = _simpson(
+                    np.ascontiguousarray(differences[rows][:, group_mask]),
+                    x=np.ascontiguousarray(x[rows][:, group_mask]),
+                )
+        return results
+
+
+# %%
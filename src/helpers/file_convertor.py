@@ -2,7 +2,7 @@
 
 import re
 import pandas as pd
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 
 class FileConverter:
@@ -16,6 +16,17 @@ class FileConverter:
     To run this script use the execute_file_convertor.ipynb notebook in executor folder.
     """
 
+    # first coordinate pair of a WKT line string, e.g. LINESTRING Z (9.30435 47.154116 2289, ...)
+    WKT_PATTERN: str = r"\(\s*([^\s,()]+)\s+([^\s,()]+)"
+
+    # units of the columns in the 'name' column, e.g. 10:39:01 0m 0kmh 0m/s 0km
+    UNITS: Dict[str, str] = {
+        "altitude": "m",
+        "horizontal": "kmh",
+        "vertical": "m/s",
+        "distance": "km",
+    }
+
     def __init__(self, input_file: str, output_file: str) -> None:
         """
         Initializes the FileConverter class.
@@ -46,6 +57,39 @@ class FileConverter:
         elif self.input_file.endswith(".xlsx"):
             return pd.read_excel(self.input_file)
 
+    def read_input_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Reads the input file in chunks of a bounded number of rows, xlsx files are streamed with the read-only mode of openpyxl.
+
+        Parameters:
+        - chunksize: the number of rows per chunk
+
+        Returns:
+        - An iterator over Pandas DataFrames
+        """
+        if self.input_file.endswith(".csv"):
+            with pd.read_csv(self.input_file, chunksize=chunksize) as reader:
+                yield from reader
+        elif self.input_file.endswith(".xlsx"):
+            import openpyxl
+
+            workbook = openpyxl.load_workbook(
+                self.input_file, read_only=True, data_only=True
+            )
+            try:
+                rows = workbook.active.iter_rows(values_only=True)
+                columns: Tuple = next(rows, ())
+                chunk: List[Tuple] = []
+                for row in rows:
+                    chunk.append(row)
+                    if len(chunk) == chunksize:
+                        yield pd.DataFrame(chunk, columns=columns)
+                        chunk = []
+                if chunk:
+                    yield pd.DataFrame(chunk, columns=columns)
+            finally:
+                workbook.close()
+
     def filter_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Filters the DataFrame by removing rows with 'altitudeMode' equal to 'clampToGround'.
@@ -103,12 +147,23 @@ class FileConverter:
         Returns:
         - DataFrame with coordinates added
         """
-        df["WKT"] = df["WKT"].astype(str)
-        coordinates_raw: pd.DataFrame = df.apply(self.extract_coordinates_raw, axis=1)
-        df = pd.concat([df, coordinates_raw], axis=1)
-        df = df.drop(["WKT", "coordinates_b"], axis=1)
+        coordinates_a: pd.DataFrame = self.extract_wkt_coordinates(df["WKT"])
+        df["coordinates_a"] = coordinates_a[0] + " " + coordinates_a[1]
+        df = df.drop("WKT", axis=1)
         return df
 
+    def extract_wkt_coordinates(self, wkt: pd.Series) -> pd.DataFrame:
+        """
+        Extracts the longitude and latitude of the first point of every WKT line string at once.
+
+        Parameters:
+        - wkt: the 'WKT' column of the DataFrame
+
+        Returns:
+        - DataFrame with the longitude (column 0) and latitude (column 1) as strings
+        """
+        return wkt.astype(str).str.extract(self.WKT_PATTERN)
+
     def extract_coordinates_a(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Extracts coordinates from 'coordinates_a' column and adds 'longitude' and 'latitude' columns.
@@ -171,6 +226,30 @@ class FileConverter:
         )
         return df
 
+    def parse_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Parses the 'name' and 'WKT' columns into typed columns in one step. This replaces split_and_reorder_columns, extract_coordinates, extract_coordinates_a, remove_units and clean_up_coordinates and returns the same values without a row-wise apply.
+
+        Parameters:
+        - df: the filtered DataFrame
+
+        Returns:
+        - DataFrame with the float columns 'altitude', 'horizontal', 'vertical', 'distance', 'longitude' and 'latitude' and the 'timestamp' column
+        """
+        name: pd.DataFrame = df["name"].str.split(expand=True)
+        coordinates: pd.DataFrame = self.extract_wkt_coordinates(df["WKT"])
+        if df.empty:  # e.g. a chunk without clampToGround rows
+            name = pd.DataFrame({i: pd.Series(dtype=str) for i in range(5)})
+
+        columns: Dict[str, pd.Series] = {"timestamp": name[0]}
+        for i, (column, unit) in enumerate(self.UNITS.items(), start=1):
+            columns[column] = (
+                name[i].str.replace(f"[{unit}]", "", regex=True).astype(float).round(2)
+            )
+        columns["longitude"] = coordinates[0].astype(float)
+        columns["latitude"] = coordinates[1].astype(float)
+        return pd.DataFrame(columns, index=df.index)
+
     def remove_static_speeds(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Removes rows with static horizontal speed.
@@ -197,45 +276,52 @@ class FileConverter:
         return df
 
     # AI content (GitHub Copilot, 01/25/2024), verified and adapted by Nicolas Huber.
-    def export_to_csv(self, df: pd.DataFrame, custom_headers: List[str]) -> None:
+    def export_to_csv(
+        self, df: pd.DataFrame, custom_headers: List[str], append: bool = False
+    ) -> None:
         """
         Exports the DataFrame to a CSV file with custom headers.
 
         Parameters:
         - df: the input DataFrame
         - custom_headers: a list of custom headers
+        - append: whether the DataFrame is appended to the CSV file without headers
 
         Returns:
         - None
         """
-        df.to_csv(self.output_file, index=False, header=custom_headers)
+        if append:
+            df.to_csv(self.output_file, index=False, header=False, mode="a")
+        else:
+            df.to_csv(self.output_file, index=False, header=custom_headers)
 
-    # AI content (GitHub Copilot, 01/25/2024), verified and adapted by Nicolas Huber.
-    def process_csv(
-        self,
-    ) -> None:
+    def convert_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Converts the CSV file to a Pandas DataFrame, cleans up the data, and exports the DataFrame to a CSV file.
+        Runs all processing steps on a DataFrame or on a chunk of the input file, the steps only depend on single rows.
 
         Parameters:
-        - None
+        - df: the DataFrame as read from the input file
 
         Returns:
-        - None
+        - The converted DataFrame
         """
-        df: pd.DataFrame = self.read_input_file()
-
-        # Process steps
         df = self.filter_dataframe(df)
-        df = self.split_and_reorder_columns(df)
-        df = self.extract_coordinates(df)
-        df = self.extract_coordinates_a(df)
-        df = self.remove_units(df)
+        df = self.parse_columns(df)
         df = self.remove_static_speeds(df)
         df = self.convert_horizontal_speed(df)
-        df = self.clean_up_coordinates(df)
+        return df
+
+    # AI content (GitHub Copilot, 01/25/2024), verified and adapted by Nicolas Huber.
+    def process_csv(self, chunksize: int = None) -> None:
+        """
+        Converts the CSV file to a Pandas DataFrame, cleans up the data, and exports the DataFrame to a CSV file. With a chunksize the input file is streamed and every converted chunk is appended to the CSV file, so the memory does not grow with the size of the input file.
 
-        # EXPORT DATAFRAME TO CSV
+        Parameters:
+        - chunksize: the number of rows per chunk, None to read the whole input file at once
+
+        Returns:
+        - None
+        """
         custom_headers: List[str] = [
             "timestamp [UTC]",
             "relative altitude [m]",
@@ -245,7 +331,17 @@ class FileConverter:
             "longitude",
             "latitude",
         ]
-        self.export_to_csv(df, custom_headers)
+        if chunksize is None:
+            df: pd.DataFrame = self.read_input_file()
+            self.export_to_csv(self.convert_dataframe(df), custom_headers)
+            return
+
+        append: bool = False
+        for chunk in self.read_input_chunks(chunksize):
+            self.export_to_csv(self.convert_dataframe(chunk), custom_headers, append)
+            append = True
+        if not append:  # empty input file
+            self.export_to_csv(pd.DataFrame(columns=custom_headers), custom_headers)
 
 
 # %%
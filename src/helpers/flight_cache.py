@@ -0,0 +1,276 @@
+# %%
+
+import os
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Tuple
+
+from .. import constants
+
+src_directory: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# source files whose changes invalidate the cached flights (every module imported by the SpeedAnalyzer), relative to the src directory
+CODE_FILES: List[str] = [
+    "constants.py",
+    "packages/IGC2CSV.py",
+    "helpers/data_analyzer.py",
+    "helpers/data_storage.py",
+    "helpers/window_statistics.py",
+    "helpers/flight_cache.py",
+    "helpers/flight_manifest.py",
+    "helpers/lazy_module.py",
+    "algorithms/angle_analyzer.py",
+    "algorithms/speed_analyzer.py",
+]
+
+
+class FlightCache:
+    """
+    Class to cache converted and classified flights on disk. An entry is addressed by the hash of the IGC file, the version of the processing code and, for classified flights, the thresholds of the AngleAnalyzer. Changing the file, the code or the thresholds therefore never returns stale data. The flights are stored column by column as numpy arrays (.npz), the least recently used entries are removed as soon as the cache exceeds its maximum size.
+
+    To use this class the following code snippet can be used:
+
+    Cache = FlightCache(directory="path/to/cache")
+    key = Cache.key(file_hash=Cache.hash_file("flight.igc"), stage="processed")
+    data = Cache.load(key)  # None if the flight is not cached
+    Cache.store(key, data_processed)
+    """
+
+    def __init__(
+        self, directory: str, max_size: int = constants.CACHE_MAX_SIZE
+    ) -> None:
+        """
+        Initialize the cache, the directory is created if it does not exist.
+
+        Parameters:
+        - directory (str): The directory of the cache files.
+        - max_size (int): The maximum size of all cache files in bytes.
+
+        Returns:
+        - None.
+        """
+        self.directory = directory
+        self.max_size = max_size
+        self.version: str = self.code_version()
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def code_version() -> str:
+        """
+        Calculate the version of the processing code as the hash of its source files.
+
+        Parameters:
+        - None.
+
+        Returns:
+        - str: The hash of the source files.
+        """
+        digest = hashlib.sha256()
+        for code_file in CODE_FILES:
+            with open(os.path.join(src_directory, code_file), "rb") as file:
+                digest.update(file.read())
+        return digest.hexdigest()
+
+    @staticmethod
+    def hash_file(file_path: str) -> str:
+        """
+        Calculate the hash of the content of a file.
+
+        Parameters:
+        - file_path (str): The path to the file.
+
+        Returns:
+        - str: The hash of the file.
+        """
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def parameters(stage: str) -> Dict[str, Any]:
+        """
+        Get the constants the cached data of a stage depends on.
+
+        Parameters:
+        - stage (str): "converted" for the output of IGC2CSV.export_to_flight_analyzer_format, "processed" for the output of DataAnalyzer.process_data.
+
+        Returns:
+        - Dict[str, Any]: The constants of the stage.
+        """
+        if stage == "converted":
+            return {}
+        if stage == "processed":
+            return {
+                "angle_past_threshold": constants.ANGLE_PAST_THRESHOLD,
+                "angle_future_threshold": constants.ANGLE_FUTURE_THRESHOLD,
+                "angle_threshold": constants.ANGLE_THRESHOLD,
+                "linear_regression_threshold": constants.LINEAR_REGRESSION_THRESHOLD,
+            }
+        raise ValueError(f"Unknown cache stage: {stage}")
+
+    def key(self, file_hash: str, stage: str) -> str:
+        """
+        Calculate the key of a cache entry.
+
+        Parameters:
+        - file_hash (str): The hash of the IGC file (see hash_file).
+        - stage (str): The processing stage, see parameters.
+
+        Returns:
+        - str: The key of the cache entry.
+        """
+        address: str = json.dumps(
+            [stage, file_hash, self.parameters(stage), self.version], sort_keys=True
+        )
+        return hashlib.sha256(address.encode()).hexdigest()
+
+    def path(self, key: str) -> str:
+        """
+        Get the path to the file of a cache entry.
+
+        Parameters:
+        - key (str): The key of the cache entry.
+
+        Returns:
+        - str: The path to the cache file.
+        """
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def load(self, key: str) -> pd.DataFrame:
+        """
+        Load a cache entry and mark it as recently used.
+
+        Parameters:
+        - key (str): The key of the cache entry.
+
+        Returns:
+        - pd.DataFrame: The cached data, None if the entry does not exist or cannot be read.
+        """
+        path: str = self.path(key)
+        try:
+            with np.load(path, allow_pickle=False) as arrays:
+                data: pd.DataFrame = self.decode(arrays)
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            return None
+        return data
+
+    def store(self, key: str, data: pd.DataFrame) -> None:
+        """
+        Store a cache entry and remove the least recently used entries if the cache is too large.
+
+        Parameters:
+        - key (str): The key of the cache entry.
+        - data (pd.DataFrame): The data to be cached.
+
+        Returns:
+        - None.
+        """
+        path: str = self.path(key)
+        # the entry is written to a temporary file first, so concurrent readers never see a partial file
+        temporary_path: str = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as file:
+            np.savez_compressed(file, **self.encode(data))
+        os.replace(temporary_path, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache does not exceed its maximum size.
+
+        Parameters:
+        - None.
+
+        Returns:
+        - None.
+        """
+        entries: List[Tuple[float, int, str]] = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".npz"):
+                continue
+            try:
+                stat: os.stat_result = entry.stat()
+            except FileNotFoundError:  # removed by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        entries.sort()
+        size: int = sum(entry[1] for entry in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+            size -= entry_size
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def size(self) -> int:
+        """
+        Calculate the size of all cache files.
+
+        Parameters:
+        - None.
+
+        Returns:
+        - int: The size of the cache in bytes.
+        """
+        return sum(
+            entry.stat().st_size
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith(".npz")
+        )
+
+    @staticmethod
+    def encode(data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Convert a DataFrame to named numpy arrays. Object columns are stored with the type inferred from their values (e.g. bool, int or fixed-width strings) and restored as object columns.
+
+        Parameters:
+        - data (pd.DataFrame): The DataFrame to be converted.
+
+        Returns:
+        - Dict[str, np.ndarray]: The arrays of the columns and the column names, dtypes and index.
+        """
+        arrays: Dict[str, np.ndarray] = {
+            "columns": np.array(data.columns, dtype=str),
+            "dtypes": np.array([dtype.str for dtype in data.dtypes], dtype=str),
+            "index": data.index.to_numpy(),
+        }
+        for i, column in enumerate(data.columns):
+            values: np.ndarray = data[column].to_numpy()
+            if values.dtype == object:
+                values = np.array(values.tolist())
+                if values.dtype == object:
+                    values = values.astype(str)
+            arrays[f"column_{i}"] = values
+        return arrays
+
+    @staticmethod
+    def decode(arrays: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """
+        Convert named numpy arrays created by encode back to a DataFrame.
+
+        Parameters:
+        - arrays (Dict[str, np.ndarray]): The arrays of the columns and the column names, dtypes and index.
+
+        Returns:
+        - pd.DataFrame: The DataFrame.
+        """
+        columns: List[str] = arrays["columns"].tolist()
+        dtypes: List[str] = arrays["dtypes"].tolist()
+        return pd.DataFrame(
+            {
+                column: arrays[f"column_{i}"].astype(dtypes[i], copy=False)
+                for i, column in enumerate(columns)
+            },
+            columns=columns,
+            index=arrays["index"],
+        )
+
+
+# %%
@@ -0,0 +1,161 @@
+# %%
+
+import os
+import json
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Tuple
+
+from . import flight_cache as flightcache
+
+
+class FlightManifest:
+    """
+    Class to keep track of the processed IGC files of an input directory for incremental processing. The manifest stores the path, modification time, size and hash of every processed file, the merged results of all files are stored next to it. New and changed files are detected with the modification time and size first, the hash is only calculated if they differ. If the thresholds or the processing code change, all files are processed again.
+
+    To use this class the following code snippet can be used:
+
+    Manifest = FlightManifest(directory="path/to/state")
+    changed_files = Manifest.changed_files(file_paths)
+    flight_data = Manifest.update(file_paths=file_paths, flights=SpeedAnalyzer.process_files(changed_files))
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Load the manifest of the directory, the directory is created if it does not exist.
+
+        Parameters:
+        - directory (str): The directory of the manifest and the merged results.
+
+        Returns:
+        - None.
+        """
+        self.directory = directory
+        self.manifest_path: str = os.path.join(directory, "manifest.json")
+        self.data_path: str = os.path.join(directory, "flight_data.npz")
+        self.version: Dict[str, Any] = {
+            "parameters": flightcache.FlightCache.parameters("processed"),
+            "code": flightcache.FlightCache.code_version(),
+        }
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.pending: Dict[str, Dict[str, Any]] = {}
+        os.makedirs(directory, exist_ok=True)
+
+        if os.path.exists(self.manifest_path) and os.path.exists(self.data_path):
+            with open(self.manifest_path, "r") as file:
+                manifest: Dict[str, Any] = json.load(file)
+            if manifest.get("version") == self.version:
+                self.files = manifest["files"]
+
+    def changed_files(self, file_paths: List[str]) -> List[str]:
+        """
+        Find the files that are not in the manifest or whose content changed.
+
+        Parameters:
+        - file_paths (List[str]): Paths to the IGC files.
+
+        Returns:
+        - List[str]: Paths to the new and changed files, in the order of file_paths.
+        """
+        changed_files: List[str] = []
+        for file_path in file_paths:
+            stat: os.stat_result = os.stat(file_path)
+            entry: Dict[str, Any] = self.files.get(file_path)
+            current: Dict[str, Any] = {
+                "mtime": stat.st_mtime_ns,
+                "size": stat.st_size,
+            }
+            if entry is not None and all(entry[key] == current[key] for key in current):
+                continue
+
+            current["hash"] = flightcache.FlightCache.hash_file(file_path)
+            if entry is not None and entry["hash"] == current["hash"]:
+                entry.update(current)  # touched, but unchanged
+                continue
+
+            self.pending[file_path] = current
+            changed_files.append(file_path)
+        return changed_files
+
+    def load_data(self) -> Tuple[pd.DataFrame, np.ndarray]:
+        """
+        Load the merged results of the previous runs.
+
+        Parameters:
+        - None.
+
+        Returns:
+        - Tuple[pd.DataFrame, np.ndarray]: The merged results and the file path of every row.
+        """
+        if not self.files:
+            return pd.DataFrame(), np.array([], dtype=str)
+        with np.load(self.data_path, allow_pickle=False) as arrays:
+            return flightcache.FlightCache.decode(arrays), arrays["files"]
+
+    def update(
+        self, file_paths: List[str], flights: Dict[str, pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        Merge the newly processed files into the results of the previous runs and save the results and the manifest. The rows of changed and removed files are replaced or dropped.
+
+        Parameters:
+        - file_paths (List[str]): Paths to all IGC files, in the order of the results.
+        - flights (Dict[str, pd.DataFrame]): The results of the new and changed files that were processed successfully.
+
+        Returns:
+        - pd.DataFrame: The merged results of all files.
+        """
+        data, files = self.load_data()
+        kept: List[str] = [
+            file_path
+            for file_path in file_paths
+            if file_path in self.files and file_path not in self.pending
+        ]
+        keep: np.ndarray = np.isin(files, kept)
+
+        frames: List[pd.DataFrame] = [data[keep]] + list(flights.values())
+        files = np.concatenate(
+            [files[keep]]
+            + [np.full(len(flights[file_path]), file_path) for file_path in flights]
+        ).astype(str)
+        rank: Dict[str, int] = {file_path: i for i, file_path in enumerate(file_paths)}
+        order: np.ndarray = np.argsort(
+            np.array([rank[file_path] for file_path in files], dtype=np.int64),
+            kind="stable",
+        )
+
+        frames = [frame for frame in frames if len(frame.columns) > 0]
+        if frames:
+            data = pd.concat(frames, ignore_index=True).iloc[order]
+            data = data.reset_index(drop=True)
+        else:
+            data = pd.DataFrame()
+        files = files[order]
+
+        self.files = {file_path: self.files[file_path] for file_path in kept}
+        self.files.update({file_path: self.pending[file_path] for file_path in flights})
+        self.pending = {}
+        self.save(data=data, files=files)
+        return data
+
+    def save(self, data: pd.DataFrame, files: np.ndarray) -> None:
+        """
+        Save the merged results and the manifest, the files are replaced atomically.
+
+        Parameters:
+        - data (pd.DataFrame): The merged results.
+        - files (np.ndarray): The file path of every row.
+
+        Returns:
+        - None.
+        """
+        with open(f"{self.data_path}.tmp", "wb") as file:
+            np.savez(file, files=files, **flightcache.FlightCache.encode(data))
+        os.replace(f"{self.data_path}.tmp", self.data_path)
+
+        with open(f"{self.manifest_path}.tmp", "w") as file:
+            json.dump({"version": self.version, "files": self.files}, file, indent=2)
+        os.replace(f"{self.manifest_path}.tmp", self.manifest_path)
+
+
+# %%
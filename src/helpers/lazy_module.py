@@ -0,0 +1,35 @@
+# %%
+
+import types
+import importlib
+from typing import Any
+
+
+class LazyModule(types.ModuleType):
+    """
+    Class to import a heavy dependency (e.g. scipy or matplotlib) only when one of its attributes is used for the first time, so short-lived processes that never use it do not spend their startup importing it. The attributes are cached on first access, later accesses are plain attribute lookups.
+
+    To use this class the following code snippet can be used:
+
+    plt = LazyModule("matplotlib.pyplot")  # instead of import matplotlib.pyplot as plt
+    plt.plot(x, y)  # imports matplotlib.pyplot
+    """
+
+    def __getattr__(self, attribute: str) -> Any:
+        """
+        Import the module and return one of its attributes, called only for attributes that are not cached yet.
+
+        Parameters:
+        - attribute (str): The name of the attribute.
+
+        Returns:
+        - Any: The attribute of the module.
+        """
+        if attribute.startswith("__"):
+            raise AttributeError(attribute)  # e.g. copy and inspect probing __wrapped__
+        value: Any = getattr(importlib.import_module(self.__name__), attribute)
+        setattr(self, attribute, value)
+        return value
+
+
+# %%
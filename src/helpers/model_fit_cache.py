@@ -0,0 +1,149 @@
+# %%
+
+import hashlib
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from typing import Any, Callable, Tuple
+
+from .. import constants
+from . import lazy_module as lazymodule
+
+interpolate = lazymodule.LazyModule("scipy.interpolate")
+
+
+class ModelFitCache:
+    """
+    Class to fit the curves of the speed polar, c value and pressure analysis once per dataset: the polynomial fits of the experimental data, the power-law fits of the experimental c values and the cubic splines of the theoretical references. The fits are cached by the content of the fitted columns and the fit parameters, so the DataVisualizer plots and the deviation metrics (see DeviationMetrics) of the same dataset share them.
+
+    To use this class the following code snippet can be used:
+
+    Fits = ModelFitCache()
+    polynomial = Fits.polynomial(data=experimental_data, x="horizontal velocity [m/s]", y="vertical velocity [m/s]", degree=2)
+    spline = Fits.spline(data=theoretical_data, x="horizontal velocity [m/s]", y="vertical velocity [m/s]")
+    """
+
+    def __init__(self, cache_size: int = constants.FIT_CACHE_SIZE) -> None:
+        """
+        Initialize the ModelFitCache object.
+
+        Parameters:
+        - cache_size (int): The number of fits that are cached.
+
+        Returns:
+        - None.
+        """
+        self.cache_size = cache_size
+        self.cache: OrderedDict = OrderedDict()
+
+    def fit(
+        self, data: pd.DataFrame, x: str, y: str, model: Tuple, build: Callable
+    ) -> Any:
+        """
+        Return the cached fit of two columns of a dataset, the fit is built if it is not cached.
+
+        Parameters:
+        - data (pd.DataFrame): The dataset.
+        - x (str): The column of the x values.
+        - y (str): The column of the y values.
+        - model (Tuple): The name and the parameters of the fit, e.g. ("polynomial", 2).
+        - build (Callable): The function that builds the fit of the x and y values.
+
+        Returns:
+        - Any: The fit.
+        """
+        x_values: np.ndarray = data[x].to_numpy(dtype=np.float64)
+        y_values: np.ndarray = data[y].to_numpy(dtype=np.float64)
+        digest = hashlib.blake2b(digest_size=16)
+        for column in (x_values, y_values):
+            digest.update(np.ascontiguousarray(column).view(np.uint8))
+        key: Tuple = (x, y, model, digest.hexdigest())
+
+        value: Any = self.cache.get(key)
+        if value is None:
+            value = build(x_values, y_values)
+            self.cache[key] = value
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        else:
+            self.cache.move_to_end(key)
+        return value
+
+    def polynomial(self, data: pd.DataFrame, x: str, y: str, degree: int) -> np.poly1d:
+        """
+        Fit a polynomial to two columns of a dataset with the least squares method, the points are sorted by their x values like in the plots.
+
+        Parameters:
+        - data (pd.DataFrame): The dataset.
+        - x (str): The column of the x values.
+        - y (str): The column of the y values.
+        - degree (int): The degree of the polynomial.
+
+        Returns:
+        - np.poly1d: The polynomial.
+        """
+
+        def build(x_values: np.ndarray, y_values: np.ndarray) -> np.poly1d:
+            order: np.ndarray = np.argsort(x_values)
+            return np.poly1d(np.polyfit(x_values[order], y_values[order], degree))
+
+        return self.fit(data, x, y, ("polynomial", degree), build)
+
+    def power_law(self, data: pd.DataFrame, x: str, y: str) -> np.poly1d:
+        """
+        Fit a power law y = a * x^b to two columns of a dataset with a linear fit of the logarithms, the values of the power law are calculated with power_law_values.
+
+        Parameters:
+        - data (pd.DataFrame): The dataset.
+        - x (str): The column of the x values.
+        - y (str): The column of the y values.
+
+        Returns:
+        - np.poly1d: The linear fit log10(y) = b * log10(x) + log10(a).
+        """
+        return self.fit(
+            data,
+            x,
+            y,
+            ("power_law",),
+            lambda x_values, y_values: np.poly1d(
+                np.polyfit(np.log10(x_values), np.log10(y_values), 1)
+            ),
+        )
+
+    def power_law_values(self, fit: np.poly1d, x: np.ndarray) -> np.ndarray:
+        """
+        Calculate the values of a power law fitted with power_law.
+
+        Parameters:
+        - fit (np.poly1d): The linear fit of the logarithms.
+        - x (np.ndarray): The x values.
+
+        Returns:
+        - np.ndarray: The y values.
+        """
+        return np.power(10, fit(np.log10(x)))
+
+    def spline(self, data: pd.DataFrame, x: str, y: str) -> "interpolate.CubicSpline":
+        """
+        Interpolate two columns of a dataset with a cubic spline, the points are sorted by their x values.
+
+        Parameters:
+        - data (pd.DataFrame): The dataset.
+        - x (str): The column of the x values.
+        - y (str): The column of the y values.
+
+        Returns:
+        - CubicSpline: The spline.
+        """
+
+        def build(
+            x_values: np.ndarray, y_values: np.ndarray
+        ) -> "interpolate.CubicSpline":
+            order: np.ndarray = np.argsort(x_values)
+            return interpolate.CubicSpline(x_values[order], y_values[order])
+
+        return self.fit(data, x, y, ("spline",), build)
+
+
+# %%
@@ -1,20 +1,27 @@
 # %%
 
 import os
-import sys
 import time
 import warnings
+import numpy as np
 import pandas as pd
-from typing import Tuple
+from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
+from .. import constants
+from . import data_analyzer as dataanalyzer
+from . import file_processor as fileprocessor
+from . import data_storage as datastorage
+from . import shared_dataframe as shareddataframe
+from . import window_statistics as windowstatistics
+from . import threshold_search as thresholdsearch
+from ..algorithms import angle_analyzer as angleanalyzer
 
-# AI content (GitHub Copilot, 01/29/2024), verified and adapted by Nicolas Huber.
-src_directory: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
-sys.path.append(src_directory)
-
-import constants as constants
-import helpers.data_analyzer as dataanalyzer
-import algorithms.angle_analyzer as angleanalyzer
+# state of a worker process of the parallel optimization, see ThresholdOptimizer.test_thresholds_parallel
+_worker_optimizer: "ThresholdOptimizer" = None
+_worker_data: pd.DataFrame = None
+_worker_statistics: windowstatistics.WindowStatistics = None
+_worker_memory = None
 
 
 class ThresholdOptimizer:
@@ -31,6 +38,9 @@ class ThresholdOptimizer:
         limit: int,
         steps: int,
         runtime_estimation: int,
+        workers: int = 1,
+        strategy: str = "grid",
+        budget: int = None,
     ) -> None:
         """
         Initialize the class.
@@ -43,6 +53,9 @@ class ThresholdOptimizer:
         - limit (int): The limit of the optimization.
         - steps (int): The steps of the optimization.
         - runtime_estimation (int): The runtime estimation per iteration.
+        - workers (int): The number of worker processes, 1 tests the thresholds in the current process.
+        - strategy (str): The search strategy, "grid" tests every pair of thresholds, "coarse_to_fine", "successive_halving" and "surrogate" test at most budget pairs (see helpers/threshold_search.py).
+        - budget (int): The maximum number of evaluations of the search strategies, None allows as many evaluations as the grid has pairs.
 
         Returns:
         - None.
@@ -54,10 +67,28 @@ class ThresholdOptimizer:
         self.limit = limit
         self.steps = steps
         self.runtime_estimation = runtime_estimation
+        self.workers = workers
+        self.strategy = strategy
+        self.budget = budget
         self.best_scores: pd.DataFrame
+        self.flights: Dict[str, pd.DataFrame] = {}
         self.future_threshold_optimized: int = 0
         self.past_threshold_optimized: int = 0
 
+    def __getstate__(self) -> Dict:
+        """
+        Get the state of the object for pickling, e.g. when it is sent to a worker process. The cached flights are left out, the workers receive the data they need explicitly.
+
+        Parameters:
+        - None.
+
+        Returns:
+        - Dict: The state of the object.
+        """
+        state: Dict = self.__dict__.copy()
+        state["flights"] = {}
+        return state
+
     def construct_data_analyzer(self) -> dataanalyzer.DataAnalyzer:
         """
         Construct the data analyzer object.
@@ -73,6 +104,58 @@ class ThresholdOptimizer:
         )
         return DataAnalyzer
 
+    def construct_window_statistics(
+        self, data: pd.DataFrame
+    ) -> windowstatistics.WindowStatistics:
+        """
+        Construct the window statistics object, which shares the window analyses of the data between all tested thresholds.
+
+        Parameters:
+        - data (pd.DataFrame): The data to be analyzed.
+
+        Returns:
+        - WindowStatistics: The window statistics object.
+        """
+        AngleAnalyzer: angleanalyzer.AngleAnalyzer = angleanalyzer.AngleAnalyzer(
+            csv_file=self.csv_file,
+            latest_threshold=constants.ANGLE_PAST_THRESHOLD,
+            future_threshold=constants.ANGLE_FUTURE_THRESHOLD,
+            angle_threshold=constants.ANGLE_THRESHOLD,
+            linear_regression_threshold=constants.LINEAR_REGRESSION_THRESHOLD,
+            rolling_regression=True,
+        )
+        WindowStatistics: windowstatistics.WindowStatistics = (
+            windowstatistics.WindowStatistics(data=data, AngleAnalyzer=AngleAnalyzer)
+        )
+        return WindowStatistics
+
+    def construct_search_strategy(self) -> thresholdsearch.ThresholdSearch:
+        """
+        Construct the search strategy object.
+
+        Parameters:
+        - None.
+
+        Returns:
+        - ThresholdSearch: The search strategy object.
+        """
+        strategies: Dict[str, type] = {
+            "coarse_to_fine": thresholdsearch.CoarseToFineSearch,
+            "successive_halving": thresholdsearch.SuccessiveHalvingSearch,
+            "surrogate": thresholdsearch.SurrogateSearch,
+        }
+        if self.strategy not in strategies:
+            raise ValueError(
+                f"Unknown search strategy: {self.strategy}, expected one of {list(strategies)}"
+            )
+
+        thresholds: List[int] = list(range(10, self.limit, self.steps))
+        budget: int = len(thresholds) ** 2 if self.budget is None else self.budget
+        ThresholdSearch: thresholdsearch.ThresholdSearch = strategies[self.strategy](
+            thresholds=thresholds, budget=budget
+        )
+        return ThresholdSearch
+
     def calculate_score(self, values: Tuple[float, float, float]) -> float:
         """
         Calculate the score of the thresholds.
@@ -94,6 +177,7 @@ class ThresholdOptimizer:
         thresholds: Tuple[int, int],
         data: pd.DataFrame,
         DataAnalyzer: dataanalyzer.DataAnalyzer,
+        WindowStatistics: windowstatistics.WindowStatistics = None,
     ) -> Tuple[int, int, float, float, float, float]:
         """
         Test the thresholds.
@@ -102,6 +186,7 @@ class ThresholdOptimizer:
         - thresholds (Tuple[int, int]): The thresholds to be tested.
         - data (pd.DataFrame): The data to be analyzed.
         - DataAnalyzer (data_analyzer.DataAnalyzer): The data analyzer object.
+        - WindowStatistics (window_statistics.WindowStatistics): The window analyses of the data shared between all tested thresholds, if None they are calculated for this test only.
 
         Returns:
         - Tuple[int, int, float, float, float, float, float]: The results of the test. (ANGLE_PAST_THRESHOLD, ANBGLE_FUTURE_THRESHOLD, r_value, p_value, std_err, score, data_loss)
@@ -112,6 +197,7 @@ class ThresholdOptimizer:
             future_threshold=thresholds[1],
             angle_threshold=constants.ANGLE_THRESHOLD,
             linear_regression_threshold=constants.LINEAR_REGRESSION_THRESHOLD,
+            rolling_regression=True,
         )
 
         data_processed = DataAnalyzer.process_data(
@@ -119,6 +205,7 @@ class ThresholdOptimizer:
             AngleAnalyzer=AngleAnalyzer,
             angle_past_threshold=thresholds[0],
             angle_future_threshold=thresholds[1],
+            WindowStatistics=WindowStatistics,
         )
         average_r_value = data_processed[data_processed["position_int"] == 0][
             "average_r_value"
@@ -164,6 +251,198 @@ class ThresholdOptimizer:
         """
         return (total_iterations - n + 1) * previous
 
+    def append_result(
+        self,
+        results: pd.DataFrame,
+        result: Tuple[int, int, float, float, float, float, float],
+    ) -> pd.DataFrame:
+        """
+        Append the result of a threshold test to the results table.
+
+        Parameters:
+        - results (pd.DataFrame): The results table.
+        - result (Tuple[int, int, float, float, float, float, float]): The result of test_thresholds.
+
+        Returns:
+        - pd.DataFrame: The results table including the new result.
+        """
+        return pd.concat(
+            [
+                results,
+                pd.DataFrame(
+                    {
+                        "angle_past_threshold": [result[0]],
+                        "angle_future_threshold": [result[1]],
+                        "average_r_value": [result[2]],
+                        "average_p_value": [result[3]],
+                        "average_std_err": [result[4]],
+                        "score": [result[5]],
+                        "data_loss": [result[6]],
+                    }
+                ),
+            ],
+            ignore_index=True,
+        )
+
+    def test_thresholds_parallel(
+        self,
+        thresholds: List[Tuple[int, int]],
+        data: pd.DataFrame,
+        results: pd.DataFrame,
+    ) -> pd.DataFrame:
+        """
+        Test the thresholds in a pool of worker processes. The data is shared with the workers once through shared memory and the results are appended to the results table as soon as they are completed.
+
+        Parameters:
+        - thresholds (List[Tuple[int, int]]): The thresholds to be tested.
+        - data (pd.DataFrame): The data to be analyzed.
+        - results (pd.DataFrame): The results table.
+
+        Returns:
+        - pd.DataFrame: The results table including the results of all tested thresholds.
+        """
+        total_iterations: int = len(thresholds)
+        start_time: float = time.time()
+
+        with shareddataframe.SharedDataFrame(data) as shared_data:
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_initialize_worker,
+                initargs=(self, shared_data.description),
+            ) as executor:
+                futures = [
+                    executor.submit(_test_thresholds_worker, threshold)
+                    for threshold in thresholds
+                ]
+
+                for n, future in enumerate(as_completed(futures), start=1):
+                    result: Tuple[int, int, float, float, float, float, float] = (
+                        future.result()
+                    )
+                    results = self.append_result(results=results, result=result)
+
+                    elapsed: float = time.time() - start_time
+                    estimated_duration: float = self.calculate_time_remaining(
+                        n=n + 1, total_iterations=total_iterations, previous=elapsed / n
+                    )
+                    print(
+                        f"----> Completed {n} of {total_iterations} iterations ({round(n / total_iterations * 100, 1)}%, {self.workers} workers), last tested thresholds: {result[0]} & {result[1]}, elapsed: {round(elapsed, 2)} seconds, estimated time remaining: {round(estimated_duration, 2)} seconds, {round(estimated_duration / 60, 2)} minutes, {round(estimated_duration / 3600, 2)} hours. Estimated time finished: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(time.time() + estimated_duration))}."
+                    )
+
+        return results
+
+    def sample_blocks(self, data: pd.DataFrame, fraction: float) -> List[pd.DataFrame]:
+        """
+        Sample a fraction of a tracklog as evenly spaced contiguous blocks, so the sample covers the whole flight instead of only the takeoff and the first climb.
+
+        Parameters:
+        - data (pd.DataFrame): The data of the flight.
+        - fraction (float): The fraction of the data.
+
+        Returns:
+        - List[pd.DataFrame]: The blocks, the complete data if the fraction is 1.
+        """
+        if fraction >= 1.0:
+            return [data]
+        size: int = max(int(len(data) * fraction), 1)
+        blocks: int = min(constants.OPTIMIZATION_BLOCKS, size)
+        length: int = size // blocks
+        starts: np.ndarray = np.linspace(0, len(data) - length, blocks).round()
+        return [data.iloc[int(start) : int(start) + length] for start in starts]
+
+    def sample_flights(
+        self, flights: List[pd.DataFrame], fraction: float
+    ) -> List[pd.DataFrame]:
+        """
+        Sample a fraction of the flights of the batch optimization, evenly spaced over the list of flights.
+
+        Parameters:
+        - flights (List[pd.DataFrame]): The data of the flights.
+        - fraction (float): The fraction of the flights.
+
+        Returns:
+        - List[pd.DataFrame]: The sampled flights, all flights if the fraction is 1.
+        """
+        if fraction >= 1.0:
+            return flights
+        count: int = max(int(round(len(flights) * fraction)), 1)
+        indices: np.ndarray = np.linspace(0, len(flights) - 1, count).round()
+        return [flights[int(index)] for index in np.unique(indices)]
+
+    def test_thresholds_search(
+        self,
+        data: pd.DataFrame,
+        DataAnalyzer: dataanalyzer.DataAnalyzer,
+        results: pd.DataFrame,
+        flights: List[pd.DataFrame] = None,
+    ) -> pd.DataFrame:
+        """
+        Test the thresholds chosen by the search strategy. Strategies that test thresholds on a fraction of the data use evenly spaced blocks of the tracklog (see sample_blocks) or, in the batch mode, a subset of the flights (see sample_flights). The results of the blocks or flights are aggregated like in the batch mode, only the results on the complete data are appended to the results table.
+
+        Parameters:
+        - data (pd.DataFrame): The data to be analyzed, None in the batch mode.
+        - DataAnalyzer (data_analyzer.DataAnalyzer): The data analyzer object.
+        - results (pd.DataFrame): The results table.
+        - flights (List[pd.DataFrame]): The data of the flights of the batch mode, None to analyze data.
+
+        Returns:
+        - pd.DataFrame: The results table including the results of all tested thresholds.
+        """
+        ThresholdSearch: thresholdsearch.ThresholdSearch = (
+            self.construct_search_strategy()
+        )
+        samples: Dict[float, List[pd.DataFrame]] = {}
+        statistics: Dict[int, windowstatistics.WindowStatistics] = {}
+        start_time: float = time.time()
+
+        def evaluate(
+            thresholds: Tuple[int, int], fraction: float
+        ) -> Tuple[int, int, float, float, float, float, float]:
+            if fraction not in samples:
+                samples[fraction] = (
+                    self.sample_blocks(data=data, fraction=fraction)
+                    if flights is None
+                    else self.sample_flights(flights=flights, fraction=fraction)
+                )
+            parts: List[pd.DataFrame] = samples[fraction]
+            for part in parts:
+                if id(part) not in statistics:
+                    statistics[id(part)] = self.construct_window_statistics(data=part)
+
+            elapsed: float = time.time() - start_time
+            n: int = ThresholdSearch.evaluations
+            print(
+                f"----> Evaluation {n} of at most {ThresholdSearch.budget} ({self.strategy}), testing thresholds: {thresholds[0]} & {thresholds[1]} on {round(fraction * 100, 1)}% of the data, elapsed: {round(elapsed, 2)} seconds."
+            )
+            part_results: List[
+                List[Tuple[int, int, float, float, float, float, float]]
+            ] = [
+                [
+                    self.test_thresholds(
+                        thresholds=thresholds,
+                        data=part,
+                        DataAnalyzer=DataAnalyzer,
+                        WindowStatistics=statistics[id(part)],
+                    )
+                ]
+                for part in parts
+            ]
+            if len(parts) == 1:
+                return part_results[0][0]
+            aggregated: pd.DataFrame = self.aggregate_results(
+                flight_results=part_results, weights=[len(part) for part in parts]
+            )
+            return (
+                thresholds[0],
+                thresholds[1],
+                *aggregated.iloc[0, 2:].astype(float).tolist(),
+            )
+
+        for result in ThresholdSearch.search(evaluate):
+            results = self.append_result(results=results, result=result)
+
+        return results
+
     def optimize_thresholds(
         self,
         data: pd.DataFrame,
@@ -199,57 +478,84 @@ class ThresholdOptimizer:
         num_iterations_i: float = (self.limit - 10) // self.steps
         num_iterations_j: float = (self.limit - 10) // self.steps
         total_iterations: float = num_iterations_i * num_iterations_j
+        if self.strategy != "grid" and self.budget is not None:
+            total_iterations = min(self.budget, total_iterations)
         start_time: time.time = time.time()
         previous_duration: float = 0
         estimated_duration: float = total_iterations * self.runtime_estimation
         estimated_time_finished: float = start_time + estimated_duration
 
+        if self.workers > 1 and self.strategy == "grid":
+            estimated_duration /= self.workers
+            estimated_time_finished = start_time + estimated_duration
+
         print(f"Total iterations: {total_iterations}")
         print(
-            f"--> Expected duration (initial estimation of runtime per iteration is {self.runtime_estimation} seconds): {round(total_iterations * self.runtime_estimation, 2)} seconds, {round(total_iterations * self.runtime_estimation / 60, 2)} minutes, {round(total_iterations * self.runtime_estimation / 3600, 2)} hours. Estimated time finished: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_time_finished))}."
+            f"--> Expected duration (initial estimation of runtime per iteration is {self.runtime_estimation} seconds): {round(estimated_duration, 2)} seconds, {round(estimated_duration / 60, 2)} minutes, {round(estimated_duration / 3600, 2)} hours. Estimated time finished: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_time_finished))}."
         )
         print("--> Testing thresholds...")
 
-        for i in range(10, self.limit, self.steps):  # past threshold
-            for j in range(10, self.limit, self.steps):  # future threshold
+        if self.strategy != "grid":
+            results = self.test_thresholds_search(
+                data=data, DataAnalyzer=DataAnalyzer, results=results
+            )
+        elif self.workers > 1:
+            results = self.test_thresholds_parallel(
+                thresholds=[
+                    (i, j)
+                    for i in range(10, self.limit, self.steps)
+                    for j in range(10, self.limit, self.steps)
+                ],
+                data=data,
+                results=results,
+            )
+        else:
+            WindowStatistics: windowstatistics.WindowStatistics = (
+                self.construct_window_statistics(data=data)
+            )
+
+            for i in range(10, self.limit, self.steps):  # past threshold
+                for j in range(10, self.limit, self.steps):  # future threshold
+
+                    start_iteration = time.time() - start_time
+
+                    print(
+                        f"----> Iteration {n} of {total_iterations}, testing thresholds: {i} & {j}, estimated time remaining: {round(estimated_duration, 2)} seconds, {round(estimated_duration / 60, 2)} minutes, {round(estimated_duration / 3600, 2)} hours. Estimated time finished: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start_time + start_iteration + estimated_duration))}."
+                    )
 
-                start_iteration = time.time() - start_time
+                    thresholds: Tuple[int, int] = (i, j)
+                    result: Tuple[int, int, float, float, float, float, float] = (
+                        self.test_thresholds(
+                            thresholds=thresholds,
+                            data=data,
+                            DataAnalyzer=DataAnalyzer,
+                            WindowStatistics=WindowStatistics,
+                        )
+                    )
 
-                print(
-                    f"----> Iteration {n} of {total_iterations}, testing thresholds: {i} & {j}, estimated time remaining: {round(estimated_duration, 2)} seconds, {round(estimated_duration / 60, 2)} minutes, {round(estimated_duration / 3600, 2)} hours. Estimated time finished: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start_time + start_iteration + estimated_duration))}."
-                )
+                    results = self.append_result(results=results, result=result)
 
-                thresholds: Tuple[int, int] = (i, j)
-                result: Tuple[int, int, float, float, float, float, float] = (
-                    self.test_thresholds(
-                        thresholds=thresholds, data=data, DataAnalyzer=DataAnalyzer
+                    n += 1
+                    previous_duration = time.time() - start_time - start_iteration
+                    estimated_duration = self.calculate_time_remaining(
+                        n=n,
+                        total_iterations=total_iterations,
+                        previous=previous_duration,
                     )
-                )
 
-                results = pd.concat(
-                    [
-                        results,
-                        pd.DataFrame(
-                            {
-                                "angle_past_threshold": [result[0]],
-                                "angle_future_threshold": [result[1]],
-                                "average_r_value": [result[2]],
-                                "average_p_value": [result[3]],
-                                "average_std_err": [result[4]],
-                                "score": [result[5]],
-                                "data_loss": [result[6]],
-                            }
-                        ),
-                    ],
-                    ignore_index=True,
-                )
+        return self.process_results(results=results, start_time=start_time)
 
-                n += 1
-                previous_duration = time.time() - start_time - start_iteration
-                estimated_duration = self.calculate_time_remaining(
-                    n=n, total_iterations=total_iterations, previous=previous_duration
-                )
+    def process_results(self, results: pd.DataFrame, start_time: float) -> pd.DataFrame:
+        """
+        Sort the results by score and store the best thresholds.
+
+        Parameters:
+        - results (pd.DataFrame): The results table.
+        - start_time (float): The start time of the optimization.
 
+        Returns:
+        - pd.DataFrame: The results table sorted by score.
+        """
         print("--> Processing results...")
 
         results = results.sort_values(by="score", ascending=False).reset_index(
@@ -269,21 +575,188 @@ class ThresholdOptimizer:
         )
         return results
 
-    def export_to_csv(self, results: pd.DataFrame) -> None:
+    def read_flight(self, csv_file: str) -> pd.DataFrame:
+        """
+        Read the data of a flight, every file is parsed only once and kept in memory afterwards.
+
+        Parameters:
+        - csv_file (str): The path to the csv, Feather or Parquet file of the flight.
+
+        Returns:
+        - pd.DataFrame: The data of the flight.
+        """
+        if csv_file not in self.flights:
+            self.flights[csv_file] = datastorage.DataStorage().read(csv_file)
+        return self.flights[csv_file]
+
+    def test_flight(
+        self, thresholds: List[Tuple[int, int]], data: pd.DataFrame
+    ) -> List[Tuple[int, int, float, float, float, float, float]]:
+        """
+        Test all thresholds on the data of one flight.
+
+        Parameters:
+        - thresholds (List[Tuple[int, int]]): The thresholds to be tested.
+        - data (pd.DataFrame): The data of the flight.
+
+        Returns:
+        - List[Tuple[int, int, float, float, float, float, float]]: The results of the tests, in the order of the thresholds.
+        """
+        DataAnalyzer: dataanalyzer.DataAnalyzer = self.construct_data_analyzer()
+        WindowStatistics: windowstatistics.WindowStatistics = (
+            self.construct_window_statistics(data=data)
+        )
+        return [
+            self.test_thresholds(
+                thresholds=threshold,
+                data=data,
+                DataAnalyzer=DataAnalyzer,
+                WindowStatistics=WindowStatistics,
+            )
+            for threshold in thresholds
+        ]
+
+    def aggregate_results(
+        self,
+        flight_results: List[List[Tuple[int, int, float, float, float, float, float]]],
+        weights: List[float],
+    ) -> pd.DataFrame:
+        """
+        Aggregate the results of several flights to one result per pair of thresholds. The values are averaged weighted by the given weights, flights without a point on a straight line (undefined regression values) are left out of the regression values and the score, but count for the data loss.
+
+        Parameters:
+        - flight_results (List[List[Tuple[int, int, float, float, float, float, float]]]): The results of test_flight per flight.
+        - weights (List[float]): The weight per flight.
+
+        Returns:
+        - pd.DataFrame: The aggregated results table.
+        """
+        columns: List[str] = [
+            "angle_past_threshold",
+            "angle_future_threshold",
+            "average_r_value",
+            "average_p_value",
+            "average_std_err",
+            "score",
+            "data_loss",
+        ]
+        results: pd.DataFrame = pd.concat(
+            [
+                pd.DataFrame(results, columns=columns).assign(weight=weight)
+                for results, weight in zip(flight_results, weights)
+            ],
+            ignore_index=True,
+        )
+
+        values: pd.DataFrame = results[columns[2:]]
+        weights_valid: pd.DataFrame = values.notna().mul(results["weight"], axis=0)
+        keys: List[pd.Series] = [results[column] for column in columns[:2]]
+        totals: pd.DataFrame = (
+            values.fillna(0).mul(weights_valid).groupby(keys, sort=False).sum()
+        )
+        total_weights: pd.DataFrame = weights_valid.groupby(keys, sort=False).sum()
+
+        return (totals / total_weights.replace(0, np.nan)).reset_index()
+
+    def optimize_thresholds_batch(
+        self, directory: str, file_extension: str = ".csv"
+    ) -> pd.DataFrame:
+        """
+        Optimize the thresholds across all flights of a directory. Every pair of thresholds is tested on every flight, the flights are processed in parallel by the worker processes. The results of the flights are aggregated weighted by the number of points per flight. The search strategies other than grid test at most budget pairs of thresholds in the current process, successive halving tests them on a subset of the flights first.
+
+        Parameters:
+        - directory (str): The directory containing the csv files of the flights.
+        - file_extension (str): The file extension of the csv files.
+
+        Returns:
+        - pd.DataFrame: DataFrame with optimization data to be analyzed.
+        """
+        warnings.simplefilter(
+            action="ignore", category=FutureWarning
+        )  # suppress FutureWarning
+
+        FileProcessor: fileprocessor.FileProcessor = fileprocessor.FileProcessor()
+        csv_files: List[str] = FileProcessor.get_file_paths(directory, file_extension)
+        flights: List[pd.DataFrame] = [
+            self.read_flight(csv_file=csv_file) for csv_file in csv_files
+        ]
+        thresholds: List[Tuple[int, int]] = [
+            (i, j)
+            for i in range(10, self.limit, self.steps)
+            for j in range(10, self.limit, self.steps)
+        ]
+        flight_results: List[
+            List[Tuple[int, int, float, float, float, float, float]]
+        ] = [None] * len(flights)
+        start_time: float = time.time()
+
+        print(
+            f"Total flights: {len(flights)}, total iterations per flight: {len(thresholds)}"
+        )
+        print("--> Testing thresholds...")
+
+        if self.strategy != "grid":
+            search_results: pd.DataFrame = self.test_thresholds_search(
+                data=None,
+                DataAnalyzer=self.construct_data_analyzer(),
+                results=pd.DataFrame(
+                    columns=[
+                        "angle_past_threshold",
+                        "angle_future_threshold",
+                        "average_r_value",
+                        "average_p_value",
+                        "average_std_err",
+                        "score",
+                        "data_loss",
+                    ]
+                ),
+                flights=flights,
+            )
+            return self.process_results(results=search_results, start_time=start_time)
+
+        if self.workers > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = {
+                    executor.submit(_test_flight_worker, self, thresholds, data): n
+                    for n, data in enumerate(flights)
+                }
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    flight_results[futures[future]] = future.result()
+                    print(
+                        f"----> Completed {completed} of {len(flights)} flights ({self.workers} workers), last completed flight: {csv_files[futures[future]]}, elapsed: {round(time.time() - start_time, 2)} seconds."
+                    )
+        else:
+            for n, data in enumerate(flights):
+                flight_results[n] = self.test_flight(thresholds=thresholds, data=data)
+                print(
+                    f"----> Completed {n + 1} of {len(flights)} flights, last completed flight: {csv_files[n]}, elapsed: {round(time.time() - start_time, 2)} seconds."
+                )
+
+        results: pd.DataFrame = self.aggregate_results(
+            flight_results=flight_results, weights=[len(data) for data in flights]
+        )
+        return self.process_results(results=results, start_time=start_time)
+
+    def export_to_csv(self, results: pd.DataFrame, file_format: str = "csv") -> None:
         """
         Export the results to a csv file.
 
         Parameters:
         - results (pd.DataFrame): The results to be exported.
+        - file_format (str): The format of the file (csv, feather or parquet).
 
         Returns:
         - None.
         """
-        results.to_csv(
-            f"{os.path.splitext(self.csv_file)[0]}_optimized.csv",
-            index=False,
+        Storage: datastorage.DataStorage = datastorage.DataStorage()
+        Storage.write(
+            results,
+            Storage.replace_extension(
+                f"{os.path.splitext(self.csv_file)[0]}_optimized.csv", file_format
+            ),
+            file_format=file_format,
         )
-        print("--> Results exported to csv.")
+        print(f"--> Results exported to {file_format}.")
 
     def calculate_optimized_data_loss(self, data: pd.DataFrame) -> int:
         """
@@ -314,4 +787,63 @@ class ThresholdOptimizer:
         return max_distance_index
 
 
+def _initialize_worker(
+    optimizer: ThresholdOptimizer,
+    description: Tuple,
+) -> None:
+    """
+    Initialize a worker process of the parallel optimization by attaching to the shared data and precomputing its window statistics.
+
+    Parameters:
+    - optimizer (ThresholdOptimizer): The optimizer that tests the thresholds.
+    - description (Tuple): The description of the shared data (SharedDataFrame.description).
+
+    Returns:
+    - None.
+    """
+    global _worker_optimizer, _worker_data, _worker_statistics, _worker_memory
+    _worker_memory, _worker_data = shareddataframe.SharedDataFrame.attach(description)
+    _worker_statistics = optimizer.construct_window_statistics(data=_worker_data)
+    _worker_optimizer = optimizer
+
+
+def _test_thresholds_worker(
+    thresholds: Tuple[int, int],
+) -> Tuple[int, int, float, float, float, float, float]:
+    """
+    Test the thresholds in a worker process of the parallel optimization.
+
+    Parameters:
+    - thresholds (Tuple[int, int]): The thresholds to be tested.
+
+    Returns:
+    - Tuple[int, int, float, float, float, float, float]: The results of the test.
+    """
+    return _worker_optimizer.test_thresholds(
+        thresholds=thresholds,
+        data=_worker_data,
+        DataAnalyzer=_worker_optimizer.construct_data_analyzer(),
+        WindowStatistics=_worker_statistics,
+    )
+
+
+def _test_flight_worker(
+    optimizer: ThresholdOptimizer,
+    thresholds: List[Tuple[int, int]],
+    data: pd.DataFrame,
+) -> List[Tuple[int, int, float, float, float, float, float]]:
+    """
+    Test all thresholds on the data of one flight in a worker process of the batch optimization.
+
+    Parameters:
+    - optimizer (ThresholdOptimizer): The optimizer that tests the thresholds.
+    - thresholds (List[Tuple[int, int]]): The thresholds to be tested.
+    - data (pd.DataFrame): The data of the flight.
+
+    Returns:
+    - List[Tuple[int, int, float, float, float, float, float]]: The results of the tests.
+    """
+    return optimizer.test_flight(thresholds=thresholds, data=data)
+
+
 # %%
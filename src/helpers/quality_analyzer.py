@@ -1,20 +1,21 @@
-import os
-import sys
+import numpy as np
 import pandas as pd
-from typing import Tuple
+from typing import Dict, List, Tuple
 
-# AI content (GitHub Copilot, 01/29/2024), verified and adapted by Nicolas Huber.
-src_directory: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
-sys.path.append(src_directory)
-
-import constants as constants
-import algorithms.pressure_analyzer as pressure_analyzer
+from .. import constants
+from ..algorithms import pressure_analyzer as pressure_analyzer
 
 class QualityAnalyzer:
     """
     Analyzes the quality of the data analysis and the models.
     """
 
+    # power-law models of the wing coefficients: model -> ((cA factor, cA exponent), (cW factor, cW exponent))
+    MODELS: Dict[str, Tuple[Tuple[float, float], Tuple[float, float]]] = {
+        "original": ((27.911, -1.929), (15.376, -2.511)),
+        "new": ((35.8588, -1.9862), (15.5624, -2.5126)),
+    }
+
     def __init__(self) -> None:
         """
         Initializes the QualityAnalyzer object.
@@ -39,7 +40,8 @@ class QualityAnalyzer:
         Returns:
         - (float): The approximation of the wing lift coefficient.
         """
-        return 27.911 * (airspeed ** (-1.929))
+        factor, exponent = self.MODELS["original"][0]
+        return factor * (airspeed ** exponent)
     
     def calculate_cW_approximation_original(self, airspeed: float) -> float:
         """
@@ -53,7 +55,8 @@ class QualityAnalyzer:
         Returns:
         - (float): The approximation of the wing drag coefficient.
         """
-        return 15.376 * (airspeed ** (-2.511))
+        factor, exponent = self.MODELS["original"][1]
+        return factor * (airspeed ** exponent)
 
     def calculate_cA_approximation(self, airspeed: float) -> float:
         """
@@ -65,7 +68,8 @@ class QualityAnalyzer:
         Returns:
         - (float): The approximation of the wing lift coefficient.
         """
-        return 35.8588 * (airspeed ** (-1.9862))
+        factor, exponent = self.MODELS["new"][0]
+        return factor * (airspeed ** exponent)
     
     def calculate_cW_approximation(self, airspeed: float) -> float:
         """
@@ -77,7 +81,8 @@ class QualityAnalyzer:
         Returns:
         - (float): The approximation of the wing drag coefficient.
         """
-        return 15.5624 * (airspeed ** (-2.5126))
+        factor, exponent = self.MODELS["new"][1]
+        return factor * (airspeed ** exponent)
 
     def analyze_quality(self, data: pd.DataFrame, model: bool = True) -> Tuple[float, float, pd.DataFrame]:
         """
@@ -92,24 +97,10 @@ class QualityAnalyzer:
         """
         expected_force: float = (constants.MASS + constants.MASS_TRESHOLD)* constants.GRAVITY
 
-        if model:
-            data['resulting force [N]'] = data.apply(
-                lambda row: self.p_analyzer.calculate_force_resultant(
-                    airspeed=row['airspeed [m/s]'],
-                    Ca=self.calculate_cA_approximation(row['airspeed [m/s]']),
-                    Cw=self.calculate_cW_approximation(row['airspeed [m/s]']),
-                ),
-                axis=1
-            )
-        else:
-            data['resulting force [N]'] = data.apply(
-                lambda row: self.p_analyzer.calculate_force_resultant(
-                    airspeed=row['airspeed [m/s]'],
-                    Ca=self.calculate_cA_approximation_original(row['airspeed [m/s]']),
-                    Cw=self.calculate_cW_approximation_original(row['airspeed [m/s]']),
-                ),
-                axis=1
-            )
+        data['resulting force [N]'] = self.calculate_resulting_forces(
+            airspeed=data['airspeed [m/s]'].to_numpy(dtype=np.float64),
+            models=["new" if model else "original"],
+        )[0]
 
         data['deviation [N]'] = expected_force - data['resulting force [N]']
         data['deviation percentage [%]'] = (data['resulting force [N]'] / expected_force) * 100
@@ -118,3 +109,51 @@ class QualityAnalyzer:
         deviation_percentage: float = data['deviation percentage [%]'].mean() - 100
 
         return mean_deviation, deviation_percentage, data
+
+    def calculate_resulting_forces(self, airspeed: np.ndarray, models: List[str]) -> np.ndarray:
+        """
+        Calculates the resulting force at the wing for all airspeed data points and models at once, the wing coefficients are evaluated over whole arrays instead of one data point at a time.
+
+        Args:
+        - airspeed (np.ndarray): The airspeed data points.
+        - models (List[str]): The models to evaluate, keys of QualityAnalyzer.MODELS.
+
+        Returns:
+        - (np.ndarray): The resulting force, one row per model and one column per airspeed data point.
+        """
+        coefficients: np.ndarray = np.array([self.MODELS[model] for model in models], dtype=np.float64)
+        cA_factor, cA_exponent = coefficients[:, 0, 0, None], coefficients[:, 0, 1, None]
+        cW_factor, cW_exponent = coefficients[:, 1, 0, None], coefficients[:, 1, 1, None]
+
+        return self.p_analyzer.calculate_force_resultant(
+            airspeed=airspeed,
+            Ca=cA_factor * np.power(airspeed, cA_exponent),
+            Cw=cW_factor * np.power(airspeed, cW_exponent),
+        )
+
+    def analyze_models(self, data: pd.DataFrame, models: List[str] = None) -> pd.DataFrame:
+        """
+        Analyzes the quality of all models in a single call, the data is not modified. This is equivalent to calling analyze_quality once per model, but suited for millions of airspeed data points. Missing airspeed data points (NaN) are skipped like in the pandas mean of analyze_quality.
+        
+        Args:
+        - data (pd.DataFrame): The data to analyze.
+        - models (List[str]): The models to evaluate, keys of QualityAnalyzer.MODELS (default: all models).
+
+        Returns:
+        - (pd.DataFrame): The mean deviation [N] and the mean deviation percentage [%] per model.
+        """
+        models = list(self.MODELS) if models is None else models
+        expected_force: float = (constants.MASS + constants.MASS_TRESHOLD)* constants.GRAVITY
+
+        resulting_forces: np.ndarray = self.calculate_resulting_forces(
+            airspeed=data['airspeed [m/s]'].to_numpy(dtype=np.float64),
+            models=models,
+        )
+
+        return pd.DataFrame(
+            {
+                'mean deviation [N]': np.nanmean(expected_force - resulting_forces, axis=1),
+                'mean deviation percentage [%]': np.nanmean(resulting_forces / expected_force * 100, axis=1) - 100,
+            },
+            index=pd.Index(models, name='model'),
+        )
@@ -0,0 +1,115 @@
+# %%
+
+import numpy as np
+import pandas as pd
+from multiprocessing import shared_memory
+from typing import Any, List, Tuple
+
+
+class SharedDataFrame:
+    """
+    Class to share a DataFrame with worker processes through a single block of shared memory. The columns are copied into the block once and the workers attach to it by name, so the data does not need to be pickled for every task. Object columns (e.g. timestamps) are shared as fixed-width strings, their missing values are restored as NaN.
+
+    To use this class the following code snippet can be used:
+
+    with SharedDataFrame(data) as shared:
+        # pass shared.description to the workers
+        memory, data = SharedDataFrame.attach(shared.description)
+    """
+
+    def __init__(self, data: pd.DataFrame) -> None:
+        """
+        Copy the DataFrame to a new block of shared memory.
+
+        Parameters:
+        - data (pd.DataFrame): The DataFrame to be shared.
+
+        Returns:
+        - None.
+        """
+        arrays: List[np.ndarray] = [data.index.to_numpy()] + [
+            data[column].to_numpy() for column in data.columns
+        ]
+        # positions of the missing values of the object columns, which would be shared as the strings "nan" or "None"
+        nulls: List[List[int]] = [
+            np.flatnonzero(pd.isna(values)).tolist() if values.dtype == object else []
+            for values in arrays
+        ]
+        arrays = [
+            values.astype(str) if values.dtype == object else values
+            for values in arrays
+        ]
+
+        layout: List[Tuple[str, Tuple[int, ...], int, List[int]]] = []
+        offset: int = 0
+        for values, positions in zip(arrays, nulls):
+            layout.append((values.dtype.str, values.shape, offset, positions))
+            offset += -(-values.nbytes // 8) * 8  # keep every column 8-byte aligned
+
+        self.memory: shared_memory.SharedMemory = shared_memory.SharedMemory(
+            create=True, size=max(offset, 1)
+        )
+        for values, (dtype, shape, offset, _) in zip(arrays, layout):
+            np.ndarray(shape, dtype=dtype, buffer=self.memory.buf, offset=offset)[
+                ...
+            ] = values
+
+        self.description: Tuple[
+            str, List[Any], List[Tuple[str, Tuple[int, ...], int, List[int]]]
+        ] = (
+            self.memory.name,
+            list(data.columns),
+            layout,
+        )
+
+    @staticmethod
+    def attach(
+        description: Tuple[
+            str, List[Any], List[Tuple[str, Tuple[int, ...], int, List[int]]]
+        ],
+    ) -> Tuple[shared_memory.SharedMemory, pd.DataFrame]:
+        """
+        Attach to a shared DataFrame from a worker process.
+
+        Parameters:
+        - description (Tuple): The description of the shared DataFrame (SharedDataFrame.description).
+
+        Returns:
+        - Tuple[shared_memory.SharedMemory, pd.DataFrame]: The shared memory block, which has to be kept alive as long as the DataFrame is used, and the DataFrame.
+        """
+        name, columns, layout = description
+        memory: shared_memory.SharedMemory = shared_memory.SharedMemory(name=name)
+        arrays: List[np.ndarray] = [
+            np.ndarray(shape, dtype=dtype, buffer=memory.buf, offset=offset)
+            for dtype, shape, offset, _ in layout
+        ]
+        arrays = [
+            values.astype(object) if values.dtype.kind == "U" else values
+            for values in arrays
+        ]
+        for values, (_, _, _, positions) in zip(arrays, layout):
+            if positions:
+                values[positions] = np.nan
+        data: pd.DataFrame = pd.DataFrame(
+            dict(zip(columns, arrays[1:])), index=arrays[0], copy=False
+        )
+        return memory, data
+
+    def close(self) -> None:
+        """
+        Release the shared memory block.
+
+        Parameters:
+        - None.
+
+        Returns:
+        - None.
+        """
+        self.memory.close()
+        self.memory.unlink()
+
+    def __enter__(self) -> "SharedDataFrame":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
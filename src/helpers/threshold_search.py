@@ -0,0 +1,351 @@
+# %%
+
+import abc
+import math
+import numpy as np
+from typing import Callable, Dict, List, Tuple
+
+# result of ThresholdOptimizer.test_thresholds: (past, future, r_value, p_value, std_err, score, data_loss)
+Result = Tuple[int, int, float, float, float, float, float]
+
+
+class ThresholdSearch(abc.ABC):
+    """
+    Base class of the search strategies of the ThresholdOptimizer. A strategy decides which pairs of thresholds are tested and stops as soon as its budget of evaluations is used up. The evaluations are scored by ThresholdOptimizer.calculate_score, i.e. all strategies optimize the same objective as the exhaustive grid.
+
+    A strategy is used by calling search with a function that tests a pair of thresholds on a fraction of the data:
+
+    results = CoarseToFineSearch(thresholds=list(range(10, 300)), budget=200).search(evaluate)
+    """
+
+    def __init__(self, thresholds: List[int], budget: int, seed: int = 0) -> None:
+        """
+        Initialize the class.
+
+        Parameters:
+        - thresholds (List[int]): The candidate values of both the past and the future threshold, in ascending order.
+        - budget (int): The maximum number of evaluations (calls of the evaluate function).
+        - seed (int): The seed of the random number generator.
+
+        Returns:
+        - None.
+        """
+        self.thresholds = thresholds
+        self.budget = budget
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+        self.evaluations: int = 0
+        self.results: Dict[Tuple[int, int], Result] = {}
+
+    @abc.abstractmethod
+    def search(
+        self, evaluate: Callable[[Tuple[int, int], float], Result]
+    ) -> List[Result]:
+        """
+        Search the best pair of thresholds, implemented by every strategy.
+
+        Parameters:
+        - evaluate (Callable[[Tuple[int, int], float], Result]): The function that tests a pair of thresholds on the given fraction of the data.
+
+        Returns:
+        - List[Result]: The results of all pairs of thresholds that were tested on the complete data, in the order of evaluation.
+        """
+
+    def exhausted(self) -> bool:
+        """
+        Check whether the budget of evaluations is used up.
+
+        Parameters:
+        - None.
+
+        Returns:
+        - bool: True if no evaluation is left, False otherwise.
+        """
+        return self.evaluations >= self.budget
+
+    def evaluate_thresholds(
+        self,
+        evaluate: Callable[[Tuple[int, int], float], Result],
+        indices: Tuple[int, int],
+        fraction: float = 1.0,
+    ) -> float:
+        """
+        Test a pair of thresholds unless it was already tested on the complete data or the budget is used up.
+
+        Parameters:
+        - evaluate (Callable[[Tuple[int, int], float], Result]): The function that tests a pair of thresholds.
+        - indices (Tuple[int, int]): The indices of the past and future threshold in self.thresholds.
+        - fraction (float): The fraction of the data to test the thresholds on.
+
+        Returns:
+        - float: The score of the thresholds, -inf if they could not be tested or the score is undefined.
+        """
+        thresholds: Tuple[int, int] = (
+            self.thresholds[indices[0]],
+            self.thresholds[indices[1]],
+        )
+        if fraction >= 1.0 and thresholds in self.results:
+            return self.rank(self.results[thresholds])
+        if self.exhausted():
+            return -math.inf
+
+        self.evaluations += 1
+        result: Result = evaluate(thresholds, fraction)
+        if fraction >= 1.0:
+            self.results[thresholds] = result
+        return self.rank(result)
+
+    def rank(self, result: Result) -> float:
+        """
+        Get the score of a result for ranking, undefined scores (no point on a straight line) rank last.
+
+        Parameters:
+        - result (Result): The result of ThresholdOptimizer.test_thresholds.
+
+        Returns:
+        - float: The score of the result, -inf if it is undefined.
+        """
+        score: float = float(result[5])
+        return -math.inf if math.isnan(score) else score
+
+    def best(self) -> Tuple[int, int]:
+        """
+        Get the indices of the best pair of thresholds tested on the complete data so far.
+
+        Parameters:
+        - None.
+
+        Returns:
+        - Tuple[int, int]: The indices of the past and future threshold in self.thresholds.
+        """
+        thresholds: Tuple[int, int] = max(
+            self.results, key=lambda key: self.rank(self.results[key])
+        )
+        return self.thresholds.index(thresholds[0]), self.thresholds.index(
+            thresholds[1]
+        )
+
+
+class CoarseToFineSearch(ThresholdSearch):
+    """
+    Search strategy that tests a coarse grid of thresholds first and then repeatedly halves the grid spacing around the best pair found so far, until the spacing equals the step size of the candidates and the best pair no longer changes.
+    """
+
+    def search(
+        self, evaluate: Callable[[Tuple[int, int], float], Result]
+    ) -> List[Result]:
+        """
+        Search the best pair of thresholds by coarse-to-fine grid refinement.
+
+        Parameters:
+        - evaluate (Callable[[Tuple[int, int], float], Result]): The function that tests a pair of thresholds on the given fraction of the data.
+
+        Returns:
+        - List[Result]: The results of all tested pairs of thresholds, in the order of evaluation.
+        """
+        count: int = len(self.thresholds)
+
+        # the coarse grid uses at most half of the budget, the rest is left for the refinement
+        stride: int = 1
+        while math.ceil(count / stride) ** 2 > max(self.budget // 2, 1):
+            stride *= 2
+
+        for i in range(0, count, stride):
+            for j in range(0, count, stride):
+                self.evaluate_thresholds(evaluate, (i, j))
+
+        while self.results and not self.exhausted():
+            best: Tuple[int, int] = self.best()
+            stride = max(stride // 2, 1)
+            for i in (best[0] - stride, best[0], best[0] + stride):
+                for j in (best[1] - stride, best[1], best[1] + stride):
+                    if 0 <= i < count and 0 <= j < count:
+                        self.evaluate_thresholds(evaluate, (i, j))
+            if stride == 1 and self.best() == best:
+                break
+
+        return list(self.results.values())
+
+
+class SuccessiveHalvingSearch(ThresholdSearch):
+    """
+    Search strategy that tests randomly drawn pairs of thresholds on a small fraction of the data first. After every round only the better half of the pairs is kept and tested on twice the fraction of the data, the last round tests the remaining pairs on the complete data.
+    """
+
+    def __init__(
+        self,
+        thresholds: List[int],
+        budget: int,
+        seed: int = 0,
+        min_fraction: float = 0.125,
+    ) -> None:
+        """
+        Initialize the class.
+
+        Parameters:
+        - thresholds (List[int]): The candidate values of both the past and the future threshold, in ascending order.
+        - budget (int): The maximum number of evaluations (calls of the evaluate function).
+        - seed (int): The seed of the random number generator.
+        - min_fraction (float): The fraction of the data used in the first round, fewer rounds starting at a larger fraction are used if the budget is too small.
+
+        Returns:
+        - None.
+        """
+        super().__init__(thresholds=thresholds, budget=budget, seed=seed)
+        self.min_fraction = min_fraction
+
+    def cost(self, candidates: int, rounds: int) -> int:
+        """
+        Calculate the number of evaluations of successive halving.
+
+        Parameters:
+        - candidates (int): The number of pairs of thresholds in the first round.
+        - rounds (int): The number of rounds.
+
+        Returns:
+        - int: The number of evaluations over all rounds.
+        """
+        evaluations: int = 0
+        for _ in range(rounds):
+            evaluations += candidates
+            candidates = max(candidates // 2, 1)
+        return evaluations
+
+    def search(
+        self, evaluate: Callable[[Tuple[int, int], float], Result]
+    ) -> List[Result]:
+        """
+        Search the best pair of thresholds by successive halving.
+
+        Parameters:
+        - evaluate (Callable[[Tuple[int, int], float], Result]): The function that tests a pair of thresholds on the given fraction of the data.
+
+        Returns:
+        - List[Result]: The results of the pairs of thresholds tested on the complete data, in the order of evaluation.
+        """
+        count: int = len(self.thresholds)
+        rounds: int = max(int(round(math.log2(1 / self.min_fraction))), 0) + 1
+
+        # n + n/2 + n/4 + ... evaluations over all rounds, i.e. less than 2n
+        candidates: int = min(max(self.budget // 2, 1), count * count)
+        while rounds > 1 and self.cost(candidates, rounds) > self.budget:
+            rounds -= 1
+        drawn: np.ndarray = self.rng.choice(
+            count * count, size=candidates, replace=False
+        )
+        pairs: List[Tuple[int, int]] = [
+            (int(index) // count, int(index) % count) for index in drawn
+        ]
+
+        for n in range(rounds):
+            fraction: float = 1.0 if n == rounds - 1 else 2.0 ** (n - rounds + 1)
+            scores: List[float] = [
+                self.evaluate_thresholds(evaluate, pair, fraction) for pair in pairs
+            ]
+            if fraction >= 1.0:
+                break
+            order: List[int] = sorted(
+                range(len(pairs)), key=lambda index: scores[index], reverse=True
+            )
+            pairs = [pairs[index] for index in order[: max(len(pairs) // 2, 1)]]
+
+        return list(self.results.values())
+
+
+class SurrogateSearch(ThresholdSearch):
+    """
+    Search strategy that fits a quadratic surrogate model of the score to the tested pairs of thresholds and tests the pair with the highest upper confidence bound next. The uncertainty of a pair grows with its distance to the closest tested pair, which balances exploring untested regions against refining the best region.
+    """
+
+    def __init__(
+        self,
+        thresholds: List[int],
+        budget: int,
+        seed: int = 0,
+        exploration: float = 2.0,
+    ) -> None:
+        """
+        Initialize the class.
+
+        Parameters:
+        - thresholds (List[int]): The candidate values of both the past and the future threshold, in ascending order.
+        - budget (int): The maximum number of evaluations (calls of the evaluate function).
+        - seed (int): The seed of the random number generator.
+        - exploration (float): The weight of the uncertainty in the upper confidence bound.
+
+        Returns:
+        - None.
+        """
+        super().__init__(thresholds=thresholds, budget=budget, seed=seed)
+        self.exploration = exploration
+
+    def features(self, pairs: np.ndarray) -> np.ndarray:
+        """
+        Calculate the features of the quadratic surrogate model.
+
+        Parameters:
+        - pairs (np.ndarray): The normalized pairs of thresholds, one row per pair.
+
+        Returns:
+        - np.ndarray: The features 1, x, y, x², y² and xy, one row per pair.
+        """
+        x, y = pairs[:, 0], pairs[:, 1]
+        return np.column_stack((np.ones(len(pairs)), x, y, x * x, y * y, x * y))
+
+    def search(
+        self, evaluate: Callable[[Tuple[int, int], float], Result]
+    ) -> List[Result]:
+        """
+        Search the best pair of thresholds by surrogate model search.
+
+        Parameters:
+        - evaluate (Callable[[Tuple[int, int], float], Result]): The function that tests a pair of thresholds on the given fraction of the data.
+
+        Returns:
+        - List[Result]: The results of all tested pairs of thresholds, in the order of evaluation.
+        """
+        count: int = len(self.thresholds)
+        grid: np.ndarray = np.array(
+            [(i, j) for i in range(count) for j in range(count)]
+        )
+        normalized: np.ndarray = grid / max(count - 1, 1)
+        features: np.ndarray = self.features(normalized)
+        tested: np.ndarray = np.zeros(len(grid), dtype=bool)
+        scores: np.ndarray = np.full(len(grid), -np.inf)
+        # distance of every pair to the closest tested pair
+        distances: np.ndarray = np.full(len(grid), np.inf)
+
+        def test(index: int) -> None:
+            scores[index] = self.evaluate_thresholds(evaluate, tuple(grid[index]))
+            tested[index] = True
+            np.minimum(
+                distances,
+                np.linalg.norm(normalized - normalized[index], axis=1),
+                out=distances,
+            )
+
+        initial: int = min(max(self.budget // 4, 6), len(grid))
+        for index in self.rng.choice(len(grid), size=initial, replace=False):
+            test(index)
+
+        while not self.exhausted() and not tested.all():
+            valid: np.ndarray = tested & np.isfinite(scores)
+            if valid.sum() < features.shape[1]:
+                index: int = self.rng.choice(np.flatnonzero(~tested))
+            else:
+                coefficients, _, _, _ = np.linalg.lstsq(
+                    features[valid], scores[valid], rcond=None
+                )
+                prediction: np.ndarray = features @ coefficients
+                spread: float = float(np.std(scores[valid] - prediction[valid]))
+                bound: np.ndarray = prediction + self.exploration * (
+                    spread + 1e-9
+                ) * distances * math.sqrt(count)
+                bound[tested] = -np.inf
+                index = int(np.argmax(bound))
+
+            test(index)
+
+        return list(self.results.values())
+
+
+# %%
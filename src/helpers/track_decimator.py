@@ -0,0 +1,164 @@
+# %%
+
+import hashlib
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from typing import List, Tuple
+
+from .. import constants
+
+
+class TrackDecimator:
+    """
+    Class to reduce the number of points of a tracklog before it is plotted (level of detail). The points are selected with the Largest-Triangle-Three-Buckets algorithm (LTTB), which keeps the points that shape the track the most. If a category column is given (e.g. position_int), the track is decimated per run of the same category and the first and last point of every run are kept, so the boundaries between straight lines and curves stay where they are. The selected points are cached per flight, so plotting the same flight again does not decimate it again.
+
+    To use this class the following code snippet can be used:
+
+    Decimator = TrackDecimator(max_points=5000)
+    points = Decimator.decimate(data, x="longitude", y="latitude", category="position_int")
+    """
+
+    def __init__(
+        self,
+        max_points: int = constants.PLOT_MAX_POINTS,
+        cache_size: int = constants.PLOT_CACHE_SIZE,
+    ) -> None:
+        """
+        Initialize the TrackDecimator object.
+
+        Parameters:
+        - max_points (int): The maximum number of points of a decimated track, None to keep all points.
+        - cache_size (int): The number of decimated tracks that are cached.
+
+        Returns:
+        - None.
+        """
+        self.max_points = max_points
+        self.cache_size = cache_size
+        self.cache: OrderedDict = OrderedDict()
+
+    def lttb(self, x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+        """
+        Select n_out points of a line with the Largest-Triangle-Three-Buckets algorithm. The first and the last point are kept, the points in between are split into n_out - 2 buckets and the point of every bucket is selected that forms the largest triangle with the point selected in the previous bucket and the average of the next bucket.
+
+        Parameters:
+        - x (np.ndarray): The x values of the points, in the order of the line.
+        - y (np.ndarray): The y values of the points.
+        - n_out (int): The number of points to select.
+
+        Returns:
+        - np.ndarray: The positions of the selected points, ascending.
+        """
+        n: int = len(x)
+        if n_out >= n:
+            return np.arange(n)
+        if n_out < 3:
+            return np.unique([0, n - 1])
+
+        # bucket i contains the points edges[i] to edges[i + 1] - 1, the last bucket only the last point
+        every: float = (n - 2) / (n_out - 2)
+        edges: np.ndarray = np.append(
+            (np.arange(n_out - 1) * every).astype(np.intp) + 1, n
+        )
+        x_means: np.ndarray = np.add.reduceat(x, edges[:-1]) / np.diff(edges)
+        y_means: np.ndarray = np.add.reduceat(y, edges[:-1]) / np.diff(edges)
+
+        selected: np.ndarray = np.empty(n_out, dtype=np.intp)
+        selected[0], selected[-1] = 0, n - 1
+        a: int = 0
+        for i in range(n_out - 2):
+            lower, upper = edges[i], edges[i + 1]
+            area: np.ndarray = np.abs(
+                (x[a] - x_means[i + 1]) * (y[lower:upper] - y[a])
+                - (x[a] - x[lower:upper]) * (y_means[i + 1] - y[a])
+            )
+            a = lower + int(np.argmax(area))
+            selected[i + 1] = a
+        return selected
+
+    def select_points(
+        self, x: np.ndarray, y: np.ndarray, category: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Select at most max_points points of a track. With categories, the first and last point of every run of the same category are kept and the remaining points are shared between the runs in proportion to their length. A track with more run boundaries than max_points is decimated as a whole.
+
+        Parameters:
+        - x (np.ndarray): The x values of the points.
+        - y (np.ndarray): The y values of the points.
+        - category (np.ndarray): The category of every point, None to decimate the track as a whole.
+
+        Returns:
+        - np.ndarray: The positions of the selected points, ascending.
+        """
+        n: int = len(x)
+        if self.max_points is None or n <= self.max_points:
+            return np.arange(n)
+        if category is None:
+            return self.lttb(x, y, self.max_points)
+
+        starts: np.ndarray = np.append(
+            0, np.flatnonzero(category[1:] != category[:-1]) + 1
+        )
+        ends: np.ndarray = np.append(starts[1:], n)
+        lengths: np.ndarray = ends - starts
+        boundaries: np.ndarray = np.minimum(lengths, 2)
+        if boundaries.sum() > self.max_points:
+            return self.lttb(x, y, self.max_points)
+
+        # the points left after the boundaries, rounded down so the total stays within max_points
+        remaining: int = self.max_points - int(boundaries.sum())
+        n_outs: np.ndarray = boundaries + np.minimum(
+            lengths - boundaries, remaining * lengths // n
+        )
+        selected: List[np.ndarray] = []
+        for start, end, n_out in zip(starts, ends, n_outs):
+            selected.append(start + self.lttb(x[start:end], y[start:end], int(n_out)))
+        return np.concatenate(selected)
+
+    def decimate(
+        self, data: pd.DataFrame, x: str, y: str, category: str = None
+    ) -> pd.DataFrame:
+        """
+        Decimate a track, the selected points of a flight are cached by the content of its columns.
+
+        Parameters:
+        - data (pd.DataFrame): The track.
+        - x (str): The column of the x values, e.g. longitude, None to use the index of the points.
+        - y (str): The column of the y values, e.g. latitude.
+        - category (str): The column of the categories whose boundaries are kept, e.g. position_int, None to decimate the track as a whole.
+
+        Returns:
+        - pd.DataFrame: The selected rows of the track, with their original index.
+        """
+        if self.max_points is None or len(data) <= self.max_points:
+            return data
+
+        columns: List[np.ndarray] = [
+            (
+                np.arange(len(data), dtype=np.float64)
+                if x is None
+                else data[x].to_numpy(dtype=np.float64)
+            ),
+            data[y].to_numpy(dtype=np.float64),
+        ]
+        if category is not None:
+            columns.append(pd.factorize(data[category])[0])
+
+        digest = hashlib.blake2b(digest_size=16)
+        for column in columns:
+            digest.update(np.ascontiguousarray(column).view(np.uint8))
+        key: Tuple = (x, y, category, self.max_points, digest.hexdigest())
+
+        positions: np.ndarray = self.cache.get(key)
+        if positions is None:
+            positions = self.select_points(*columns)
+            self.cache[key] = positions
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        else:
+            self.cache.move_to_end(key)
+        return data.iloc[positions]
+
+
+# %%
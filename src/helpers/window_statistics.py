@@ -0,0 +1,72 @@
+# %%
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Tuple
+
+from ..algorithms import angle_analyzer as angleanalyzer
+
+
+class WindowStatistics:
+    """
+    Class to share the window analyses of a flight between several runs of DataAnalyzer.process_data, e.g. while the ThresholdOptimizer tests many pairs of thresholds. The coordinates are extracted and, in rolling regression mode, the cumulative moments are calculated once per flight. The angle and linear regression analyses are calculated once per window length and reused for every pair of thresholds that contains this window length.
+
+    To use this class the following code snippet can be used:
+
+    Statistics = WindowStatistics(data, AngleAnalyzer)
+    data_processed = DataAnalyzer.process_data(data, AngleAnalyzer, 95, 90, WindowStatistics=Statistics)
+    """
+
+    def __init__(
+        self, data: pd.DataFrame, AngleAnalyzer: angleanalyzer.AngleAnalyzer
+    ) -> None:
+        """
+        Extract the coordinates of the flight and calculate its cumulative moments.
+
+        Parameters:
+        - data (pd.DataFrame): The dataset to be analyzed.
+        - AngleAnalyzer (angleanalyzer.AngleAnalyzer): The AngleAnalyzer object, its angle and linear regression thresholds apply to all window lengths.
+
+        Returns:
+        - None.
+        """
+        self.AngleAnalyzer = AngleAnalyzer
+        self.longitude: np.ndarray = data["longitude"].to_numpy(dtype=np.float64)
+        self.latitude: np.ndarray = data["latitude"].to_numpy(dtype=np.float64)
+        self.moments: Tuple[np.ndarray, ...] = None
+        if AngleAnalyzer.rolling_regression and len(self.longitude) > 0:
+            self.moments = AngleAnalyzer.calculate_cumulative_moments(
+                longitude=self.longitude, latitude=self.latitude
+            )
+        self.windows: Dict[int, Tuple[np.ndarray, Tuple[np.ndarray, ...]]] = {}
+
+    def analyze_window(self, window: int) -> Tuple[np.ndarray, Tuple[np.ndarray, ...]]:
+        """
+        Analyze every window of the given length, the results are cached per window length.
+
+        Parameters:
+        - window (int): The number of coordinates per window.
+
+        Returns:
+        - Tuple[np.ndarray, Tuple[np.ndarray, ...]]: The statuses of the angle analysis and the results of the linear regression analysis (status, slope, intercept, r-value, p-value, standard error) of the window starting at every index.
+        """
+        if window not in self.windows:
+            status_angle: np.ndarray = self.AngleAnalyzer.analyze_window_angles(
+                longitude=self.longitude, latitude=self.latitude, window=window
+            )
+            if self.moments is not None and len(self.longitude) >= window:
+                regression: Tuple[np.ndarray, ...] = (
+                    self.AngleAnalyzer.analyze_cumulative_linear_regressions(
+                        moments=self.moments, window=window
+                    )
+                )
+            else:
+                regression = self.AngleAnalyzer.analyze_window_linear_regressions(
+                    longitude=self.longitude, latitude=self.latitude, window=window
+                )
+            self.windows[window] = (status_angle, regression)
+
+        return self.windows[window]
+
+
+# %%
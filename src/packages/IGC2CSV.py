@@ -23,11 +23,39 @@ COPYRIGHT NOTICE:
 """
 
 import os
+import mmap
 import datetime
+import itertools
+import numpy as np
 import pandas as pd
 from math import radians, sin, cos, asin, sqrt
 from typing import List, Dict, Any, Tuple
 
+# value of every ASCII code in the numeric fields of B records, characters other than digits count as 0
+DIGITS: np.ndarray = np.zeros(256, dtype=np.int64)
+DIGITS[ord("0") : ord("9") + 1] = np.arange(10)
+
+# columns of the DataFrame of process_files, followed by the TAS columns if the flight has a TAS extension
+OUTPUT_COLUMNS: List[str] = [
+    "Datetime (UTC)",
+    "Elapsed Time",
+    "Latitude (Degrees)",
+    "Longitude (Degrees)",
+    "Altitude GPS",
+    "Distance Delta",
+    "Distance Total",
+    "Groundspeed",
+    "Groundspeed Peak",
+    "Altitude Delta (GPS)",
+    "Altitude Delta (Pressure)",
+    "Climb Speed",
+    "Climb Total",
+    "Max Altitude (flight)",
+    "Min Altitude (flight)",
+    "Distance From Start (straight line)",
+]
+TAS_COLUMNS: List[str] = ["True Airspeed", "True Airspeed Peak"]
+
 
 class IGC2CSV:
     """
@@ -90,7 +118,7 @@ class IGC2CSV:
     # AI content (ChatGPT, 02/17/2024), verified and adapted by Nicolas Huber.
     def crunch_flight(self, flight: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Adds calculated fields to the flight dictionary.
+        Adds calculated fields to the flight dictionary. The fields of all records are calculated at once by calculate_fields and written to the records afterwards.
 
         Parameters:
         - flight: The flight dictionary to be updated with calculated data.
@@ -98,104 +126,394 @@ class IGC2CSV:
         Returns:
         - flight: The updated flight dictionary.
         """
-        for index, record in enumerate(flight["fixrecords"]):
-            # thisdatetime = datetime.datetime.strptime(record['timestamp'], '')
-            record["latdegrees"] = self.lat_to_degrees(record["latitude"])
-            record["londegrees"] = self.lon_to_degrees(record["longitude"])
+        records: List[Dict[str, Any]] = flight["fixrecords"]
+        if not records:
+            return flight
+
+        timestamps: np.ndarray = self.character_matrix(
+            [record["timestamp"] for record in records]
+        )
+        latitudes: np.ndarray = self.character_matrix(
+            [record["latitude"] for record in records]
+        )
+        longitudes: np.ndarray = self.character_matrix(
+            [record["longitude"] for record in records]
+        )
+        alt_gps: np.ndarray = np.array([record["alt-GPS"] for record in records])
+        pressure: np.ndarray = np.array([record["pressure"] for record in records])
 
-            record["time"] = datetime.time(
-                int(record["timestamp"][0:2]),
-                int(record["timestamp"][2:4]),
-                int(record["timestamp"][4:6]),
-                0,
+        latdegrees: np.ndarray = self.degrees_array(
+            self.decode_integers(latitudes, 0, 2),
+            self.decode_integers(latitudes, 2, 7),
+            np.where(latitudes[:, 7] == ord("N"), 1, -1),
+        )
+        londegrees: np.ndarray = self.degrees_array(
+            self.decode_integers(longitudes, 0, 3),
+            self.decode_integers(longitudes, 3, 8),
+            np.where(longitudes[:, 8] == ord("E"), 1, -1),
+        )
+        fields: Dict[str, np.ndarray] = self.calculate_fields(
+            flightdate=flight["flightdate"],
+            seconds=self.decode_integers(timestamps, 0, 2) * 3600
+            + self.decode_integers(timestamps, 2, 4) * 60
+            + self.decode_integers(timestamps, 4, 6),
+            latdegrees=latdegrees,
+            londegrees=londegrees,
+            alt_gps=alt_gps,
+            pressure=pressure,
+        )
+        datetimes: List[datetime.datetime] = (
+            fields.pop("datetime").astype("datetime64[us]").astype(object).tolist()
+        )
+
+        flight["time_start"] = datetimes[0].time()
+        flight["datetime_start"] = datetimes[0]
+        flight["altitude_start"] = records[0]["alt-GPS"]
+        flight["distance_total"] = fields["distance_total"][-1].item()
+        flight["climb_total"] = fields["climb_total"][-1].item()
+        flight["alt_peak"] = alt_gps.max().item()
+        flight["alt_floor"] = alt_gps.min().item()
+        flight["groundspeed_peak"] = fields["groundspeed_peak"][-1].item()
+
+        values: Dict[str, List[Any]] = {
+            key: array.tolist() for key, array in fields.items()
+        }
+        values["latdegrees"] = latdegrees.tolist()
+        values["londegrees"] = londegrees.tolist()
+        if "TAS" in flight["optional_records"]:
+            values["tas_peak"] = list(
+                itertools.accumulate((record["opt_tas"] for record in records), max)
             )
+            flight["tas_peak"] = values["tas_peak"][-1]
+            values["tas_peak"][0] = 0
+
+        keys: List[str] = list(values) + ["datetime", "date", "time"]
+        for record, row in zip(
+            records,
+            zip(
+                *values.values(),
+                datetimes,
+                [value.date() for value in datetimes],
+                [value.time() for value in datetimes],
+            ),
+        ):
+            record.update(zip(keys, row))
+
+        # the first record has no predecessor, its deltas, speeds and totals are 0
+        for key in fields:
+            records[0][key] = 0
+
+        return flight
+
+    def parse_igc_columns(self, igcfile: str) -> Dict[str, Any]:
+        """
+        Parses the IGC file in a single pass without building a dictionary or string per record. The file is memory-mapped and the B records are located with a bytes-level scan, their fixed-width fields are decoded straight from the mapped buffer into typed column arrays. All other record types are processed by the same logline_* methods as in parse_igc.
 
-            if index > 0:
-                prevrecord = flight["fixrecords"][index - 1]
-
-                if record["time"] < prevrecord["time"]:
-                    record["date"] = prevrecord["date"] + datetime.timedelta(days=1)
-                else:
-                    record["date"] = prevrecord["date"]
-
-                record["datetime"] = datetime.datetime.combine(
-                    record["date"], record["time"]
-                )
-                record["time_delta"] = (
-                    record["datetime"] - prevrecord["datetime"]
-                ).total_seconds()
-                record["running_time"] = (
-                    record["datetime"] - flight["datetime_start"]
-                ).total_seconds()
-                record["distance_delta"] = self.haversine(
-                    record["londegrees"],
-                    record["latdegrees"],
-                    prevrecord["londegrees"],
-                    prevrecord["latdegrees"],
-                )
-                flight["distance_total"] += record["distance_delta"]
-                record["distance_total"] = flight["distance_total"]
-                record["distance_from_start"] = self.straight_line_distance(
-                    record["londegrees"],
-                    record["latdegrees"],
-                    record["alt-GPS"],
-                    flight["fixrecords"][0]["londegrees"],
-                    flight["fixrecords"][0]["latdegrees"],
-                    flight["fixrecords"][0]["alt-GPS"],
-                )
-                record["groundspeed"] = (
-                    record["distance_delta"] / record["time_delta"] * 3600
-                )
-                flight["groundspeed_peak"] = max(
-                    record["groundspeed"], flight["groundspeed_peak"]
-                )
-                record["groundspeed_peak"] = flight["groundspeed_peak"]
-                record["alt_gps_delta"] = record["alt-GPS"] - prevrecord["alt-GPS"]
-                record["alt_pressure_delta"] = (
-                    record["pressure"] - prevrecord["pressure"]
-                )
-                record["climb_speed"] = record["alt_gps_delta"] / record["time_delta"]
-                flight["climb_total"] += max(0, record["alt_gps_delta"])
-                record["climb_total"] = flight["climb_total"]
-                flight["alt_peak"] = max(record["alt-GPS"], flight["alt_peak"])
-                flight["alt_floor"] = min(record["alt-GPS"], flight["alt_floor"])
-                if "TAS" in flight["optional_records"]:
-                    flight["tas_peak"] = max(record["opt_tas"], flight["tas_peak"])
-                    record["tas_peak"] = flight["tas_peak"]
-            else:
-                flight["time_start"] = record["time"]
-                flight["datetime_start"] = datetime.datetime.combine(
-                    flight["flightdate"], flight["time_start"]
-                )
-                flight["altitude_start"] = record["alt-GPS"]
-                flight["distance_total"] = 0
-                flight["climb_total"] = 0
-                flight["alt_peak"] = record["alt-GPS"]
-                flight["alt_floor"] = record["alt-GPS"]
-                flight["groundspeed_peak"] = 0
-
-                record["date"] = flight["flightdate"]
-                record["datetime"] = datetime.datetime.combine(
-                    record["date"], record["time"]
-                )
-                record["running_time"] = 0
-                record["time_delta"] = 0
-                record["distance_delta"] = 0
-                record["distance_total"] = 0
-                record["groundspeed"] = 0
-                record["groundspeed_peak"] = 0
-                record["alt_gps_delta"] = 0
-                record["alt_pressure_delta"] = 0
-                record["climb_speed"] = 0
-                record["climb_total"] = 0
-                record["distance_from_start"] = 0
-
-                if "TAS" in flight["optional_records"]:
-                    flight["tas_peak"] = record["opt_tas"]
-                    record["tas_peak"] = 0
+        Parameters:
+        - igcfile: The path to the IGC file.
+
+        Returns:
+        - flight: The flight dictionary, the B records are stored in flight["columns"] as NumPy arrays (seconds of the day, latitude and longitude degrees, minutes and direction, pressure altitude, GPS altitude and the optional I record extensions as strings).
+        """
+        flight: Dict[str, Any] = {"igcfile": igcfile, "optional_records": {}}
+
+        with open(igcfile, "rb") as file:
+            mapping: mmap.mmap = None
+            if os.fstat(file.fileno()).st_size > 0:
+                mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            buffer: np.ndarray = (
+                np.frombuffer(mapping, dtype=np.uint8)
+                if mapping is not None
+                else np.zeros(0, dtype=np.uint8)
+            )
+            records: np.ndarray = self.locate_b_records(buffer, flight)
+            flight["columns"] = self.decode_b_records(records, flight)
+        finally:
+            # the views of the mapped buffer have to be released before the mapping is closed
+            buffer = records = None
+            if mapping is not None:
+                mapping.close()
 
         return flight
 
+    def locate_b_records(
+        self, buffer: np.ndarray, flight: Dict[str, Any]
+    ) -> np.ndarray:
+        """
+        Locates the B records in the buffer of an IGC file and processes all other records with the logline_* methods. If the B records are evenly spaced (e.g. no other records between them), the returned matrix is a strided view of the buffer, otherwise the B records are gathered into a new matrix.
+
+        Parameters:
+        - buffer: The content of the IGC file as array of bytes.
+        - flight: The flight dictionary to be updated with the parsed header and I records.
+
+        Returns:
+        - The B records as matrix of ASCII codes, one row per record, padded with zeros to the width of the B record including the optional I record extensions.
+        """
+        newlines: np.ndarray = np.flatnonzero(buffer == ord("\n"))
+        starts: np.ndarray = np.concatenate(([0], newlines + 1))
+        ends: np.ndarray = np.concatenate((newlines, [len(buffer)]))
+        lines: np.ndarray = ends > starts
+        starts, ends = starts[lines], ends[lines]
+        ends = ends - (buffer[ends - 1] == ord("\r"))  # CRLF line endings
+        lines = ends > starts
+        starts, ends = starts[lines], ends[lines]
+
+        b_records: np.ndarray = buffer[starts] == ord("B")
+        for start, end in zip(starts[~b_records], ends[~b_records]):
+            line: bytes = buffer[start:end].tobytes().rstrip()
+            if line:
+                self.recordtypes[chr(line[0])](line.decode(), flight)
+
+        width: int = max([35] + [end for _, end in flight["optional_records"].values()])
+        starts, lengths = starts[b_records], ends[b_records] - starts[b_records]
+        if len(starts) == 0:
+            return np.zeros((0, width), dtype=np.uint8)
+
+        strides: np.ndarray = np.diff(starts)
+        if lengths.min() >= width and (
+            len(strides) == 0 or (strides == strides[0]).all()
+        ):
+            return np.lib.stride_tricks.as_strided(
+                buffer[starts[0] :],
+                shape=(len(starts), width),
+                strides=(int(strides[0]) if len(strides) else width, 1),
+                writeable=False,
+            )
+
+        columns: np.ndarray = np.arange(width)
+        indices: np.ndarray = np.minimum(starts[:, None] + columns, len(buffer) - 1)
+        return np.where(columns < lengths[:, None], buffer[indices], 0).astype(np.uint8)
+
+    def decode_b_records(
+        self, records: np.ndarray, flight: Dict[str, Any]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Decodes the fixed-width fields of all B records at once.
+
+        Parameters:
+        - records: The B records as matrix of ASCII codes, one row per record (see locate_b_records).
+        - flight: The flight dictionary containing the optional I record extensions.
+
+        Returns:
+        - The column arrays of the B records, see parse_igc_columns.
+        """
+        columns: Dict[str, np.ndarray] = {
+            "seconds": self.decode_integers(records, 1, 3) * 3600
+            + self.decode_integers(records, 3, 5) * 60
+            + self.decode_integers(records, 5, 7),
+            "lat_degrees": self.decode_integers(records, 7, 9),
+            "lat_minutes": self.decode_integers(records, 9, 14),
+            "lat_directions": np.where(records[:, 14] == ord("N"), 1, -1),
+            "lon_degrees": self.decode_integers(records, 15, 18),
+            "lon_minutes": self.decode_integers(records, 18, 23),
+            "lon_directions": np.where(records[:, 23] == ord("E"), 1, -1),
+            "pressure": self.decode_integers(records, 25, 30),
+            "alt-GPS": self.decode_integers(records, 30, 35),
+        }
+        for key, (start, end) in flight["optional_records"].items():
+            columns["opt_" + key.lower()] = (
+                np.array(records[:, start:end])
+                .view(f"S{end - start}")
+                .ravel()
+                .astype(str)
+                .astype(object)
+            )
+
+        return columns
+
+    def decode_integers(self, records: np.ndarray, start: int, end: int) -> np.ndarray:
+        """
+        Decodes a fixed-width integer field (optionally with a leading minus sign) of all records at once.
+
+        Parameters:
+        - records: The records as matrix of ASCII codes, one row per record.
+        - start: The index of the first character of the field.
+        - end: The index after the last character of the field.
+
+        Returns:
+        - The values of the field as integers.
+        """
+        # the field is decoded one character column at a time, so no integer matrix of the whole field is allocated
+        values: np.ndarray = np.zeros(len(records), dtype=np.int64)
+        negative: np.ndarray = np.zeros(len(records), dtype=bool)
+        for column in range(start, end):
+            characters: np.ndarray = records[:, column]
+            values = values * 10 + DIGITS[characters]
+            negative |= characters == ord("-")
+        return np.where(negative, -values, values)
+
+    def crunch_columns(self, flight: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Calculates the fields of crunch_flight for all records at once from the column arrays of parse_igc_columns and returns them in the format of process_files. Records with a time delta of 0 result in infinite or undefined speeds instead of a ZeroDivisionError. A flight without B records or without a date (HFDTE record) results in an empty DataFrame with the output columns.
+
+        Parameters:
+        - flight: The flight dictionary returned by parse_igc_columns.
+
+        Returns:
+        - DataFrame: A pandas DataFrame containing the records, equal to the result of process_files.
+        """
+        columns: Dict[str, np.ndarray] = flight["columns"]
+        alt_gps: np.ndarray = columns["alt-GPS"]
+        if len(alt_gps) == 0 or "flightdate" not in flight:
+            if "TAS" in flight["optional_records"]:
+                return pd.DataFrame(columns=OUTPUT_COLUMNS + TAS_COLUMNS)
+            return pd.DataFrame(columns=OUTPUT_COLUMNS)
+
+        latdegrees: np.ndarray = self.degrees_array(
+            columns["lat_degrees"], columns["lat_minutes"], columns["lat_directions"]
+        )
+        londegrees: np.ndarray = self.degrees_array(
+            columns["lon_degrees"], columns["lon_minutes"], columns["lon_directions"]
+        )
+        fields: Dict[str, np.ndarray] = self.calculate_fields(
+            flightdate=flight["flightdate"],
+            seconds=columns["seconds"],
+            latdegrees=latdegrees,
+            londegrees=londegrees,
+            alt_gps=alt_gps,
+            pressure=columns["pressure"],
+        )
+
+        data: pd.DataFrame = pd.DataFrame(
+            {
+                "Datetime (UTC)": fields["datetime"],
+                "Elapsed Time": fields["running_time"],
+                "Latitude (Degrees)": latdegrees,
+                "Longitude (Degrees)": londegrees,
+                "Altitude GPS": alt_gps,
+                "Distance Delta": fields["distance_delta"],
+                "Distance Total": fields["distance_total"],
+                "Groundspeed": fields["groundspeed"],
+                "Groundspeed Peak": fields["groundspeed_peak"],
+                "Altitude Delta (GPS)": fields["alt_gps_delta"],
+                "Altitude Delta (Pressure)": fields["alt_pressure_delta"],
+                "Climb Speed": fields["climb_speed"],
+                "Climb Total": fields["climb_total"],
+                "Max Altitude (flight)": np.full(len(alt_gps), alt_gps.max()),
+                "Min Altitude (flight)": np.full(len(alt_gps), alt_gps.min()),
+                "Distance From Start (straight line)": fields["distance_from_start"],
+            }
+        )
+
+        if "TAS" in flight["optional_records"]:
+            tas: np.ndarray = columns["opt_tas"]
+            tas_peak: np.ndarray = np.maximum.accumulate(tas)
+            tas_peak[0] = 0
+            data["True Airspeed"] = tas
+            data["True Airspeed Peak"] = tas_peak
+
+        return data
+
+    def calculate_fields(
+        self,
+        flightdate: datetime.date,
+        seconds: np.ndarray,
+        latdegrees: np.ndarray,
+        londegrees: np.ndarray,
+        alt_gps: np.ndarray,
+        pressure: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculates the time, distance, speed and climb fields of all records at once. A time earlier than the time of the previous record starts a new day, totals are cumulative sums and peaks are running maxima. Records with a time delta of 0 result in infinite or undefined speeds instead of a ZeroDivisionError.
+
+        Parameters:
+        - flightdate: The date of the first record.
+        - seconds: The seconds of the day of the records.
+        - latdegrees: The latitudes of the records in degrees.
+        - londegrees: The longitudes of the records in degrees.
+        - alt_gps: The GPS altitudes of the records.
+        - pressure: The pressure altitudes of the records.
+
+        Returns:
+        - A dictionary of arrays named like the fields of the records in crunch_flight (datetime, running_time, time_delta, distance_delta, distance_total, distance_from_start, groundspeed, groundspeed_peak, alt_gps_delta, alt_pressure_delta, climb_speed, climb_total).
+        """
+        days: np.ndarray = np.cumsum(np.diff(seconds, prepend=seconds[:1]) < 0)
+        seconds = days * 86400 + seconds
+        datetimes: np.ndarray = (
+            np.datetime64(flightdate, "s") + seconds.astype("timedelta64[s]")
+        ).astype("datetime64[ns]")
+
+        running_time: np.ndarray = (seconds - seconds[:1]).astype(np.float64)
+        time_delta: np.ndarray = np.diff(running_time, prepend=0.0)
+
+        distance_delta: np.ndarray = np.zeros(len(alt_gps))
+        distance_delta[1:] = self.haversine_array(
+            londegrees[1:], latdegrees[1:], londegrees[:-1], latdegrees[:-1]
+        )
+        distance_from_start: np.ndarray = np.sqrt(
+            self.haversine_array(londegrees, latdegrees, londegrees[:1], latdegrees[:1])
+            ** 2.0
+            + ((alt_gps - alt_gps[:1]) / 1000.0) ** 2.0
+        )
+        alt_gps_delta: np.ndarray = np.diff(alt_gps, prepend=alt_gps[:1])
+        alt_pressure_delta: np.ndarray = np.diff(pressure, prepend=pressure[:1])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            groundspeed: np.ndarray = distance_delta / time_delta * 3600
+            climb_speed: np.ndarray = alt_gps_delta / time_delta
+        groundspeed[:1] = 0
+        climb_speed[:1] = 0
+
+        return {
+            "datetime": datetimes,
+            "running_time": running_time,
+            "time_delta": time_delta,
+            "distance_delta": distance_delta,
+            "distance_total": np.cumsum(distance_delta),
+            "distance_from_start": distance_from_start,
+            "groundspeed": groundspeed,
+            "groundspeed_peak": np.maximum.accumulate(groundspeed),
+            "alt_gps_delta": alt_gps_delta,
+            "alt_pressure_delta": alt_pressure_delta,
+            "climb_speed": climb_speed,
+            "climb_total": np.cumsum(np.maximum(alt_gps_delta, 0)),
+        }
+
+    def degrees_array(
+        self, degrees: np.ndarray, minutes: np.ndarray, directions: np.ndarray
+    ) -> np.ndarray:
+        """
+        Converts coordinates from IGC format to degrees, see lat_to_degrees and lon_to_degrees.
+
+        Parameters:
+        - degrees: The degrees of the coordinates.
+        - minutes: The minutes of the coordinates in thousandths.
+        - directions: 1 for north / east, -1 for south / west.
+
+        Returns:
+        - The coordinates in degrees.
+        """
+        return (degrees + minutes / 1000.0 / 60.0) * directions
+
+    def character_matrix(self, values: List[str]) -> np.ndarray:
+        """
+        Converts strings of equal length to a matrix of ASCII codes, one row per string.
+
+        Parameters:
+        - values: The strings to be converted.
+
+        Returns:
+        - The matrix of ASCII codes.
+        """
+        return np.frombuffer("".join(values).encode(), dtype=np.uint8).reshape(
+            len(values), -1
+        )
+
+    def process_file(self, igcfile: str) -> pd.DataFrame:
+        """
+        Processes a single IGC file with the columnar parser, which returns the same records as process_files(igcfile, False) without building a dictionary per record or writing a temporary output file.
+
+        Parameters:
+        - igcfile: The IGC file to process.
+
+        Returns:
+        - DataFrame: A pandas DataFrame containing the records, empty with the output columns if the file has no B records or no date.
+        """
+        flight: Dict[str, Any] = self.parse_igc_columns(os.path.abspath(igcfile))
+        return self.crunch_columns(flight)
+
     # AI content (ChatGPT, 02/17/2024), verified and adapted by Nicolas Huber.
     def logline_A(self, line: str, flight: Dict[str, Any]) -> None:
         """
@@ -367,6 +685,35 @@ class IGC2CSV:
         km = 6367 * c
         return km
 
+    def haversine_array(
+        self,
+        lon1: np.ndarray,
+        lat1: np.ndarray,
+        lon2: np.ndarray,
+        lat2: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Calculates the distances between arrays of points using the haversine formula, see haversine.
+
+        Parameters:
+        - lon1: Longitudes of the first points.
+        - lat1: Latitudes of the first points.
+        - lon2: Longitudes of the second points.
+        - lat2: Latitudes of the second points.
+
+        Returns:
+        - Distances between the points.
+        """
+        lon1, lat1, lon2, lat2 = (
+            np.radians(values) for values in (lon1, lat1, lon2, lat2)
+        )
+        dlon = lon2 - lon1
+        dlat = lat2 - lat1
+        a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+        c = 2 * np.arcsin(np.sqrt(a))
+        km = 6367 * c
+        return km
+
     # AI content (ChatGPT, 02/17/2024), verified and adapted by Nicolas Huber.
     def straight_line_distance(
         self,
@@ -453,7 +800,6 @@ class IGC2CSV:
         for flight in logbook:
             flight["outputfilename"] = self.get_output_filename(flight["igcfile"])
 
-            output = open(flight["outputfilename"], "w")
             defaultoutputfields: List[Tuple[str, str, str]] = [
                 ("Datetime (UTC)", "record", "datetime"),
                 ("Elapsed Time", "record", "running_time"),
@@ -491,23 +837,22 @@ class IGC2CSV:
                         record_data[field[0]] = flight[field[2]]
                 records_data.append(record_data)
 
+            # the output file is only created if it is exported, otherwise the records stay in memory
             if export_to_csv:
-                output = open(flight["outputfilename"], "w")
-                header = ""
-                for field in outputfields:
-                    header += field[0] + ","
-                output.write(header[:-1] + "\n")
-
-                for record in flight["fixrecords"]:
-                    recordline = ""
+                with open(flight["outputfilename"], "w") as output:
+                    header = ""
                     for field in outputfields:
-                        if field[1] == "record":
-                            recordline += str(record[field[2]]) + ","
-                        elif field[1] == "flight":
-                            recordline += str(flight[field[2]]) + ","
-                    output.write(recordline[:-1] + "\n")
-            else:
-                os.remove(flight["outputfilename"])
+                        header += field[0] + ","
+                    output.write(header[:-1] + "\n")
+
+                    for record in flight["fixrecords"]:
+                        recordline = ""
+                        for field in outputfields:
+                            if field[1] == "record":
+                                recordline += str(record[field[2]]) + ","
+                            elif field[1] == "flight":
+                                recordline += str(flight[field[2]]) + ","
+                        output.write(recordline[:-1] + "\n")
 
             return pd.DataFrame(records_data)
 
@@ -601,18 +946,28 @@ class IGC2CSV:
         data = self.remove_static_speeds(data)
         return data
 
-    def export_to_csv(self, data: pd.DataFrame, filename: str) -> None:
+    def export_to_csv(
+        self, data: pd.DataFrame, filename: str, file_format: str = "csv"
+    ) -> None:
         """
-        Exports the DataFrame to a CSV file.
+        Exports the DataFrame to a CSV file, or to a Feather or Parquet file with typed columns (requires pyarrow).
 
         Parameters:
         - data: The DataFrame to be exported.
         - filename: The filename of the CSV file.
+        - file_format: The format of the file, csv, feather or parquet.
 
         Returns:
         - None
         """
-        data.to_csv(filename, index=False)
+        if file_format == "feather":
+            data.reset_index(drop=True).to_feather(filename, compression="uncompressed")
+        elif file_format == "parquet":
+            data.to_parquet(filename, index=False)
+        elif file_format == "csv":
+            data.to_csv(filename, index=False)
+        else:
+            raise ValueError(f"Unknown file format: {file_format}")
         return
 
 
@@ -3,12 +3,24 @@
 # Automatically generated shell script to run all test files with pytest. Check update_testing.sh for further reference
 
 pytest -v "tests/test_angle_analyzer.py"
+pytest -v "tests/test_atmosphere.py"
 pytest -v "tests/test_c_values_analyzer.py"
 pytest -v "tests/test_data_analyzer.py"
+pytest -v "tests/test_data_storage.py"
+pytest -v "tests/test_data_visualizer.py"
+pytest -v "tests/test_deviation_metrics.py"
 pytest -v "tests/test_file_converter.py"
 pytest -v "tests/test_file_processor.py"
+pytest -v "tests/test_flight_cache.py"
+pytest -v "tests/test_flight_manifest.py"
 pytest -v "tests/test_igc2csv.py"
+pytest -v "tests/test_import_time.py"
+pytest -v "tests/test_model_fit_cache.py"
 pytest -v "tests/test_optimize_thresholds.py"
 pytest -v "tests/test_pressure_analyzer.py"
 pytest -v "tests/test_quality_analyzer.py"
+pytest -v "tests/test_shared_dataframe.py"
 pytest -v "tests/test_speed_analyzer.py"
+pytest -v "tests/test_threshold_search.py"
+pytest -v "tests/test_track_decimator.py"
+pytest -v "tests/test_window_statistics.py"
@@ -2,7 +2,9 @@ import os
 import sys
 import math
 import pytest
+import numpy as np
 import pandas as pd
+from scipy.stats import linregress
 
 # AI content (ChatGPT, 02/21/2024), verified and adapted by Nicolas Huber.
 current_directory = os.path.dirname(__file__)
@@ -62,6 +64,9 @@ def test_init(analyzer: AngleAnalyzer) -> None:
     assert (
         analyzer.angle_threshold == constants.ANGLE_THRESHOLD
     ), "The threshold attribute is not correct."
+    assert (
+        analyzer.rolling_regression == False
+    ), "The rolling_regression attribute is not correct."
 
 
 # AI content (GitHub Copilot, 01/29/2024), verified and adapted by Nicolas Huber.
@@ -368,3 +373,209 @@ def test_analyze_data(analyzer: AngleAnalyzer) -> None:
         )
         == constants.INDEX_STRAIGHT_LINE
     ), "The status of the analysis is not correct."  # assertion determined by a test manually executed using the execute_angle_analyzer.ipynb notebook
+
+
+def test_calculate_window_angles(analyzer: AngleAnalyzer) -> None:
+    """
+    Tests the calculate_window_angles method.
+
+    Parameters:
+    - analyzer: the AngleAnalyzer object to be tested
+
+    Returns:
+    - None
+    """
+    data = analyzer.read_csv_file()
+    averages = analyzer.calculate_window_angles(
+        longitude=data["longitude"].to_numpy(),
+        latitude=data["latitude"].to_numpy(),
+        window=constants.ANGLE_PAST_THRESHOLD,
+    )
+    assert (
+        len(averages) == len(data) - constants.ANGLE_PAST_THRESHOLD + 1
+    ), "The number of windows is not correct."
+
+    for i in [INDEX_STRAIGHT_LINE, INDEX_CURVE, INDEX_OVERLAP, INDEX_END_CURVE]:
+        angles = analyzer.cut_zero_angles(
+            df=analyzer.calculate_angles(
+                df=analyzer.extract_latest_coordinates(df=data, i=i)
+            )
+        )
+        assert math.isclose(
+            averages[i - constants.ANGLE_PAST_THRESHOLD + 1],
+            angles["angle"].mean(),
+            rel_tol=1e-12,
+        ), "The average angle does not match calculate_angles."
+
+
+def test_analyze_window_angles(analyzer: AngleAnalyzer) -> None:
+    """
+    Tests the analyze_window_angles method.
+
+    Parameters:
+    - analyzer: the AngleAnalyzer object to be tested
+
+    Returns:
+    - None
+    """
+    data = analyzer.read_csv_file()
+    statuses = analyzer.analyze_window_angles(
+        longitude=data["longitude"].to_numpy(),
+        latitude=data["latitude"].to_numpy(),
+        window=constants.ANGLE_PAST_THRESHOLD,
+    )
+
+    for i in [INDEX_STRAIGHT_LINE, INDEX_END_STRAIGHT_LINE, INDEX_OVERLAP]:
+        angles = analyzer.cut_zero_angles(
+            df=analyzer.calculate_angles(
+                df=analyzer.extract_latest_coordinates(df=data, i=i)
+            )
+        )
+        assert statuses[
+            i - constants.ANGLE_PAST_THRESHOLD + 1
+        ] == analyzer.analyze_angles(
+            angles=angles
+        ), "The status does not match analyze_angles."
+
+
+def test_analyze_window_linear_regressions(analyzer: AngleAnalyzer) -> None:
+    """
+    Tests the analyze_window_linear_regressions method.
+
+    Parameters:
+    - analyzer: the AngleAnalyzer object to be tested
+
+    Returns:
+    - None
+    """
+    data = analyzer.read_csv_file()
+    results = analyzer.analyze_window_linear_regressions(
+        longitude=data["longitude"].to_numpy(),
+        latitude=data["latitude"].to_numpy(),
+        window=constants.ANGLE_FUTURE_THRESHOLD,
+    )
+
+    for i in [INDEX_STRAIGHT_LINE, INDEX_CURVE, INDEX_OVERLAP, INDEX_END_CURVE]:
+        expected = analyzer.analyze_linear_regression(
+            df=analyzer.extract_future_coordinates(df=data, i=i)
+        )
+        assert results[0][i] == expected[0], "The status is not correct."
+        for values, value in zip(results[1:], expected[1:]):
+            assert math.isclose(
+                values[i], value, rel_tol=1e-9, abs_tol=1e-12
+            ), "The regression values are not correct."
+
+
+def test_analyze_window_linear_regressions_identical_x(
+    analyzer: AngleAnalyzer,
+) -> None:
+    """
+    Tests the analyze_window_linear_regressions method for windows in which all x values are identical.
+
+    Parameters:
+    - analyzer: the AngleAnalyzer object to be tested
+
+    Returns:
+    - None
+    """
+    longitude = [9.3, 9.3, 9.3, 9.3, 9.4]
+    latitude = [47.1, 47.2, 47.3, 47.4, 47.5]
+    status, slope, intercept, r_value, p_value, std_err = (
+        analyzer.analyze_window_linear_regressions(
+            longitude=longitude, latitude=latitude, window=4
+        )
+    )
+    assert status[0] == False, "The status is not correct."
+    assert math.isclose(
+        r_value[1], linregress(longitude[1:], latitude[1:]).rvalue
+    ), "The r-value of the second window is not correct."
+    assert (
+        slope[0] == intercept[0] == r_value[0] == p_value[0] == std_err[0] == 0
+    ), "The values of an identical x window are not 0."
+
+
+def test_analyze_rolling_linear_regressions(analyzer: AngleAnalyzer) -> None:
+    """
+    Tests the analyze_rolling_linear_regressions method.
+
+    Parameters:
+    - analyzer: the AngleAnalyzer object to be tested
+
+    Returns:
+    - None
+    """
+    data = analyzer.read_csv_file()
+    for window in [constants.ANGLE_PAST_THRESHOLD, constants.ANGLE_FUTURE_THRESHOLD]:
+        expected = analyzer.analyze_window_linear_regressions(
+            longitude=data["longitude"].to_numpy(),
+            latitude=data["latitude"].to_numpy(),
+            window=window,
+        )
+        results = analyzer.analyze_rolling_linear_regressions(
+            longitude=data["longitude"].to_numpy(),
+            latitude=data["latitude"].to_numpy(),
+            window=window,
+        )
+        assert (results[0] == expected[0]).all(), "The statuses are not correct."
+        for values, expected_values in zip(results[3:], expected[3:]):
+            assert np.allclose(
+                values, expected_values, rtol=1e-6, atol=1e-9
+            ), "The regression values are not correct."
+
+
+def test_analyze_rolling_linear_regressions_identical_values(
+    analyzer: AngleAnalyzer,
+) -> None:
+    """
+    Tests the analyze_rolling_linear_regressions method for windows with identical x or y values.
+
+    Parameters:
+    - analyzer: the AngleAnalyzer object to be tested
+
+    Returns:
+    - None
+    """
+    longitude = [9.3, 9.3, 9.3, 9.3, 9.4, 9.5, 9.6]
+    latitude = [47.1, 47.2, 47.3, 47.4, 47.4, 47.4, 47.4]
+    status, slope, intercept, r_value, p_value, std_err = (
+        analyzer.analyze_rolling_linear_regressions(
+            longitude=longitude, latitude=latitude, window=4
+        )
+    )
+    assert status[0] == False, "The status of an identical x window is not correct."
+    assert (
+        slope[0] == intercept[0] == r_value[0] == p_value[0] == std_err[0] == 0
+    ), "The values of an identical x window are not 0."
+    assert r_value[3] == 0, "The r-value of an identical y window is not 0."
+    assert p_value[3] == 1, "The p-value of an identical y window is not 1."
+
+
+def test_analyze_cumulative_linear_regressions(analyzer: AngleAnalyzer) -> None:
+    """
+    Tests that the analyze_cumulative_linear_regressions method returns the results of analyze_rolling_linear_regressions for several window lengths of the same cumulative moments.
+
+    Parameters:
+    - analyzer: the AngleAnalyzer object to be tested
+
+    Returns:
+    - None
+    """
+    data = analyzer.read_csv_file()
+    longitude = data["longitude"].to_numpy()
+    latitude = data["latitude"].to_numpy()
+    moments = analyzer.calculate_cumulative_moments(
+        longitude=longitude, latitude=latitude
+    )
+    for window in [
+        10,
+        constants.ANGLE_FUTURE_THRESHOLD,
+        constants.ANGLE_PAST_THRESHOLD,
+    ]:
+        expected = analyzer.analyze_rolling_linear_regressions(
+            longitude=longitude, latitude=latitude, window=window
+        )
+        results = analyzer.analyze_cumulative_linear_regressions(
+            moments=moments, window=window
+        )
+        for values, expected_values in zip(results, expected):
+            np.testing.assert_array_equal(values, expected_values)
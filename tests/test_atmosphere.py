@@ -0,0 +1,69 @@
+import os
+import sys
+import pytest
+import numpy as np
+
+current_directory = os.path.dirname(__file__)
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+sys.path.insert(0, flight_analyzer_directory)
+
+import src.constants as constants
+from src.helpers.atmosphere import Atmosphere
+
+
+@pytest.fixture()
+def atmosphere() -> Atmosphere:
+    """
+    Create an Atmosphere object.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - Atmosphere: The Atmosphere object.
+    """
+    return Atmosphere()
+
+
+def test_calculate_isa(atmosphere: Atmosphere) -> None:
+    """
+    Test the standard atmosphere at sea level, at 2000 m (constants.py), at the tropopause and in the stratosphere.
+
+    Parameters:
+    - atmosphere (Atmosphere): The Atmosphere object.
+
+    Returns:
+    - None.
+    """
+    density, pressure = atmosphere.calculate_isa(np.array([0, 2000, 11000, 15000]))
+
+    np.testing.assert_allclose(density, [1.225, 1.00649, 0.36392, 0.19367], rtol=1e-4)
+    np.testing.assert_allclose(pressure, [101325, 79495.2, 22632.0, 12044.6], rtol=1e-5)
+    assert pressure[1] == pytest.approx(constants.STATIC_PRESSURE, rel=1e-6)
+
+
+def test_lookup(atmosphere: Atmosphere) -> None:
+    """
+    Test that the lookup table interpolates the closed-form equations and clamps altitudes outside of its range.
+
+    Parameters:
+    - atmosphere (Atmosphere): The Atmosphere object.
+
+    Returns:
+    - None.
+    """
+    altitude: np.ndarray = np.random.default_rng(0).uniform(-500, 20000, 100000)
+    for value, expected in zip(
+        atmosphere.lookup(altitude), atmosphere.calculate_isa(altitude)
+    ):
+        np.testing.assert_allclose(value, expected, rtol=1e-8)
+
+    density, pressure = atmosphere.lookup(np.array([-1000.0, 30000.0]))
+    expected_density, expected_pressure = atmosphere.calculate_isa(
+        np.array([-500.0, 20000.0])
+    )
+    np.testing.assert_allclose(density, expected_density)
+    np.testing.assert_allclose(pressure, expected_pressure)
+
+    assert atmosphere.lookup(2000.0)[1] == pytest.approx(79495.2, rel=1e-6)
+    assert Atmosphere().densities is atmosphere.densities  # cached table
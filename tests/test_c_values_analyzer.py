@@ -15,6 +15,7 @@ import src.constants as constants
 import src.helpers.file_processor as file_processor
 import src.algorithms.c_values_analyzer as c_values_analyzer
 import src.algorithms.speed_analyzer as speed_analyzer
+import src.algorithms.pressure_analyzer as pressure_analyzer
 
 INPUT_DIRECTORY: str = f"{flight_analyzer_directory}/tests/assets/c_values_analyzer"
 FILE_EXTENSION: str = ".igc"
@@ -229,3 +230,166 @@ def test_process_c_values(c_analyzer, dataset) -> None:
     assert "airspeed [m/s]" in values.columns
     assert "Cw [0.5]" in values.columns
     assert "Ca [0.5]" in values.columns
+
+
+@pytest.mark.parametrize("algorithm", [False, True])
+def test_calculate_glide_values(c_analyzer, dataset, algorithm: bool) -> None:
+    """
+    Test that the fused calculation returns the same values as the DataFrame pipeline of the CAnalyzer and the PressureAnalyzer.
+
+    Parameters:
+    - analyzer (CValuesAnalyzer): The CValuesAnalyzer object to test.
+    - dataset (pd.DataFrame): The dataset to test.
+    - algorithm (bool): The algorithm to use for the Cw value calculation.
+
+    Returns:
+    - None.
+    """
+    values: dict = c_analyzer.calculate_glide_values(
+        horizontal_speed=dataset["horizontal velocity [m/s]"].to_numpy(),
+        vertical_speed=dataset["vertical velocity [m/s]"].to_numpy(),
+        algorithm=algorithm,
+    )
+
+    p_analyzer = pressure_analyzer.PressureAnalyzer()
+    data: pd.DataFrame = c_analyzer.positive_vertical_speed(
+        speed_data=c_analyzer.calculate_airspeed(speed_data=dataset)
+    )
+    data = p_analyzer.process_pressure_data(
+        data=c_analyzer.process_c_values(speed_data=data, algorithm=algorithm)
+    )
+    data["resulting force [N]"] = p_analyzer.calculate_force_resultant(
+        data["airspeed [m/s]"], data["Ca [0.5]"], data["Cw [0.5]"]
+    )
+
+    assert list(values) == list(c_values_analyzer.GLIDE_COLUMNS)
+    for column, value in values.items():
+        np.testing.assert_allclose(value, data[column].to_numpy(), rtol=1e-12)
+
+    # the loop of the numba engine, executed by the interpreter
+    out: np.ndarray = np.empty((len(values), len(dataset)))
+    c_values_analyzer._glide_kernel(
+        dataset["horizontal velocity [m/s]"].to_numpy(),
+        dataset["vertical velocity [m/s]"].to_numpy(),
+        algorithm,
+        constants.MASS,
+        constants.GRAVITY,
+        np.full(len(dataset), constants.AIR_DENSITY),
+        constants.WING_AREA,
+        np.full(len(dataset), constants.STATIC_PRESSURE),
+        out,
+    )
+    np.testing.assert_allclose(out, np.array(list(values.values())), rtol=1e-12)
+
+    with pytest.raises(ValueError):
+        c_analyzer.calculate_glide_values([1.0], [1.0], engine="cython")
+
+
+def test_calculate_glide_values_numba(c_analyzer, dataset) -> None:
+    """
+    Test that the numba engine returns the same values as the numpy engine.
+
+    Parameters:
+    - analyzer (CValuesAnalyzer): The CValuesAnalyzer object to test.
+    - dataset (pd.DataFrame): The dataset to test.
+
+    Returns:
+    - None.
+    """
+    pytest.importorskip("numba")
+    speeds: List[np.ndarray] = [
+        dataset["horizontal velocity [m/s]"].to_numpy(),
+        dataset["vertical velocity [m/s]"].to_numpy(),
+    ]
+    for algorithm in [False, True]:
+        values: dict = c_analyzer.calculate_glide_values(*speeds, algorithm=algorithm)
+        values_numba: dict = c_analyzer.calculate_glide_values(
+            *speeds, algorithm=algorithm, engine="numba"
+        )
+        for column in values:
+            np.testing.assert_allclose(values_numba[column], values[column], rtol=1e-12)
+
+
+@pytest.mark.parametrize("algorithm", [False, True])
+def test_sweep_glide_values(c_analyzer, dataset, monkeypatch, algorithm: bool) -> None:
+    """
+    Test that every configuration of the sweep returns the same values as calculate_glide_values with the configuration as constants.
+
+    Parameters:
+    - analyzer (CValuesAnalyzer): The CValuesAnalyzer object to test.
+    - dataset (pd.DataFrame): The dataset to test.
+    - monkeypatch (pytest.MonkeyPatch): Fixture to set the constants.
+    - algorithm (bool): The algorithm to use for the Cw value calculation.
+
+    Returns:
+    - None.
+    """
+    speeds: List[np.ndarray] = [
+        dataset["horizontal velocity [m/s]"].to_numpy(),
+        dataset["vertical velocity [m/s]"].to_numpy(),
+    ]
+    mass: np.ndarray = np.array([70.0, 90.0, 110.0])
+    wing_area: np.ndarray = np.array([20.0, 23.1])
+    air_density: np.ndarray = np.array([1.225, 1.0065, 0.9])
+    static_pressure: np.ndarray = np.array([101325.0, 79495.22, 70000.0])
+    values: dict = c_analyzer.sweep_glide_values(
+        *speeds, mass, wing_area, air_density, static_pressure, algorithm
+    )
+    assert values["Cw [0.5]"].shape == (3, 2, 3, len(dataset))
+
+    for i, j, k in [(0, 0, 0), (1, 1, 1), (2, 0, 2)]:
+        simulation_constants = c_values_analyzer.constants
+        monkeypatch.setattr(simulation_constants, "MASS", mass[i])
+        monkeypatch.setattr(simulation_constants, "WING_AREA", wing_area[j])
+        monkeypatch.setattr(simulation_constants, "AIR_DENSITY", air_density[k])
+        monkeypatch.setattr(simulation_constants, "STATIC_PRESSURE", static_pressure[k])
+        expected: dict = c_analyzer.calculate_glide_values(*speeds, algorithm)
+        for column in expected:
+            np.testing.assert_allclose(
+                values[column][i, j, k], expected[column], rtol=1e-12
+            )
+
+    with pytest.raises(ValueError):
+        c_analyzer.sweep_glide_values(*speeds, mass, wing_area, air_density, [1.0])
+
+
+def test_glide_values_atmosphere(c_analyzer, dataset) -> None:
+    """
+    Test that the values with the standard atmosphere per data point are the same in the fused calculation and the DataFrame pipeline, and close to the constants at 2000 m.
+
+    Parameters:
+    - analyzer (CValuesAnalyzer): The CValuesAnalyzer object to test.
+    - dataset (pd.DataFrame): The dataset to test.
+
+    Returns:
+    - None.
+    """
+    dataset["altitude [m]"] = np.linspace(500, 4000, len(dataset))
+    values: dict = c_analyzer.calculate_glide_values(
+        horizontal_speed=dataset["horizontal velocity [m/s]"].to_numpy(),
+        vertical_speed=dataset["vertical velocity [m/s]"].to_numpy(),
+        altitude=dataset["altitude [m]"].to_numpy(),
+    )
+
+    p_analyzer = pressure_analyzer.PressureAnalyzer()
+    data: pd.DataFrame = c_analyzer.process_c_values(
+        speed_data=c_analyzer.positive_vertical_speed(
+            speed_data=c_analyzer.calculate_airspeed(speed_data=dataset)
+        ),
+        altitude_column="altitude [m]",
+    )
+    data = p_analyzer.process_pressure_data(data=data, altitude_column="altitude [m]")
+    for column in ["Cw [0.5]", "Ca [0.5]", "resultant pressure [N/m^2]"]:
+        np.testing.assert_allclose(values[column], data[column].to_numpy(), rtol=1e-12)
+
+    values = c_analyzer.calculate_glide_values(
+        horizontal_speed=dataset["horizontal velocity [m/s]"].to_numpy(),
+        vertical_speed=dataset["vertical velocity [m/s]"].to_numpy(),
+        altitude=np.full(len(dataset), 2000.0),
+    )
+    expected: dict = c_analyzer.calculate_glide_values(
+        horizontal_speed=dataset["horizontal velocity [m/s]"].to_numpy(),
+        vertical_speed=dataset["vertical velocity [m/s]"].to_numpy(),
+    )
+    for column in expected:
+        np.testing.assert_allclose(values[column], expected[column], rtol=1e-4)
@@ -102,6 +102,26 @@ def test_read_csv_data(analyzer: dataanalyzer.DataAnalyzer) -> None:
     assert len(data) == 3959, "The length of the dataset is not set correctly."
 
 
+def test_read_csv_data_in_memory(analyzer: dataanalyzer.DataAnalyzer) -> None:
+    """
+    Test the DataAnalyzer class with data passed in memory instead of a csv file.
+
+    Parameters:
+    - analyzer (DataAnalyzer): The DataAnalyzer object.
+
+    Returns:
+    - None.
+    """
+    data: pd.DataFrame = analyzer.read_csv_data()
+    analyzer_in_memory = dataanalyzer.DataAnalyzer(data=data)
+
+    assert analyzer_in_memory.read_csv_data() is data
+    assert analyzer_in_memory.csv_file_out is None
+    assert analyzer_in_memory.construct_angle_analyzer().csv_file is None
+    with pytest.raises(ValueError):
+        dataanalyzer.DataAnalyzer()
+
+
 # AI content (GitHub Copilot, 02/11/2024), verified and adapted by Nicolas Huber.
 def test_process_data(analyzer: dataanalyzer.DataAnalyzer) -> None:
     """
@@ -195,3 +215,65 @@ def test_export_to_csv(analyzer: dataanalyzer.DataAnalyzer) -> None:
     analyzer.export_to_csv(data_processed=data_processed)
     assert os.path.exists(analyzer.csv_file_out), "The csv file was not created."
     os.remove(analyzer.csv_file_out)
+
+
+def test_process_data_matches_angle_analyzer(
+    analyzer: dataanalyzer.DataAnalyzer,
+) -> None:
+    """
+    Test that the vectorized process_data method classifies the points like the AngleAnalyzer does for single points.
+
+    Parameters:
+    - analyzer (DataAnalyzer): The DataAnalyzer object.
+
+    Returns:
+    - None.
+    """
+    data: pd.DataFrame = analyzer.read_csv_data()
+    angle_analyzer: angle_analyzer.AngleAnalyzer = analyzer.construct_angle_analyzer()  # type: ignore
+    data_processed: pd.DataFrame = analyzer.process_data(
+        data=data, AngleAnalyzer=angle_analyzer
+    )
+
+    assert (
+        data_processed.index[0] == constants.ANGLE_PAST_THRESHOLD
+    ), "The first index is not set correctly."
+    assert len(data_processed) == len(data) - (
+        constants.ANGLE_PAST_THRESHOLD + constants.ANGLE_FUTURE_THRESHOLD
+    ), "The length of the dataset is not set correctly."
+
+    for i in data_processed.index[::250]:
+        latest_coordinates = angle_analyzer.extract_latest_coordinates(df=data, i=i)
+        future_coordinates = angle_analyzer.extract_future_coordinates(df=data, i=i)
+        regression_past = angle_analyzer.analyze_linear_regression(
+            df=latest_coordinates
+        )
+        regression_future = angle_analyzer.analyze_linear_regression(
+            df=future_coordinates
+        )
+        status = angle_analyzer.analyze_data(
+            status_angle_past=angle_analyzer.analyze_angles(
+                angles=angle_analyzer.cut_zero_angles(
+                    df=angle_analyzer.calculate_angles(df=latest_coordinates)
+                )
+            ),
+            status_regression_past=regression_past[0],
+            status_angle_future=angle_analyzer.analyze_angles(
+                angles=angle_analyzer.cut_zero_angles(
+                    df=angle_analyzer.calculate_angles(df=future_coordinates)
+                )
+            ),
+            status_regression_future=regression_future[0],
+        )
+
+        assert (
+            data_processed.loc[i, "position_int"] == status[2]
+        ), "The position_int column is not set correctly."
+        assert np.isclose(
+            data_processed.loc[i, "average_r_value"],
+            (regression_past[3] + regression_future[3]) / 2,
+        ), "The average_r_value column is not set correctly."
+        assert np.isclose(
+            data_processed.loc[i, "average_std_err"],
+            (regression_past[5] + regression_future[5]) / 2,
+        ), "The average_std_err column is not set correctly."
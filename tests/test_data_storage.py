@@ -0,0 +1,111 @@
+import os
+import sys
+import pytest
+import pandas as pd
+
+current_directory = os.path.dirname(__file__)
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+sys.path.insert(0, flight_analyzer_directory)
+
+import src.helpers.data_analyzer as dataanalyzer
+from src.helpers.data_storage import DataStorage
+
+CSV_FILE: str = (
+    f"{flight_analyzer_directory}/tests/assets/data_analyzer/test_data_analyzer.csv"
+)
+
+
+@pytest.fixture()
+def storage() -> DataStorage:
+    """
+    Create a DataStorage object.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - DataStorage: The DataStorage object.
+    """
+    return DataStorage()
+
+
+@pytest.fixture()
+def data() -> pd.DataFrame:
+    """
+    Read the dataset to be stored.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - pd.DataFrame: The dataset.
+    """
+    return pd.read_csv(CSV_FILE)
+
+
+def test_detect_format(storage: DataStorage) -> None:
+    """
+    Test that the format is detected from the extension unless it is given.
+
+    Parameters:
+    - storage (DataStorage): The DataStorage object.
+
+    Returns:
+    - None.
+    """
+    assert storage.detect_format("flight.csv") == "csv"
+    assert storage.detect_format("flight.FEATHER") == "feather"
+    assert storage.detect_format("flight.parquet") == "parquet"
+    assert storage.detect_format("flight.txt") == "csv"
+    assert storage.detect_format("flight.csv", file_format="parquet") == "parquet"
+    assert storage.replace_extension("a/flight.csv", "feather") == "a/flight.feather"
+    with pytest.raises(ValueError):
+        storage.detect_format("flight.csv", file_format="xlsx")
+
+
+@pytest.mark.parametrize("file_format", ["csv", "feather", "parquet"])
+def test_write_read(
+    storage: DataStorage, data: pd.DataFrame, tmp_path, file_format: str
+) -> None:
+    """
+    Test that a written dataset is read back unchanged in every format.
+
+    Parameters:
+    - storage (DataStorage): The DataStorage object.
+    - data (pd.DataFrame): The dataset.
+    - tmp_path (pathlib.Path): Temporary directory.
+    - file_format (str): The format to be tested.
+
+    Returns:
+    - None.
+    """
+    pytest.importorskip("pyarrow")
+    path: str = storage.replace_extension(str(tmp_path / "flight.csv"), file_format)
+    storage.write(data.iloc[10:], path)
+
+    pd.testing.assert_frame_equal(
+        storage.read(path), data.iloc[10:].reset_index(drop=True)
+    )
+
+
+def test_data_analyzer(data: pd.DataFrame, tmp_path) -> None:
+    """
+    Test that the DataAnalyzer reads and exports Feather files.
+
+    Parameters:
+    - data (pd.DataFrame): The dataset.
+    - tmp_path (pathlib.Path): Temporary directory.
+
+    Returns:
+    - None.
+    """
+    pytest.importorskip("pyarrow")
+    path: str = str(tmp_path / "flight.feather")
+    DataStorage().write(data, path)
+
+    analyzer = dataanalyzer.DataAnalyzer(csv_file_in=path)
+    data_read: pd.DataFrame = analyzer.read_csv_data()
+    pd.testing.assert_frame_equal(data_read, data)
+
+    analyzer.export_to_csv(data_processed=data_read, file_format="parquet")
+    assert os.path.exists(tmp_path / "flight_analyzed.parquet")
@@ -0,0 +1,116 @@
+import os
+import sys
+import pytest
+import numpy as np
+import pandas as pd
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+current_directory = os.path.dirname(__file__)
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+sys.path.insert(0, flight_analyzer_directory)
+
+from src.helpers.data_visualizer import DataVisualizer
+
+
+@pytest.fixture()
+def data() -> pd.DataFrame:
+    """
+    Create an artificial flight.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - pd.DataFrame: The flight.
+    """
+    return pd.DataFrame(
+        {
+            "relative altitude [m]": np.linspace(2000, 1000, 50),
+            "longitude": np.linspace(9.0, 9.1, 50),
+            "latitude": np.linspace(47.0, 47.05, 50),
+        }
+    )
+
+
+@pytest.mark.parametrize("file_format", ["png", "svg"])
+def test_headless(data: pd.DataFrame, tmp_path, file_format: str) -> None:
+    """
+    Test that the headless mode writes the plots to files and reuses one figure.
+
+    Parameters:
+    - data (pd.DataFrame): The flight.
+    - tmp_path (pathlib.Path): Temporary directory.
+    - file_format (str): The format of the written plots.
+
+    Returns:
+    - None.
+    """
+    visualizer = DataVisualizer(output_path=str(tmp_path), file_format=file_format)
+    figures: int = len(plt.get_fignums())
+
+    visualizer.visualize_altitude(df=data)
+    visualizer.visualize_points_colored(df=data)
+    path: str = visualizer.render("flight_1", "visualize_points_2d", {"df": data})
+
+    assert visualizer.files == [
+        str(tmp_path / f"altitude.{file_format}"),
+        str(tmp_path / f"points_colored.{file_format}"),
+        str(tmp_path / f"flight_1.{file_format}"),
+    ]
+    assert path == visualizer.files[-1]
+    assert all(os.path.getsize(file) > 0 for file in visualizer.files)
+    assert len(plt.get_fignums()) <= figures + 1
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_batch(data: pd.DataFrame, tmp_path, workers: int) -> None:
+    """
+    Test that a batch of plots is written in the order of the jobs, in the current process and in worker processes.
+
+    Parameters:
+    - data (pd.DataFrame): The flight.
+    - tmp_path (pathlib.Path): Temporary directory.
+    - workers (int): The number of worker processes.
+
+    Returns:
+    - None.
+    """
+    visualizer = DataVisualizer(output_path=str(tmp_path))
+    jobs = [
+        (f"flight_{i}_altitude", "visualize_altitude", {"df": data.iloc[i:]})
+        for i in range(6)
+    ]
+    files = visualizer.render_batch(jobs=jobs, workers=workers)
+
+    assert files == [str(tmp_path / f"flight_{i}_altitude.png") for i in range(6)]
+    assert all(os.path.exists(file) for file in files)
+
+    with pytest.raises(ValueError):
+        DataVisualizer().render_batch(jobs=jobs)
+
+
+def test_render_failure(data: pd.DataFrame, tmp_path) -> None:
+    """
+    Test that a failed plot neither passes its file name on to the next plot nor returns the path of a previous plot.
+
+    Parameters:
+    - data (pd.DataFrame): The flight.
+    - tmp_path (pathlib.Path): Temporary directory.
+
+    Returns:
+    - None.
+    """
+    visualizer = DataVisualizer(output_path=str(tmp_path))
+    visualizer.render("flight_1", "visualize_altitude", {"df": data})
+
+    with pytest.raises(KeyError):
+        visualizer.render("flight_2", "visualize_altitude", {"df": data[["latitude"]]})
+    visualizer.visualize_altitude(df=data)
+    assert visualizer.files[-1] == str(tmp_path / "altitude.png")
+
+    with pytest.raises(ValueError):
+        visualizer.render("flight_3", "create_figure", {})
+    assert not os.path.exists(tmp_path / "flight_2.png")
@@ -0,0 +1,288 @@
+import os
+import sys
+import subprocess
+import numpy as np
+import pandas as pd
+import matplotlib
+from scipy.integrate import simpson
+from scipy.interpolate import CubicSpline, interp1d
+
+matplotlib.use("Agg")
+
+current_directory = os.path.dirname(__file__)
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+sys.path.insert(0, flight_analyzer_directory)
+
+from src.helpers.deviation_metrics import DeviationMetrics
+from src.helpers.data_visualizer import DataVisualizer
+
+
+def create_experimental_data(seed: int) -> pd.DataFrame:
+    """
+    Create artificial experimental data of a speed polar, its c values and dynamic pressures.
+
+    Parameters:
+    - seed (int): The seed of the random noise and speed range.
+
+    Returns:
+    - pd.DataFrame: The experimental data.
+    """
+    rng = np.random.default_rng(seed)
+    speed: np.ndarray = rng.uniform(rng.uniform(7.0, 9.0), rng.uniform(14.0, 17.0), 300)
+    return pd.DataFrame(
+        {
+            "horizontal velocity [m/s]": speed,
+            "vertical velocity [m/s]": -0.02 * (speed - 9) ** 2
+            - 1.0
+            + rng.normal(0, 0.1, 300),
+            "Ca [0.5]": 2.0 * speed**-1.2 * (1 + rng.normal(0, 0.02, 300)),
+            "airspeed [m/s]": speed,
+            "dynamic pressure [N/m^2]": 0.5 * speed**2 + rng.normal(0, 1, 300),
+        }
+    )
+
+
+def create_theoretical_data() -> pd.DataFrame:
+    """
+    Create artificial theoretical data of a speed polar, its c values and dynamic pressures.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - pd.DataFrame: The theoretical data.
+    """
+    speed: np.ndarray = np.linspace(8.2, 15.6, 12)
+    return pd.DataFrame(
+        {
+            "horizontal velocity [m/s]": speed,
+            "vertical velocity [m/s]": -0.018 * (speed - 9) ** 2 - 1.05,
+            "Ca [0.5]": 2.1 * speed**-1.2,
+            "airspeed [m/s]": speed,
+            "dynamic pressure [N/m^2]": 0.5 * speed**2,
+        }
+    ).iloc[::-1]
+
+
+def reference_speed_deviation(
+    experimental_data: pd.DataFrame, theoretical_data: pd.DataFrame
+) -> tuple:
+    """
+    Calculate the speed deviation with the formulas of DataVisualizer.visualize_speed_deviation and SpeedAnalyzer.absolute_difference before the DeviationMetrics were introduced.
+
+    Parameters:
+    - experimental_data (pd.DataFrame): The experimental speed data.
+    - theoretical_data (pd.DataFrame): The theoretical speed data.
+
+    Returns:
+    - tuple: mean_deviation, max_deviation, rms_deviation, area
+    """
+    sorted_horizontal_experimental = experimental_data[
+        "horizontal velocity [m/s]"
+    ].sort_values()
+    sorted_vertical_experimental = experimental_data["vertical velocity [m/s]"].loc[
+        sorted_horizontal_experimental.index
+    ]
+    polynomial = np.poly1d(
+        np.polyfit(sorted_horizontal_experimental, sorted_vertical_experimental, 2)
+    )
+    x_values_experimental = np.linspace(
+        sorted_horizontal_experimental.min(), sorted_horizontal_experimental.max(), 100
+    )
+
+    sorted_theoretical = theoretical_data.sort_values(by="horizontal velocity [m/s]")
+    cs_theoretical = CubicSpline(
+        sorted_theoretical["horizontal velocity [m/s]"],
+        sorted_theoretical["vertical velocity [m/s]"],
+    )
+    x_values_theoretical = np.linspace(
+        sorted_theoretical["horizontal velocity [m/s]"].min(),
+        sorted_theoretical["horizontal velocity [m/s]"].max(),
+        100,
+    )
+
+    experimental_mask = (x_values_experimental >= 8) & (x_values_experimental <= 16)
+    theoretical_mask = (x_values_theoretical >= 8) & (x_values_theoretical <= 16)
+    y_interp = np.interp(
+        x_values_experimental[experimental_mask],
+        x_values_theoretical[theoretical_mask],
+        cs_theoretical(x_values_theoretical[theoretical_mask]),
+    )
+    area = simpson(
+        np.abs(polynomial(x_values_experimental[experimental_mask]) - y_interp),
+        x=x_values_experimental[experimental_mask],
+    )
+
+    deviations = np.abs(
+        polynomial(x_values_experimental) - cs_theoretical(x_values_experimental)
+    )
+    return (
+        np.mean(deviations),
+        np.max(deviations),
+        np.sqrt(np.mean(deviations**2)),
+        area,
+    )
+
+
+def reference_interpolated_deviation(
+    x_exp: pd.Series,
+    y_fit: np.ndarray,
+    x_theoretical: pd.Series,
+    y_theoretical: pd.Series,
+) -> tuple:
+    """
+    Calculate the c value or pressure deviation with the formulas of DataVisualizer.visualize_c_values_deviation and visualize_pressure_deviation before the DeviationMetrics were introduced.
+
+    Parameters:
+    - x_exp (pd.Series): The experimental x values.
+    - y_fit (np.ndarray): The fit at the experimental x values.
+    - x_theoretical (pd.Series): The theoretical x values.
+    - y_theoretical (pd.Series): The theoretical y values.
+
+    Returns:
+    - tuple: mean_deviation, max_deviation, rms_deviation, area
+    """
+    x_sorted = x_theoretical.sort_values()
+    cs = CubicSpline(x_sorted, y_theoretical.loc[x_sorted.index])
+    x_values = np.linspace(x_sorted.min(), x_sorted.max(), 100)
+    theoretical_mask = (x_values >= 8) & (x_values <= 16)
+
+    y_fit_func = interp1d(x_exp, y_fit, fill_value="extrapolate")
+    area = simpson(
+        np.abs(y_fit_func(x_values[theoretical_mask]) - cs(x_values[theoretical_mask])),
+        x=x_values[theoretical_mask],
+    )
+
+    deviations = np.abs(y_fit_func(x_values) - cs(x_values))
+    return (
+        np.mean(deviations),
+        np.max(deviations),
+        np.sqrt(np.mean(deviations**2)),
+        area,
+    )
+
+
+def reference_deviations(
+    experimental_data: pd.DataFrame, theoretical_data: pd.DataFrame
+) -> dict:
+    """
+    Calculate the speed, c value and pressure deviations of a dataset with the formulas before the DeviationMetrics were introduced. The pressure polynomial is fitted to the sorted airspeeds and their own pressures.
+
+    Parameters:
+    - experimental_data (pd.DataFrame): The experimental data.
+    - theoretical_data (pd.DataFrame): The theoretical data.
+
+    Returns:
+    - dict: mean_deviation, max_deviation, rms_deviation and area per analysis.
+    """
+    x_exp = experimental_data["horizontal velocity [m/s]"]
+    poly = np.poly1d(
+        np.polyfit(np.log10(x_exp), np.log10(experimental_data["Ca [0.5]"]), 1)
+    )
+
+    airspeed = experimental_data["airspeed [m/s]"].sort_values()
+    pressure = experimental_data["dynamic pressure [N/m^2]"].loc[airspeed.index]
+    polynomial = np.poly1d(np.polyfit(airspeed, pressure, 2))
+
+    return {
+        "speed": reference_speed_deviation(experimental_data, theoretical_data),
+        "c_values": reference_interpolated_deviation(
+            x_exp,
+            np.power(10, poly(np.log10(x_exp))),
+            theoretical_data["airspeed [m/s]"],
+            theoretical_data["Ca [0.5]"],
+        ),
+        "pressure": reference_interpolated_deviation(
+            airspeed,
+            polynomial(airspeed),
+            theoretical_data["airspeed [m/s]"],
+            theoretical_data["dynamic pressure [N/m^2]"],
+        ),
+    }
+
+
+def test_deviations(tmp_path) -> None:
+    """
+    Test that the deviations of many datasets are the same as the deviations of every single dataset, bit for bit the same as the formulas of the plots before the DeviationMetrics were introduced, and that the DataVisualizer reuses the fits.
+
+    Parameters:
+    - tmp_path (pathlib.Path): Temporary directory.
+
+    Returns:
+    - None.
+    """
+    experimental_datasets = [create_experimental_data(seed) for seed in range(6)]
+    theoretical_data: pd.DataFrame = create_theoretical_data()
+    Metrics = DeviationMetrics()
+
+    deviations: dict = {
+        "speed": Metrics.speed_deviations(experimental_datasets, theoretical_data),
+        "c_values": Metrics.c_values_deviations(
+            experimental_datasets, theoretical_data, "Ca [0.5]"
+        ),
+        "pressure": Metrics.pressure_deviations(
+            experimental_datasets, theoretical_data
+        ),
+    }
+    single: dict = {
+        "speed": lambda data: Metrics.speed_deviation(data, theoretical_data),
+        "c_values": lambda data: Metrics.c_values_deviation(
+            data, theoretical_data, "Ca [0.5]"
+        ),
+        "pressure": lambda data: Metrics.pressure_deviation(data, theoretical_data),
+    }
+    for name, values in deviations.items():
+        assert values.shape == (6, 4)
+        assert np.all(values[:, 0] > 0) and np.all(values[:, 3] > 0)
+        assert np.all(values[:, 0] <= values[:, 2])
+        assert np.all(values[:, 2] <= values[:, 1])
+        np.testing.assert_array_equal(
+            values, [single[name](data) for data in experimental_datasets]
+        )
+        np.testing.assert_array_equal(
+            values,
+            [
+                reference_deviations(data, theoretical_data)[name]
+                for data in experimental_datasets
+            ],
+        )
+
+    Visualizer = DataVisualizer(output_path=str(tmp_path))
+    Visualizer.metrics = Metrics
+    Visualizer.fits = Metrics.fits
+    fits: int = len(Metrics.fits.cache)
+    data: pd.DataFrame = experimental_datasets[-1]
+    assert Visualizer.visualize_speed_deviation(
+        data, theoretical_data, None, ""
+    ) == tuple(deviations["speed"][-1])
+    assert Visualizer.visualize_c_values_deviation(
+        data, theoretical_data, "Ca [0.5]", ""
+    ) == tuple(deviations["c_values"][-1])
+    assert Visualizer.visualize_pressure_deviation(data, theoretical_data, "") == tuple(
+        deviations["pressure"][-1]
+    )
+    assert len(Metrics.fits.cache) == fits
+
+
+def test_no_matplotlib() -> None:
+    """
+    Test that the deviation metrics do not import matplotlib.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - None.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; import src.helpers.deviation_metrics; print('matplotlib' in sys.modules)",
+        ],
+        cwd=flight_analyzer_directory,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
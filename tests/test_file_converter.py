@@ -276,3 +276,58 @@ def test_export_to_csv(converter: FileConverter) -> None:
         converter.output_file
     ), "The CSV file is not exported correctly."
     os.remove(converter.output_file)
+
+
+def test_parse_columns(converter: FileConverter) -> None:
+    """
+    Tests the parse_columns method. Are the same values parsed as by the single processing steps?
+
+    Parameters:
+    - converter: the FileConverter object to be tested
+
+    Returns:
+    - None
+    """
+    df = converter.read_input_file()
+    df = converter.filter_dataframe(df=df)
+    df_parsed = converter.parse_columns(df=df.copy())
+
+    df = converter.split_and_reorder_columns(df=df)
+    df = converter.extract_coordinates(df=df)
+    df = converter.extract_coordinates_a(df=df)
+    df = converter.clean_up_coordinates(df=df)
+    df = converter.remove_units(df=df)
+    pd.testing.assert_frame_equal(df_parsed, df)
+    assert df_parsed["longitude"].iloc[0] == 9.30435, "The longitude is not parsed."
+    assert df_parsed["latitude"].iloc[0] == 47.154116, "The latitude is not parsed."
+
+
+@pytest.mark.parametrize("chunksize", [1, 4, 100])
+def test_process_csv_chunked(
+    converter: FileConverter, tmp_path, chunksize: int
+) -> None:
+    """
+    Tests the chunked mode of the process_csv method. Is the same CSV file written as without chunks, for xlsx and csv input files?
+
+    Parameters:
+    - converter: the FileConverter object to be tested
+    - tmp_path: temporary directory
+    - chunksize: the number of rows per chunk
+
+    Returns:
+    - None
+    """
+    converter.output_file = str(tmp_path / "output.csv")
+    converter.process_csv()
+    with open(converter.output_file, "r") as file:
+        expected: str = file.read()
+
+    input_file: str = str(tmp_path / "input.csv")
+    converter.read_input_file().to_csv(input_file, index=False)
+    for file_path in [converter.input_file, input_file]:
+        chunked = FileConverter(
+            input_file=file_path, output_file=str(tmp_path / "output_chunked.csv")
+        )
+        chunked.process_csv(chunksize=chunksize)
+        with open(chunked.output_file, "r") as file:
+            assert file.read() == expected, "The chunked output is not correct."
@@ -0,0 +1,186 @@
+import os
+import sys
+import pytest
+import subprocess
+import pandas as pd
+
+current_directory = os.path.dirname(__file__)
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+sys.path.insert(0, flight_analyzer_directory)
+
+import src.helpers.flight_cache as flightcache
+import src.algorithms.speed_analyzer as speed_analyzer
+
+IGC_FILE: str = f"{flight_analyzer_directory}/tests/assets/igc2csv/test_igc2csv.igc"
+
+
+@pytest.fixture()
+def cache(tmp_path) -> flightcache.FlightCache:
+    """
+    Create a FlightCache object in a temporary directory.
+
+    Parameters:
+    - tmp_path (pathlib.Path): Temporary directory.
+
+    Returns:
+    - FlightCache: The FlightCache object.
+    """
+    return flightcache.FlightCache(directory=str(tmp_path / "cache"))
+
+
+@pytest.fixture()
+def data() -> pd.DataFrame:
+    """
+    Convert and classify the test flight.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - pd.DataFrame: The classified flight.
+    """
+    return speed_analyzer.SpeedAnalyzer().process_file(IGC_FILE)
+
+
+def test_store_load(cache: flightcache.FlightCache, data: pd.DataFrame) -> None:
+    """
+    Test that a loaded entry equals the stored DataFrame, including its object and datetime columns.
+
+    Parameters:
+    - cache (FlightCache): The FlightCache object.
+    - data (pd.DataFrame): The classified flight.
+
+    Returns:
+    - None.
+    """
+    key: str = cache.key(file_hash=cache.hash_file(IGC_FILE), stage="processed")
+    assert cache.load(key) is None, "A missing entry is not reported as None."
+
+    cache.store(key, data)
+    data_loaded: pd.DataFrame = cache.load(key)
+
+    pd.testing.assert_frame_equal(data_loaded, data)
+    assert isinstance(data_loaded["status"].iloc[0], bool)
+    assert isinstance(data_loaded["position_str"].iloc[0], str)
+
+
+def test_key(cache: flightcache.FlightCache, monkeypatch) -> None:
+    """
+    Test that the keys depend on the stage, the thresholds and the code version.
+
+    Parameters:
+    - cache (FlightCache): The FlightCache object.
+    - monkeypatch (pytest.MonkeyPatch): Fixture to change the constants.
+
+    Returns:
+    - None.
+    """
+    file_hash: str = cache.hash_file(IGC_FILE)
+    converted: str = cache.key(file_hash=file_hash, stage="converted")
+    processed: str = cache.key(file_hash=file_hash, stage="processed")
+    assert converted != processed
+
+    monkeypatch.setattr(flightcache.constants, "ANGLE_THRESHOLD", 30)
+    assert cache.key(file_hash=file_hash, stage="converted") == converted
+    assert cache.key(file_hash=file_hash, stage="processed") != processed
+
+    cache.version = "other version"
+    assert cache.key(file_hash=file_hash, stage="converted") != converted
+
+    with pytest.raises(ValueError):
+        cache.key(file_hash=file_hash, stage="unknown")
+
+
+def test_code_version(tmp_path, monkeypatch) -> None:
+    """
+    Test that the code version covers every source file the SpeedAnalyzer pipeline imports and changes with each of them, e.g. with the constants, which are written into the classified flights (INDEX_STRAIGHT_LINE).
+
+    Parameters:
+    - tmp_path (pathlib.Path): Temporary directory.
+    - monkeypatch (pytest.MonkeyPatch): Fixture to change the source directory.
+
+    Returns:
+    - None.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, src.algorithms.speed_analyzer; "
+            "print(' '.join(getattr(module, '__file__', None) or '' for name, module in sys.modules.items() if name.startswith('src.')))",
+        ],
+        cwd=flight_analyzer_directory,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    src_directory: str = os.path.abspath(flightcache.src_directory)
+    imported_files = {
+        os.path.relpath(file, src_directory).replace(os.sep, "/")
+        for file in result.stdout.split()
+        if not file.endswith("__init__.py")
+    }
+    assert imported_files == set(flightcache.CODE_FILES)
+
+    version: str = flightcache.FlightCache.code_version()
+    for code_file in flightcache.CODE_FILES:
+        os.makedirs(os.path.dirname(tmp_path / code_file), exist_ok=True)
+        with open(os.path.join(src_directory, code_file), "rb") as file:
+            (tmp_path / code_file).write_bytes(file.read())
+    monkeypatch.setattr(flightcache, "src_directory", str(tmp_path))
+    assert flightcache.FlightCache.code_version() == version
+
+    versions = {version}
+    for code_file in flightcache.CODE_FILES:
+        with open(tmp_path / code_file, "a") as file:
+            file.write("# changed\n")
+        versions.add(flightcache.FlightCache.code_version())
+    assert len(versions) == len(flightcache.CODE_FILES) + 1
+
+
+def test_evict(tmp_path, data: pd.DataFrame) -> None:
+    """
+    Test that the least recently used entries are removed if the cache exceeds its maximum size.
+
+    Parameters:
+    - tmp_path (pathlib.Path): Temporary directory.
+    - data (pd.DataFrame): The classified flight.
+
+    Returns:
+    - None.
+    """
+    cache = flightcache.FlightCache(directory=str(tmp_path), max_size=10**9)
+    for key in ["a", "b", "c"]:
+        cache.store(key, data)
+    os.utime(cache.path("a"), (1, 1))
+    os.utime(cache.path("b"), (2, 2))
+    cache.load("a")
+
+    entry_size: int = os.path.getsize(cache.path("c"))
+    cache.max_size = 2 * entry_size
+    cache.evict()
+
+    assert cache.load("b") is None, "The least recently used entry is not removed."
+    assert cache.load("a") is not None and cache.load("c") is not None
+    assert cache.size() <= cache.max_size
+
+
+def test_speed_analyzer(tmp_path, data: pd.DataFrame) -> None:
+    """
+    Test that the SpeedAnalyzer returns the same flight from the cache.
+
+    Parameters:
+    - tmp_path (pathlib.Path): Temporary directory.
+    - data (pd.DataFrame): The classified flight.
+
+    Returns:
+    - None.
+    """
+    analyzer = speed_analyzer.SpeedAnalyzer(cache_directory=str(tmp_path))
+    pd.testing.assert_frame_equal(analyzer.process_file(IGC_FILE), data)
+    assert (
+        len(os.listdir(tmp_path)) == 2
+    ), "The converted and processed flight are not cached."
+
+    analyzer.convertor = None  # a cached flight must not be converted again
+    pd.testing.assert_frame_equal(analyzer.process_file(IGC_FILE), data)
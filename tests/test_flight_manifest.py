@@ -0,0 +1,88 @@
+import os
+import sys
+import shutil
+import pytest
+import pandas as pd
+from typing import List
+
+current_directory = os.path.dirname(__file__)
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+sys.path.insert(0, flight_analyzer_directory)
+
+import src.helpers.flight_manifest as flightmanifest
+import src.algorithms.speed_analyzer as speed_analyzer
+
+IGC_FILE: str = f"{flight_analyzer_directory}/tests/assets/igc2csv/test_igc2csv.igc"
+
+
+@pytest.fixture()
+def file_paths(tmp_path) -> List[str]:
+    """
+    Copy the test flight to three IGC files in a temporary input directory.
+
+    Parameters:
+    - tmp_path (pathlib.Path): Temporary directory.
+
+    Returns:
+    - List[str]: Paths to the IGC files.
+    """
+    os.makedirs(tmp_path / "input")
+    file_paths: List[str] = [str(tmp_path / "input" / f"{i}.igc") for i in [1, 2, 10]]
+    for file_path in file_paths:
+        shutil.copyfile(IGC_FILE, file_path)
+    return file_paths
+
+
+def test_changed_files(file_paths: List[str], tmp_path) -> None:
+    """
+    Test that only new and changed files are reported, touched files with the same content are not.
+
+    Parameters:
+    - file_paths (List[str]): Paths to the IGC files.
+    - tmp_path (pathlib.Path): Temporary directory.
+
+    Returns:
+    - None.
+    """
+    directory: str = str(tmp_path / "state")
+    Manifest = flightmanifest.FlightManifest(directory=directory)
+    assert Manifest.changed_files(file_paths) == file_paths
+    Manifest.update(file_paths=file_paths, flights={})  # all files failed
+    assert Manifest.changed_files(file_paths) == file_paths
+
+    Manifest.update(
+        file_paths=file_paths,
+        flights={file_path: pd.DataFrame({"a": [1]}) for file_path in file_paths},
+    )
+    Manifest = flightmanifest.FlightManifest(directory=directory)
+    assert Manifest.changed_files(file_paths) == []
+
+    os.utime(file_paths[0], ns=(0, 0))
+    with open(file_paths[1], "a") as file:
+        file.write("LXXX comment\n")
+    assert Manifest.changed_files(file_paths) == [file_paths[1]]
+
+
+def test_update_raw_data(file_paths: List[str], tmp_path) -> None:
+    """
+    Test that the incremental processing returns the same results as the complete processing while files are added and removed.
+
+    Parameters:
+    - file_paths (List[str]): Paths to the IGC files.
+    - tmp_path (pathlib.Path): Temporary directory.
+
+    Returns:
+    - None.
+    """
+    directory: str = str(tmp_path / "state")
+    analyzer = speed_analyzer.SpeedAnalyzer()
+
+    for files in [file_paths[:1], file_paths, file_paths[1:]]:
+        data: pd.DataFrame = analyzer.update_raw_data(
+            file_paths=files, directory=directory
+        )
+        pd.testing.assert_frame_equal(data, analyzer.process_raw_data(files))
+
+    analyzer.convertor = None  # unchanged files must not be processed again
+    data = analyzer.update_raw_data(file_paths=file_paths[1:], directory=directory)
+    assert len(data) > 0 and analyzer.failed_files == {}
@@ -1,4 +1,5 @@
 import os
+import datetime
 import sys
 import pytest
 import numpy as np
@@ -12,6 +13,9 @@ sys.path.insert(0, flight_analyzer_directory)
 from src.packages.IGC2CSV import IGC2CSV
 
 TEST_FILE = f"{flight_analyzer_directory}/tests/assets/igc2csv/test_igc2csv.igc"
+TEST_FILE_EXTENSIONS = (
+    f"{flight_analyzer_directory}/tests/assets/igc2csv/test_igc2csv_extensions.igc"
+)
 REFERENCE_FILE = f"{flight_analyzer_directory}/tests/assets/igc2csv/test_igc2csv.csv"
 
 
@@ -167,3 +171,147 @@ def test_latitude(igc2csv: IGC2CSV, reference) -> None:
         np.round(result_flight_analyzer["latitude"], 1),
         np.round(reference["latitude"], 1),
     )
+
+
+def test_process_file(igc2csv: IGC2CSV) -> None:
+    """
+    Test if the columnar parser returns the same DataFrame as process_files.
+
+    Args:
+    - igc2csv: IGC2CSV object to be tested.
+
+    Returns:
+    - None
+    """
+    for file in [TEST_FILE, TEST_FILE_EXTENSIONS]:
+        result = igc2csv.process_files(file, False)
+        result_columns = igc2csv.process_file(file)
+        pd.testing.assert_frame_equal(
+            result_columns, result, check_exact=False, rtol=1e-12
+        )
+
+
+def test_parse_igc_columns(igc2csv: IGC2CSV) -> None:
+    """
+    Test if the columnar parser decodes the optional records, negative altitudes and the date change at midnight.
+
+    Args:
+    - igc2csv: IGC2CSV object to be tested.
+
+    Returns:
+    - None
+    """
+    flight = igc2csv.parse_igc_columns(TEST_FILE_EXTENSIONS)
+    columns = flight["columns"]
+
+    assert set(flight["optional_records"]) == {"FXA", "TAS"}
+    assert columns["opt_tas"][0] == "030"
+    assert columns["pressure"].min() == -12
+    assert columns["alt-GPS"].min() == -8
+    assert columns["seconds"][0] == 23 * 3600 + 59 * 60 + 50
+
+    result = igc2csv.crunch_columns(flight)
+    assert (result["Datetime (UTC)"].dt.day.iloc[[0, -1]] == [8, 9]).all()
+
+
+def test_crunch_flight(igc2csv: IGC2CSV) -> None:
+    """
+    Test if the vectorized crunch_flight matches the scalar conversion and distance methods record by record.
+
+    Args:
+    - igc2csv: IGC2CSV object to be tested.
+
+    Returns:
+    - None
+    """
+    flight = igc2csv.crunch_flight(igc2csv.parse_igc({"igcfile": TEST_FILE_EXTENSIONS}))
+    records = flight["fixrecords"]
+
+    assert records[0]["distance_delta"] == 0 and records[0]["groundspeed"] == 0
+    assert flight["datetime_start"] == records[0]["datetime"]
+    assert records[-1]["date"] == records[0]["date"] + datetime.timedelta(days=1)
+
+    for index in [1, 10, 50, len(records) - 1]:
+        record, prevrecord = records[index], records[index - 1]
+        assert isinstance(record["datetime"], datetime.datetime)
+        assert record["latdegrees"] == igc2csv.lat_to_degrees(record["latitude"])
+        assert record["londegrees"] == igc2csv.lon_to_degrees(record["longitude"])
+        assert record["distance_delta"] == pytest.approx(
+            igc2csv.haversine(
+                record["londegrees"],
+                record["latdegrees"],
+                prevrecord["londegrees"],
+                prevrecord["latdegrees"],
+            ),
+            rel=1e-12,
+        )
+        assert (
+            record["time_delta"]
+            == (record["datetime"] - prevrecord["datetime"]).total_seconds()
+        )
+        assert record["climb_total"] == sum(
+            max(0, records[i]["alt_gps_delta"]) for i in range(index + 1)
+        )
+    assert flight["tas_peak"] == max(record["opt_tas"] for record in records)
+
+
+def test_parse_igc_columns_layout(igc2csv: IGC2CSV, tmp_path) -> None:
+    """
+    Test if the memory-mapped parser handles CRLF line endings, other records between the B records and a missing final line break.
+
+    Args:
+    - igc2csv: IGC2CSV object to be tested.
+    - tmp_path: Temporary directory.
+
+    Returns:
+    - None
+    """
+    reference = igc2csv.parse_igc_columns(TEST_FILE_EXTENSIONS)["columns"]
+
+    with open(TEST_FILE_EXTENSIONS, "rb") as file:
+        lines = file.read().splitlines()
+    lines = [
+        line + b"\r\nK12345600" if i % 7 == 0 and line[:1] == b"B" else line
+        for i, line in enumerate(lines)
+    ]
+    file_path = str(tmp_path / "layout.igc")
+    with open(file_path, "wb") as file:
+        file.write(b"\r\n".join(lines))
+
+    columns = igc2csv.parse_igc_columns(file_path)["columns"]
+    assert columns.keys() == reference.keys()
+    for key in reference:
+        assert np.array_equal(columns[key], reference[key])
+
+    empty_file = str(tmp_path / "empty.igc")
+    open(empty_file, "wb").close()
+    assert len(igc2csv.parse_igc_columns(empty_file)["columns"]["seconds"]) == 0
+
+
+def test_process_file_empty(igc2csv: IGC2CSV, tmp_path) -> None:
+    """
+    Test if the columnar parser returns an empty DataFrame with the output columns for a file without B records or without a date, like process_files.
+
+    Args:
+    - igc2csv: IGC2CSV object to be tested.
+    - tmp_path: Temporary directory.
+
+    Returns:
+    - None
+    """
+    empty_file = f"{flight_analyzer_directory}/tests/assets/file_processor/test.igc"
+    result = igc2csv.process_file(empty_file)
+    assert result.empty and igc2csv.process_files(empty_file, False).empty
+    assert list(result.columns) == list(igc2csv.process_file(TEST_FILE).columns)
+
+    with open(TEST_FILE_EXTENSIONS, "rb") as file:
+        lines = [line for line in file if not line.startswith(b"HFDTE")]
+    file_path = str(tmp_path / "no_date.igc")
+    with open(file_path, "wb") as file:
+        file.writelines(lines)
+
+    result = igc2csv.process_file(file_path)
+    assert result.empty
+    assert list(result.columns) == list(
+        igc2csv.process_file(TEST_FILE_EXTENSIONS).columns
+    )
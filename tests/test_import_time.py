@@ -0,0 +1,72 @@
+import os
+import sys
+import subprocess
+
+current_directory = os.path.dirname(__file__)
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+
+MODULES = [
+    "src.algorithms.speed_analyzer",
+    "src.algorithms.c_values_analyzer",
+    "src.algorithms.pressure_analyzer",
+    "src.helpers.data_visualizer",
+    "src.helpers.deviation_metrics",
+    "src.helpers.optimize_thresholds",
+    "src.helpers.file_convertor",
+]
+
+
+def test_no_heavy_imports() -> None:
+    """
+    Test that importing the analyzers and helpers neither imports scipy or matplotlib nor changes the working directory or sys.path.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - None.
+    """
+    for module in MODULES:
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import os, sys; directory, path = os.getcwd(), list(sys.path); "
+                f"import {module}; "
+                "print(sorted({name.split('.')[0] for name in sys.modules} & {'scipy', 'matplotlib'}), "
+                "os.getcwd() == directory, sys.path == path)",
+            ],
+            cwd=flight_analyzer_directory,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "[] True True", module
+
+
+def test_lazy_module() -> None:
+    """
+    Test that a LazyModule imports its module on the first attribute access and caches the attribute.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - None.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from src.helpers.lazy_module import LazyModule; "
+            "stats = LazyModule('scipy.stats'); before = 'scipy.stats' in sys.modules; "
+            "linregress = stats.linregress; "
+            "print(before, 'scipy.stats' in sys.modules, stats.linregress is linregress, "
+            "'linregress' in vars(stats))",
+        ],
+        cwd=flight_analyzer_directory,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False True True True"
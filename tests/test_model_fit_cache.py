@@ -0,0 +1,81 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+current_directory = os.path.dirname(__file__)
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+sys.path.insert(0, flight_analyzer_directory)
+
+from src.helpers.model_fit_cache import ModelFitCache
+
+
+def create_data() -> tuple:
+    """
+    Create artificial experimental and theoretical data of a speed polar, its c values and dynamic pressures.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - tuple: The experimental and the theoretical data.
+    """
+    rng = np.random.default_rng(0)
+    speed: np.ndarray = rng.uniform(8.5, 15.5, 500)
+    experimental_data = pd.DataFrame(
+        {
+            "horizontal velocity [m/s]": speed,
+            "vertical velocity [m/s]": -0.02 * (speed - 9) ** 2
+            - 1.0
+            + rng.normal(0, 0.1, 500),
+            "Ca [0.5]": 2.0 * speed**-1.2 * (1 + rng.normal(0, 0.02, 500)),
+            "airspeed [m/s]": speed,
+            "dynamic pressure [N/m^2]": 0.5 * speed**2 + rng.normal(0, 1, 500),
+        }
+    )
+    theoretical_speed: np.ndarray = np.linspace(8.2, 15.6, 12)
+    theoretical_data = pd.DataFrame(
+        {
+            "horizontal velocity [m/s]": theoretical_speed,
+            "vertical velocity [m/s]": -0.018 * (theoretical_speed - 9) ** 2 - 1.05,
+            "Ca [0.5]": 2.1 * theoretical_speed**-1.2,
+            "airspeed [m/s]": theoretical_speed,
+            "dynamic pressure [N/m^2]": 0.5 * theoretical_speed**2,
+        }
+    ).iloc[::-1]
+    return experimental_data, theoretical_data
+
+
+def test_fits() -> None:
+    """
+    Test that the fits are correct, cached by the content of the columns and the fit parameters, and evicted when the cache is full.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - None.
+    """
+    experimental_data, theoretical_data = create_data()
+    Fits = ModelFitCache(cache_size=3)
+    x, y = "horizontal velocity [m/s]", "vertical velocity [m/s]"
+
+    polynomial: np.poly1d = Fits.polynomial(experimental_data, x, y, 2)
+    np.testing.assert_allclose(
+        polynomial.coeffs, np.polyfit(experimental_data[x], experimental_data[y], 2)
+    )
+    assert Fits.polynomial(experimental_data.copy(), x, y, 2) is polynomial
+    assert Fits.polynomial(experimental_data, x, y, 3) is not polynomial
+
+    fit: np.poly1d = Fits.power_law(experimental_data, x, "Ca [0.5]")
+    assert abs(fit.coeffs[0] + 1.2) < 0.01
+    np.testing.assert_allclose(
+        Fits.power_law_values(fit, 10.0), 2.0 * 10**-1.2, rtol=0.01
+    )
+
+    spline = Fits.spline(theoretical_data, x, y)  # sorted by x
+    np.testing.assert_allclose(
+        spline(theoretical_data[x]), theoretical_data[y], rtol=1e-12
+    )
+    assert len(Fits.cache) == 3
+    assert Fits.polynomial(experimental_data, x, y, 2) is not polynomial  # evicted
@@ -16,6 +16,9 @@ import src.helpers.optimize_thresholds as optimize_thresholds
 CSV_FILE: str = (
     f"{flight_analyzer_directory}/tests/assets/data_analyzer/test_data_analyzer.csv"
 )
+BATCH_DIRECTORY: str = (
+    f"{flight_analyzer_directory}/tests/assets/optimize_thresholds/batch"
+)
 OPTIMIZATION_LIMIT: int = 20
 OPTIMIZATION_STEPS: int = 5
 OPTIMIZATION_COLUMNS: Tuple[str, str, str, str, str, str, str] = [
@@ -83,6 +86,9 @@ def test_init(optimizer: optimize_thresholds.ThresholdOptimizer) -> None:
     assert (
         optimizer.runtime_estimation == constants.OPTIMIZATION_RUNTIME_ESTIMATION
     ), "The runtime_estimation attribute is not set correctly."
+    assert optimizer.workers == 1, "The workers attribute is not set correctly."
+    assert optimizer.strategy == "grid", "The strategy attribute is not set correctly."
+    assert optimizer.budget is None, "The budget attribute is not set correctly."
 
 
 # AI content (GitHub Copilot, 02/11/2024), verified and adapted by Nicolas Huber.
@@ -250,3 +256,234 @@ def test_calculate_optimized_data_loss(
     data_loss: int = optimizer.calculate_optimized_data_loss(results)
 
     assert isinstance(data_loss, int), "The data_loss is not a float."
+
+
+def test_test_thresholds_window_statistics(
+    optimizer: optimize_thresholds.ThresholdOptimizer,
+) -> None:
+    """
+    Test that the test_thresholds method returns the same results with and without shared window statistics.
+
+    Parameters:
+    - optimizer (OptimizeThresholds): The OptimizeThresholds object.
+
+    Returns:
+    - None.
+    """
+    DataAnalyzer: dataanalyzer.DataAnalyzer = optimizer.construct_data_analyzer()
+    data = DataAnalyzer.read_csv_data()
+    WindowStatistics = optimizer.construct_window_statistics(data)
+
+    for thresholds in [(10, 15), (15, 10), (15, 15)]:
+        result = optimizer.test_thresholds(
+            thresholds, data, DataAnalyzer, WindowStatistics=WindowStatistics
+        )
+        expected = optimizer.test_thresholds(thresholds, data, DataAnalyzer)
+        assert result == expected, "The results are not identical."
+
+
+def test_optimize_thresholds_parallel(
+    optimizer: optimize_thresholds.ThresholdOptimizer,
+) -> None:
+    """
+    Test that the parallel optimization returns the same results as the serial optimization.
+
+    Parameters:
+    - optimizer (OptimizeThresholds): The OptimizeThresholds object.
+
+    Returns:
+    - None.
+    """
+    DataAnalyzer: dataanalyzer.DataAnalyzer = optimizer.construct_data_analyzer()
+    data = DataAnalyzer.read_csv_data()
+    results: pd.DataFrame = optimizer.optimize_thresholds(data, DataAnalyzer)
+
+    optimizer.workers = 2
+    results_parallel: pd.DataFrame = optimizer.optimize_thresholds(data, DataAnalyzer)
+
+    assert len(results_parallel) == len(results), "The number of results differs."
+    assert results_parallel[
+        "score"
+    ].is_monotonic_decreasing, "The results are not sorted by score."
+    pd.testing.assert_frame_equal(
+        results_parallel.sort_values(
+            by=["angle_past_threshold", "angle_future_threshold"]
+        ).reset_index(drop=True),
+        results.sort_values(
+            by=["angle_past_threshold", "angle_future_threshold"]
+        ).reset_index(drop=True),
+    )
+
+
+@pytest.mark.parametrize(
+    "strategy", ["coarse_to_fine", "successive_halving", "surrogate"]
+)
+def test_optimize_thresholds_strategy(
+    optimizer: optimize_thresholds.ThresholdOptimizer, strategy: str
+) -> None:
+    """
+    Test that the search strategies return a subset of the results of the grid.
+
+    Parameters:
+    - optimizer (OptimizeThresholds): The OptimizeThresholds object.
+    - strategy (str): The search strategy.
+
+    Returns:
+    - None.
+    """
+    DataAnalyzer: dataanalyzer.DataAnalyzer = optimizer.construct_data_analyzer()
+    data = DataAnalyzer.read_csv_data()
+    results_grid: pd.DataFrame = optimizer.optimize_thresholds(data, DataAnalyzer)
+
+    optimizer.strategy = strategy
+    optimizer.budget = 3
+    results: pd.DataFrame = optimizer.optimize_thresholds(data, DataAnalyzer)
+
+    assert 0 < len(results) <= 3, "The budget is exceeded."
+    assert list(results.columns) == OPTIMIZATION_COLUMNS, "The columns are not correct."
+    merged = results.merge(
+        results_grid,
+        on=["angle_past_threshold", "angle_future_threshold"],
+        suffixes=("", "_grid"),
+    )
+    assert len(merged) == len(results), "The thresholds are not part of the grid."
+    assert (
+        merged["score"] == merged["score_grid"]
+    ).all(), "The scores differ from the grid."
+
+
+def test_construct_search_strategy_unknown(
+    optimizer: optimize_thresholds.ThresholdOptimizer,
+) -> None:
+    """
+    Test that an unknown search strategy raises a ValueError.
+
+    Parameters:
+    - optimizer (OptimizeThresholds): The OptimizeThresholds object.
+
+    Returns:
+    - None.
+    """
+    optimizer.strategy = "unknown"
+    with pytest.raises(ValueError):
+        optimizer.construct_search_strategy()
+
+
+def test_optimize_thresholds_batch(
+    optimizer: optimize_thresholds.ThresholdOptimizer,
+) -> None:
+    """
+    Test that the batch optimization aggregates the results of all flights weighted by their number of points.
+
+    Parameters:
+    - optimizer (OptimizeThresholds): The OptimizeThresholds object.
+
+    Returns:
+    - None.
+    """
+    results: pd.DataFrame = optimizer.optimize_thresholds_batch(BATCH_DIRECTORY)
+
+    assert list(results.columns) == OPTIMIZATION_COLUMNS, "The columns are not correct."
+    assert len(results) == 4, "The number of results is not correct."
+    assert results["score"].is_monotonic_decreasing, "The results are not sorted."
+    assert len(optimizer.flights) == 2, "The flights are not cached."
+
+    flights = list(optimizer.flights.values())
+    flight_results = [
+        pd.DataFrame(
+            optimizer.test_flight([(10, 15)], data), columns=OPTIMIZATION_COLUMNS
+        ).iloc[0]
+        for data in flights
+    ]
+    weights = [len(data) for data in flights]
+    row = results[
+        (results["angle_past_threshold"] == 10)
+        & (results["angle_future_threshold"] == 15)
+    ].iloc[0]
+    for column in OPTIMIZATION_COLUMNS[2:]:
+        expected = sum(
+            result[column] * weight for result, weight in zip(flight_results, weights)
+        ) / sum(weights)
+        assert row[column] == pytest.approx(expected), f"The {column} is not correct."
+
+    optimizer.workers = 2
+    results_parallel: pd.DataFrame = optimizer.optimize_thresholds_batch(
+        BATCH_DIRECTORY
+    )
+    pd.testing.assert_frame_equal(results_parallel, results)
+
+
+@pytest.mark.parametrize(
+    "strategy", ["coarse_to_fine", "successive_halving", "surrogate"]
+)
+def test_optimize_thresholds_batch_strategy(
+    optimizer: optimize_thresholds.ThresholdOptimizer, strategy: str
+) -> None:
+    """
+    Test that the search strategies of the batch optimization return a subset of the results of the grid, aggregated over all flights.
+
+    Parameters:
+    - optimizer (OptimizeThresholds): The OptimizeThresholds object.
+    - strategy (str): The search strategy.
+
+    Returns:
+    - None.
+    """
+    results_grid: pd.DataFrame = optimizer.optimize_thresholds_batch(BATCH_DIRECTORY)
+
+    optimizer.strategy = strategy
+    optimizer.budget = 3
+    results: pd.DataFrame = optimizer.optimize_thresholds_batch(BATCH_DIRECTORY)
+
+    assert 0 < len(results) <= 3, "The budget is exceeded."
+    assert list(results.columns) == OPTIMIZATION_COLUMNS, "The columns are not correct."
+    merged = results.merge(
+        results_grid,
+        on=["angle_past_threshold", "angle_future_threshold"],
+        suffixes=("", "_grid"),
+    )
+    assert len(merged) == len(results), "The thresholds are not part of the grid."
+    assert merged["score"].to_numpy() == pytest.approx(
+        merged["score_grid"].to_numpy()
+    ), "The scores differ from the grid."
+
+
+def test_sample_blocks(optimizer: optimize_thresholds.ThresholdOptimizer) -> None:
+    """
+    Test that a fraction of a tracklog is sampled as evenly spaced blocks that cover the whole flight and a fraction of the flights is sampled evenly.
+
+    Parameters:
+    - optimizer (OptimizeThresholds): The OptimizeThresholds object.
+
+    Returns:
+    - None.
+    """
+    data = pd.DataFrame({"index": range(1000)})
+    blocks = optimizer.sample_blocks(data, 0.125)
+
+    assert len(blocks) == constants.OPTIMIZATION_BLOCKS
+    assert sum(len(block) for block in blocks) <= 125
+    assert blocks[0]["index"].iloc[0] == 0 and blocks[-1]["index"].iloc[-1] == 999
+    assert all(
+        (block["index"].diff().dropna() == 1).all() for block in blocks
+    ), "The blocks are not contiguous."
+    assert optimizer.sample_blocks(data, 1.0)[0] is data
+
+    flights = [data.iloc[:n] for n in range(1, 9)]
+    sampled = optimizer.sample_flights(flights, 0.25)
+    assert [len(flight) for flight in sampled] == [1, 8]
+    assert optimizer.sample_flights(flights, 1.0) is flights
+
+
+def test_read_flight(optimizer: optimize_thresholds.ThresholdOptimizer) -> None:
+    """
+    Test that the read_flight method parses every file only once.
+
+    Parameters:
+    - optimizer (OptimizeThresholds): The OptimizeThresholds object.
+
+    Returns:
+    - None.
+    """
+    data: pd.DataFrame = optimizer.read_flight(CSV_FILE)
+    assert optimizer.read_flight(CSV_FILE) is data, "The flight is parsed twice."
@@ -92,4 +92,73 @@ def test_calculate_cW_approximation(analyzer):
     assert analyzer.calculate_cW_approximation(20) == 15.5624 * (20 ** (-2.5126))
     assert analyzer.calculate_cW_approximation(30) == 15.5624 * (30 ** (-2.5126))
     assert analyzer.calculate_cW_approximation(40) == 15.5624 * (40 ** (-2.5126))
-    assert analyzer.calculate_cW_approximation(50) == 15.5624 * (50 ** (-2.5126))
\ No newline at end of file
+    assert analyzer.calculate_cW_approximation(50) == 15.5624 * (50 ** (-2.5126))
+
+
+def test_analyze_quality(analyzer):
+    """
+    Tests the analyze_quality method of the QualityAnalyzer class against the resulting force of single data points.
+    
+    Args:
+    - analyzer (QualityAnalyzer): The QualityAnalyzer object to test.
+    
+    Returns:
+    - None
+    """
+    data = pd.DataFrame({'airspeed [m/s]': np.linspace(8, 16, 81)})
+    expected_force = (constants.MASS + constants.MASS_TRESHOLD) * constants.GRAVITY
+
+    mean_deviation, deviation_percentage, data_analyzed = analyzer.analyze_quality(data=data.copy(), model=True)
+    resulting_force = [
+        analyzer.p_analyzer.calculate_force_resultant(
+            airspeed=airspeed,
+            Ca=analyzer.calculate_cA_approximation(airspeed),
+            Cw=analyzer.calculate_cW_approximation(airspeed),
+        )
+        for airspeed in data['airspeed [m/s]']
+    ]
+    assert np.allclose(data_analyzed['resulting force [N]'], resulting_force, rtol=1e-12)
+    assert mean_deviation == pytest.approx(expected_force - np.mean(resulting_force))
+    assert deviation_percentage == pytest.approx(np.mean(resulting_force) / expected_force * 100 - 100)
+
+
+def test_analyze_models(analyzer):
+    """
+    Tests the analyze_models method of the QualityAnalyzer class, the statistics of both models equal the ones of analyze_quality.
+    
+    Args:
+    - analyzer (QualityAnalyzer): The QualityAnalyzer object to test.
+    
+    Returns:
+    - None
+    """
+    data = pd.DataFrame({'airspeed [m/s]': np.linspace(8, 16, 81)})
+    statistics = analyzer.analyze_models(data=data)
+
+    assert list(statistics.index) == ['original', 'new']
+    assert list(data.columns) == ['airspeed [m/s]']
+    for model, new_model in [('original', False), ('new', True)]:
+        mean_deviation, deviation_percentage, _ = analyzer.analyze_quality(data=data.copy(), model=new_model)
+        assert statistics.loc[model, 'mean deviation [N]'] == pytest.approx(mean_deviation)
+        assert statistics.loc[model, 'mean deviation percentage [%]'] == pytest.approx(deviation_percentage)
+
+
+def test_analyze_models_nan(analyzer):
+    """
+    Tests that analyze_models skips missing airspeed data points like the pandas mean of analyze_quality.
+    
+    Args:
+    - analyzer (QualityAnalyzer): The QualityAnalyzer object to test.
+    
+    Returns:
+    - None
+    """
+    data = pd.DataFrame({'airspeed [m/s]': np.linspace(8, 16, 81)})
+    data.loc[[0, 40], 'airspeed [m/s]'] = np.nan
+    statistics = analyzer.analyze_models(data=data)
+
+    for model, new_model in [('original', False), ('new', True)]:
+        mean_deviation, deviation_percentage, _ = analyzer.analyze_quality(data=data.copy(), model=new_model)
+        assert not np.isnan(mean_deviation)
+        assert statistics.loc[model, 'mean deviation [N]'] == pytest.approx(mean_deviation)
+        assert statistics.loc[model, 'mean deviation percentage [%]'] == pytest.approx(deviation_percentage)
@@ -0,0 +1,73 @@
+import os
+import sys
+import pytest
+import numpy as np
+import pandas as pd
+
+current_directory = os.path.dirname(__file__)
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+sys.path.insert(0, flight_analyzer_directory)
+
+from src.helpers.shared_dataframe import SharedDataFrame
+
+CSV_FILE: str = (
+    f"{flight_analyzer_directory}/tests/assets/data_analyzer/test_data_analyzer.csv"
+)
+
+
+@pytest.fixture()
+def data() -> pd.DataFrame:
+    """
+    Read the dataset to be shared.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - pd.DataFrame: The dataset.
+    """
+    return pd.read_csv(CSV_FILE)
+
+
+def test_attach(data: pd.DataFrame) -> None:
+    """
+    Test that an attached DataFrame equals the shared DataFrame.
+
+    Parameters:
+    - data (pd.DataFrame): The dataset.
+
+    Returns:
+    - None.
+    """
+    data = data.iloc[10:]
+    with SharedDataFrame(data) as shared:
+        memory, data_attached = SharedDataFrame.attach(shared.description)
+        pd.testing.assert_frame_equal(data_attached, data, check_index_type=False)
+        assert isinstance(
+            data_attached["timestamp [UTC]"].iloc[0], str
+        ), "The timestamps are not restored as strings."
+        del data_attached
+        memory.close()
+
+
+def test_attach_missing_values(data: pd.DataFrame) -> None:
+    """
+    Test that missing values of object columns are restored as NaN instead of the strings "nan" or "None".
+
+    Parameters:
+    - data (pd.DataFrame): The dataset.
+
+    Returns:
+    - None.
+    """
+    data = data.copy()
+    data.loc[[0, 5], "timestamp [UTC]"] = [np.nan, None]
+    with SharedDataFrame(data) as shared:
+        memory, data_attached = SharedDataFrame.attach(shared.description)
+        assert (
+            data_attached["timestamp [UTC]"].isna().tolist()
+            == data["timestamp [UTC]"].isna().tolist()
+        ), "The missing values are not restored."
+        pd.testing.assert_frame_equal(data_attached, data, check_index_type=False)
+        del data_attached
+        memory.close()
@@ -15,6 +15,7 @@ import src.algorithms.speed_analyzer as speed_analyzer
 CSV_INPUT: str = (
     f"{flight_analyzer_directory}/tests/assets/speed_analyzer/test_speed_analyzer.csv"
 )
+IGC_INPUT: str = f"{flight_analyzer_directory}/tests/assets/igc2csv/test_igc2csv.igc"
 
 
 @pytest.fixture
@@ -117,3 +118,79 @@ def test_group_data(analyzer, dataset) -> None:
 
     assert (data_grouped["horizontal velocity [m/s]"] * 10 % 1 == 0).all()
     assert data_grouped["horizontal velocity [m/s]"].nunique() == len(data_grouped)
+
+
+def test_process_raw_data(analyzer, tmp_path) -> None:
+    """
+    Test process_raw_data method, the files are processed in memory without writing any file.
+
+    Args:
+    - analyzer (speed_analyzer.SpeedAnalyzer): SpeedAnalyzer instance.
+    - tmp_path (pathlib.Path): Temporary directory.
+
+    Returns:
+    - None
+    """
+    file_path: str = str(tmp_path / "flight.igc")
+    with open(IGC_INPUT, "rb") as source, open(file_path, "wb") as target:
+        target.write(source.read())
+
+    data: pd.DataFrame = analyzer.process_raw_data(file_paths=[file_path])
+
+    assert os.listdir(tmp_path) == ["flight.igc"]
+    assert len(data) > 0
+    assert data.index.equals(pd.RangeIndex(len(data)))
+    assert {"status", "position_str", "position_int"}.issubset(data.columns)
+
+
+def test_process_raw_data_parallel(analyzer, tmp_path) -> None:
+    """
+    Test process_raw_data method with worker processes, the results are in natural sort order and a broken file is skipped.
+
+    Args:
+    - analyzer (speed_analyzer.SpeedAnalyzer): SpeedAnalyzer instance.
+    - tmp_path (pathlib.Path): Temporary directory.
+
+    Returns:
+    - None
+    """
+    file_paths: List[str] = [str(tmp_path / f"flight-{i}.igc") for i in [10, 2]]
+    for file_path in file_paths:
+        with open(IGC_INPUT, "rb") as source, open(file_path, "wb") as target:
+            target.write(source.read())
+    broken_file: str = str(tmp_path / "flight-1.igc")
+    with open(broken_file, "w") as target:
+        target.write("B garbage\n")
+
+    data: pd.DataFrame = analyzer.process_raw_data(file_paths=file_paths)
+    parallel_analyzer = speed_analyzer.SpeedAnalyzer(workers=2)
+    data_parallel: pd.DataFrame = parallel_analyzer.process_raw_data(
+        file_paths=file_paths + [broken_file]
+    )
+
+    pd.testing.assert_frame_equal(data_parallel, data)
+    assert list(parallel_analyzer.failed_files) == [broken_file]
+    assert analyzer.failed_files == {}
+
+
+def test_convert_file(analyzer) -> None:
+    """
+    Test convert_file method, the columnar parser returns the same trackpoints as the record-based IGC2CSV.process_files and a file without trackpoints is rejected.
+
+    Args:
+    - analyzer (speed_analyzer.SpeedAnalyzer): SpeedAnalyzer instance.
+
+    Returns:
+    - None
+    """
+    data: pd.DataFrame = analyzer.convert_file(IGC_INPUT)
+    reference: pd.DataFrame = analyzer.convertor.export_to_flight_analyzer_format(
+        analyzer.convertor.process_files(IGC_INPUT, False)
+    ).reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(data, reference, check_exact=False, rtol=1e-12)
+
+    with pytest.raises(ValueError):
+        analyzer.convert_file(
+            f"{flight_analyzer_directory}/tests/assets/file_processor/test.igc"
+        )
@@ -0,0 +1,101 @@
+import os
+import sys
+import pytest
+from typing import List, Tuple
+
+current_directory = os.path.dirname(__file__)
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+sys.path.insert(0, flight_analyzer_directory)
+
+import src.helpers.threshold_search as thresholdsearch
+
+THRESHOLDS: List[int] = list(range(10, 300))
+BEST_THRESHOLDS: Tuple[int, int] = (95, 90)
+BUDGET: int = 200
+
+
+def evaluate(
+    thresholds: Tuple[int, int], fraction: float
+) -> Tuple[int, int, float, float, float, float, float]:
+    """
+    Synthetic objective with a single peak at BEST_THRESHOLDS, the score is less precise on fractions of the data.
+
+    Parameters:
+    - thresholds (Tuple[int, int]): The thresholds to be tested.
+    - fraction (float): The fraction of the data.
+
+    Returns:
+    - Tuple[int, int, float, float, float, float, float]: The result of the test.
+    """
+    score: float = -(
+        (thresholds[0] - BEST_THRESHOLDS[0]) ** 2
+        + (thresholds[1] - BEST_THRESHOLDS[1]) ** 2
+    ) / 10000 + (1 - fraction) * 0.01 * ((thresholds[0] * 7 + thresholds[1]) % 3)
+    return thresholds[0], thresholds[1], 0.0, 0.0, 0.0, score, 0.0
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        thresholdsearch.CoarseToFineSearch,
+        thresholdsearch.SuccessiveHalvingSearch,
+        thresholdsearch.SurrogateSearch,
+    ],
+)
+def test_search(strategy: type) -> None:
+    """
+    Test that the search strategies stay within the budget and find thresholds close to the optimum.
+
+    Parameters:
+    - strategy (type): The search strategy class.
+
+    Returns:
+    - None.
+    """
+    search: thresholdsearch.ThresholdSearch = strategy(
+        thresholds=THRESHOLDS, budget=BUDGET
+    )
+    results = search.search(evaluate)
+
+    assert 0 < len(results) <= BUDGET, "The number of results is not correct."
+    assert search.evaluations <= BUDGET, "The budget is exceeded."
+    best = max(results, key=lambda result: result[5])
+    assert (
+        abs(best[0] - BEST_THRESHOLDS[0]) <= 20
+        and abs(best[1] - BEST_THRESHOLDS[1]) <= 20
+    ), "The thresholds found are not close to the optimum."
+
+
+def test_coarse_to_fine_search_exact() -> None:
+    """
+    Test that the coarse-to-fine search finds the optimum of a single-peaked objective.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - None.
+    """
+    search = thresholdsearch.CoarseToFineSearch(thresholds=THRESHOLDS, budget=BUDGET)
+    best = max(search.search(evaluate), key=lambda result: result[5])
+    assert best[:2] == BEST_THRESHOLDS, "The optimum is not found."
+
+
+def test_abstract_search() -> None:
+    """
+    Test that a strategy without a search method cannot be created.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - None.
+    """
+
+    class IncompleteSearch(thresholdsearch.ThresholdSearch):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteSearch(thresholds=THRESHOLDS, budget=BUDGET)
+    with pytest.raises(TypeError):
+        thresholdsearch.ThresholdSearch(thresholds=THRESHOLDS, budget=BUDGET)
@@ -0,0 +1,112 @@
+import os
+import sys
+import pytest
+import numpy as np
+import pandas as pd
+
+current_directory = os.path.dirname(__file__)
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+sys.path.insert(0, flight_analyzer_directory)
+
+from src.helpers.track_decimator import TrackDecimator
+
+
+@pytest.fixture()
+def track() -> pd.DataFrame:
+    """
+    Create an artificial tracklog of circles and straight lines.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - pd.DataFrame: The tracklog.
+    """
+    t: np.ndarray = np.linspace(0, 60, 20000)
+    return pd.DataFrame(
+        {
+            "longitude": 9 + 0.01 * np.cos(t) + 0.001 * t,
+            "latitude": 47 + 0.01 * np.sin(t),
+            "position_int": (np.sin(t / 3) > 0).astype(int),
+        },
+        index=np.arange(20000) + 100,
+    )
+
+
+def test_lttb() -> None:
+    """
+    Test that the LTTB keeps the first and last point and the extremes of a line.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - None.
+    """
+    decimator = TrackDecimator()
+    x: np.ndarray = np.arange(1001, dtype=np.float64)
+    y: np.ndarray = np.zeros(1001)
+    y[500] = 10.0
+
+    positions: np.ndarray = decimator.lttb(x, y, 20)
+    assert len(positions) == 20 and positions[0] == 0 and positions[-1] == 1000
+    assert 500 in positions
+    assert np.all(np.diff(positions) > 0)
+    np.testing.assert_array_equal(decimator.lttb(x, y, 2000), np.arange(1001))
+
+
+def test_decimate(track: pd.DataFrame) -> None:
+    """
+    Test that a decimated track keeps the category boundaries, the original index and is cached.
+
+    Parameters:
+    - track (pd.DataFrame): The tracklog.
+
+    Returns:
+    - None.
+    """
+    decimator = TrackDecimator(max_points=1000)
+    points: pd.DataFrame = decimator.decimate(
+        track, x="longitude", y="latitude", category="position_int"
+    )
+
+    assert len(points) <= 1000
+    category: np.ndarray = track["position_int"].to_numpy()
+    boundaries: np.ndarray = np.flatnonzero(category[1:] != category[:-1])
+    assert set(track.index[boundaries]) <= set(points.index)
+    assert set(track.index[boundaries + 1]) <= set(points.index)
+    pd.testing.assert_frame_equal(points, track.loc[points.index])
+
+    assert len(decimator.cache) == 1
+    decimator.decimate(track, x="longitude", y="latitude", category="position_int")
+    assert len(decimator.cache) == 1
+    decimator.decimate(track.iloc[::-1], x="longitude", y="latitude")
+    assert len(decimator.cache) == 2
+
+    assert TrackDecimator(max_points=None).decimate(track, None, "latitude") is track
+
+
+def test_select_points_budget() -> None:
+    """
+    Test that many short runs share the budget of points and never exceed it.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - None.
+    """
+    rng = np.random.default_rng(0)
+    x: np.ndarray = np.arange(20000, dtype=np.float64)
+    y: np.ndarray = rng.normal(size=20000)
+    decimator = TrackDecimator(max_points=5000)
+
+    category: np.ndarray = (np.arange(20000) // 3) % 2  # alternating runs of 3 points
+    assert len(decimator.select_points(x, y, category)) == 5000
+
+    category = (np.arange(20000) // 50) % 2  # 400 runs, their boundaries fit the budget
+    selected: np.ndarray = decimator.select_points(x, y, category)
+    assert len(selected) <= 5000
+    boundaries: np.ndarray = np.flatnonzero(category[1:] != category[:-1])
+    assert set(boundaries) <= set(selected) and set(boundaries + 1) <= set(selected)
+    assert np.all(np.diff(selected) > 0)
@@ -0,0 +1,95 @@
+import os
+import sys
+import pytest
+import numpy as np
+import pandas as pd
+
+current_directory = os.path.dirname(__file__)
+flight_analyzer_directory = os.path.abspath(os.path.join(current_directory, ".."))
+sys.path.insert(0, flight_analyzer_directory)
+
+import src.constants as constants
+import src.helpers.data_analyzer as dataanalyzer
+from src.algorithms.angle_analyzer import AngleAnalyzer
+from src.helpers.window_statistics import WindowStatistics
+
+CSV_FILE: str = (
+    f"{flight_analyzer_directory}/tests/assets/data_analyzer/test_data_analyzer.csv"
+)
+
+
+@pytest.fixture()
+def analyzer() -> AngleAnalyzer:
+    """
+    Create an AngleAnalyzer object in rolling regression mode.
+
+    Parameters:
+    - None.
+
+    Returns:
+    - AngleAnalyzer: The AngleAnalyzer object.
+    """
+    return AngleAnalyzer(
+        csv_file=CSV_FILE,
+        latest_threshold=constants.ANGLE_PAST_THRESHOLD,
+        future_threshold=constants.ANGLE_FUTURE_THRESHOLD,
+        angle_threshold=constants.ANGLE_THRESHOLD,
+        linear_regression_threshold=constants.LINEAR_REGRESSION_THRESHOLD,
+        rolling_regression=True,
+    )
+
+
+def test_analyze_window(analyzer: AngleAnalyzer) -> None:
+    """
+    Test that the analyze_window method returns the window analyses of the AngleAnalyzer and caches them per window length.
+
+    Parameters:
+    - analyzer (AngleAnalyzer): The AngleAnalyzer object.
+
+    Returns:
+    - None.
+    """
+    data: pd.DataFrame = pd.read_csv(CSV_FILE)
+    statistics: WindowStatistics = WindowStatistics(data, analyzer)
+    longitude = data["longitude"].to_numpy()
+    latitude = data["latitude"].to_numpy()
+
+    for window in [20, 40]:
+        status_angle, regression = statistics.analyze_window(window)
+        np.testing.assert_array_equal(
+            status_angle,
+            analyzer.analyze_window_angles(longitude, latitude, window),
+        )
+        expected = analyzer.analyze_rolling_linear_regressions(
+            longitude, latitude, window
+        )
+        for values, expected_values in zip(regression, expected):
+            np.testing.assert_array_equal(values, expected_values)
+
+    assert sorted(statistics.windows) == [20, 40], "The windows are not cached."
+    assert (
+        statistics.analyze_window(20) is statistics.windows[20]
+    ), "The cached window analysis is not reused."
+
+
+def test_process_data_shared(analyzer: AngleAnalyzer) -> None:
+    """
+    Test that DataAnalyzer.process_data returns the same data with and without shared window statistics.
+
+    Parameters:
+    - analyzer (AngleAnalyzer): The AngleAnalyzer object.
+
+    Returns:
+    - None.
+    """
+    data_analyzer = dataanalyzer.DataAnalyzer(csv_file_in=CSV_FILE)
+    data: pd.DataFrame = data_analyzer.read_csv_data()
+    statistics: WindowStatistics = WindowStatistics(data, analyzer)
+
+    for thresholds in [(20, 40), (40, 20), (20, 20)]:
+        pd.testing.assert_frame_equal(
+            data_analyzer.process_data(
+                data, analyzer, *thresholds, WindowStatistics=statistics
+            ),
+            data_analyzer.process_data(data, analyzer, *thresholds),
+        )